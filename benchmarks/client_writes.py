@@ -0,0 +1,53 @@
+"""
+Benchmark concurrent writers against one clients database.
+
+Usage: python benchmarks/client_writes.py [--writers 8] [--ops 200]
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from sbp_generator.client_manager import ClientManager
+
+
+def _writer(clients_file: Path, worker: int, ops: int, batch_size: int) -> None:
+    manager = ClientManager(clients_file)
+    for start in range(0, ops, batch_size):
+        with manager.batch():
+            for i in range(start, min(start + batch_size, ops)):
+                manager.add_project_to_client(f"Client {i % 20}", f"w{worker}-p{i}")
+
+
+def run(writers: int, ops: int, batch_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        clients_file = Path(tmp) / "clients.json"
+        seed = ClientManager(clients_file)
+        with seed.batch():
+            for i in range(20):
+                seed.add_client(f"Client {i}")
+
+        processes = [multiprocessing.Process(target=_writer, args=(clients_file, w, ops, batch_size))
+                     for w in range(writers)]
+        started = time.perf_counter()
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        elapsed = time.perf_counter() - started
+
+        stored = sum(len(c.projects) for c in ClientManager(clients_file).clients.values())
+        total = writers * ops
+        print(f"writers={writers} ops={total} batch={batch_size} "
+              f"elapsed={elapsed:.2f}s rate={total / elapsed:.0f} ops/s lost={total - stored}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200)
+    args = parser.parse_args()
+    for batch_size in (1, 25):
+        run(args.writers, args.ops, batch_size)
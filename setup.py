@@ -30,9 +30,12 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "s3": ["boto3>=1.26.0"],
+    },
     entry_points={
         "console_scripts": [
-            "sbp-gen=sbp_generator.cli:main",
+            "sbp-gen=sbp_generator.completion:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,328 @@
+"""
+Cold-storage archiving for the SBP Folder Generator CLI.
+
+Moves old projects to an archive volume under the same PHOTO/VIDEO layout.
+Files are copied by a bounded pool of workers, hashed on the way out and
+read back from the destination to verify, and a project's source folder is
+only removed once every file in it has been verified. Progress is kept in a
+journal on the destination so an interrupted run picks up where it stopped.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .config import config_manager
+from .fsutil import raise_errors, walk_tree
+from .generators import project_generator
+from .scanner import iter_project_folders, type_roots
+
+
+DEFAULT_COPY_WORKERS = 8
+
+# Large enough that each read/write releases the GIL for a useful amount of work
+CHUNK_SIZE = 4 * 1024 * 1024
+
+JOURNAL_NAME = ".sbp-archive-journal.jsonl"
+
+AGE_PATTERN = re.compile(r"^(\d+)\s*([dwmy])$")
+AGE_UNITS = {"d": 1, "w": 7, "m": 30, "y": 365}
+
+
+def parse_age(text: str) -> timedelta:
+    """Parse an age such as 180d, 12w, 6m or 2y."""
+    match = AGE_PATTERN.match(text.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid age '{text}' (use e.g. 180d, 12w, 6m or 2y)")
+    return timedelta(days=int(match.group(1)) * AGE_UNITS[match.group(2)])
+
+
+def project_date(client_name: Optional[str], year: Optional[str], project_path: Path) -> Optional[datetime]:
+    """Get a project's date from its folder name, or the end of its year for personal work."""
+    if client_name is not None:
+        return project_generator.parse_project_folder_name(project_path.name)[0]
+    if year and year.isdigit():
+        return datetime(int(year), 12, 31)
+    return None
+
+
+def select_projects(base_path: Optional[Path], older_than: timedelta, client: Optional[str] = None,
+                    now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Find projects dated before the cutoff, oldest first."""
+    cutoff = (now or datetime.now()) - older_than
+    projects = []
+    for project_type, client_name, year, project_path in iter_project_folders(base_path):
+        if client and client_name != client:
+            continue
+        date = project_date(client_name, year, project_path)
+        if date is not None and date < cutoff:
+            projects.append({"type": project_type, "client": client_name, "date": date, "path": project_path})
+    return sorted(projects, key=lambda p: (p["date"], str(p["path"])))
+
+
+def walk_project(project_path: Path) -> Tuple[List[str], Dict[str, Tuple[int, int]], Dict[str, str]]:
+    """List a project's folders, its files with (size, mtime_ns) and its symlinks with their targets.
+    
+    Paths are relative to the project. Symlinks are kept apart so they are
+    recreated as links rather than copied through.
+    """
+    folders: List[str] = []
+    files: Dict[str, Tuple[int, int]] = {}
+    links: Dict[str, str] = {}
+    for entry, name in walk_tree(project_path, on_error=raise_errors):
+        if entry.is_symlink():
+            links[name] = os.readlink(entry.path)
+        elif entry.is_dir(follow_symlinks=False):
+            folders.append(name)
+        else:
+            stat = entry.stat(follow_symlinks=False)
+            files[name] = (stat.st_size, stat.st_mtime_ns)
+    return sorted(folders), files, links
+
+
+class ArchiveJournal:
+    """An append-only record of verified files and finished projects."""
+    
+    def __init__(self, journal_file: Path):
+        self.journal_file = journal_file
+        self.verified: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._load()
+        self._handle = None
+    
+    def _load(self) -> None:
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # A line cut short by an interruption
+                    if record.get("event") == "file":
+                        self.verified[(record["project"], record["path"])] = record
+        except OSError:
+            pass
+    
+    def is_verified(self, project: str, path: str, size: int, mtime_ns: int) -> bool:
+        record = self.verified.get((project, path))
+        return record is not None and record["size"] == size and record["mtime_ns"] == mtime_ns
+    
+    def record_file(self, project: str, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        record = {"event": "file", "project": project, "path": path, "size": size,
+                  "mtime_ns": mtime_ns, "hash": digest}
+        self.verified[(project, path)] = record
+        self._append(record, sync=False)
+    
+    def record_project(self, project: str) -> None:
+        self._append({"event": "project", "project": project, "at": datetime.now().isoformat()}, sync=True)
+    
+    def _append(self, record: Dict[str, Any], sync: bool) -> None:
+        if self._handle is None:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.journal_file, 'a', encoding='utf-8')
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+        if sync:
+            os.fsync(self._handle.fileno())
+    
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class ArchiveMover:
+    """Moves project folders to an archive volume with verified, resumable copies."""
+    
+    def __init__(self, destination: Path, base_path: Optional[Path] = None,
+                 workers: int = DEFAULT_COPY_WORKERS, remove_source: bool = True):
+        # Without an explicit base path each type folder is on its own volume
+        self.base_path = Path(os.path.abspath(str(base_path))) if base_path else None
+        self.type_roots = type_roots(self.base_path)
+        self.destination = Path(os.path.abspath(str(destination)))
+        self.workers = workers
+        self.remove_source = remove_source
+        
+        for _, type_root in self.type_roots:
+            if self.destination == type_root or type_root in self.destination.parents:
+                raise ValueError(f"Archive destination is inside the archive being moved: {self.destination}")
+        
+        self.journal = ArchiveJournal(self.destination / JOURNAL_NAME)
+    
+    def archive_path(self, project_path: Path) -> str:
+        """Get a project's path in the archive: its PHOTO/VIDEO folder, then its path within it."""
+        project_path = Path(os.path.abspath(str(project_path)))
+        config = config_manager.config
+        for project_type, type_root in self.type_roots:
+            if type_root in project_path.parents:
+                return (Path(config.base_directories[project_type]) / project_path.relative_to(type_root)).as_posix()
+        raise ValueError(f"Not a project in this archive: {project_path}")
+    
+    def move_projects(self, projects: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Move each project in turn, yielding a result as each one finishes."""
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for project in projects:
+                    yield self.move_project(project["path"], pool)
+        finally:
+            self.journal.close()
+    
+    def move_project(self, project_path: Path, pool: ThreadPoolExecutor) -> Dict[str, Any]:
+        """Copy and verify one project, then remove its source folder."""
+        relative = self.archive_path(project_path)
+        target = self.destination / relative
+        started = time.monotonic()
+        result = {"project": relative, "success": False, "files": 0, "bytes": 0, "copied_bytes": 0,
+                  "destination": target}
+        
+        try:
+            folders, files, links = walk_project(project_path)
+        except OSError as e:
+            result["message"] = f"Could not read project: {e}"
+            return result
+        
+        result["files"] = len(files)
+        result["bytes"] = sum(size for size, _ in files.values())
+        
+        try:
+            target.mkdir(parents=True, exist_ok=True)
+            for folder in folders:
+                (target / folder).mkdir(exist_ok=True)
+            for name, link_target in links.items():
+                _copy_link(link_target, target / name)
+        except OSError as e:
+            result["message"] = f"Could not create the archive copy: {e}"
+            return result
+        
+        pending = {}
+        for name, (size, mtime_ns) in files.items():
+            if self.journal.is_verified(relative, name, size, mtime_ns) and _size_of(target / name) == size:
+                continue
+            future = pool.submit(copy_verified, project_path / name, target / name, size, mtime_ns)
+            pending[future] = (name, size, mtime_ns)
+        
+        errors = []
+        for future in as_completed(pending):
+            name, size, mtime_ns = pending[future]
+            try:
+                digest = future.result()
+            except OSError as e:
+                errors.append(f"{name}: {e}")
+                continue
+            self.journal.record_file(relative, name, size, mtime_ns, digest)
+            result["copied_bytes"] += size
+        
+        result["seconds"] = time.monotonic() - started
+        if errors:
+            result["message"] = f"{len(errors)} files failed, source kept: {errors[0]}"
+            result["errors"] = errors
+            return result
+        
+        if self.remove_source:
+            # Anything added or changed while copying means the copy is already stale
+            try:
+                _, current, current_links = walk_project(project_path)
+            except OSError as e:
+                result["message"] = f"Could not re-check project, source kept: {e}"
+                return result
+            if (current, current_links) != (files, links):
+                result["message"] = "Project changed while it was being copied, source kept (run again)"
+                return result
+            try:
+                shutil.rmtree(project_path)
+            except OSError as e:
+                result["message"] = f"Copied and verified, but could not remove the source: {e}"
+                return result
+        
+        self.journal.record_project(relative)
+        result["success"] = True
+        result["message"] = f"Archived {relative}"
+        return result
+
+
+def _copy_link(link_target: str, path: Path) -> None:
+    """Recreate a symlink with the same target, leaving one that already matches."""
+    try:
+        if os.readlink(path) == link_target:
+            return
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    os.symlink(link_target, path)
+
+
+def _size_of(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
+def _drop_cache(fd: int) -> None:
+    """Ask the kernel to forget a file's cached pages so the next read comes from the volume."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.blake2b()
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb') as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            digest.update(view[:count])
+    return digest.hexdigest()
+
+
+def copy_verified(source: Path, target: Path, size: int, mtime_ns: int) -> str:
+    """Copy a file, verify the copy by size and hash, and return the hash.
+    
+    The copy is written to a temporary name and only renamed into place once
+    it has been read back and matched, so a partial file never looks finished.
+    """
+    temporary = target.with_name(f".{target.name}.sbp-part")
+    digest = hashlib.blake2b()
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    
+    try:
+        with open(source, 'rb') as reader, open(temporary, 'wb') as writer:
+            while True:
+                count = reader.readinto(buffer)
+                if not count:
+                    break
+                digest.update(view[:count])
+                writer.write(view[:count])
+            writer.flush()
+            os.fsync(writer.fileno())
+            _drop_cache(writer.fileno())
+        
+        stat = source.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            raise OSError("source changed during copy")
+        if temporary.stat().st_size != size:
+            raise OSError("size mismatch after copy")
+        if _hash_file(temporary) != digest.hexdigest():
+            raise OSError("hash mismatch after copy")
+        
+        shutil.copystat(source, temporary)
+        os.replace(temporary, target)
+    except BaseException:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+        raise
+    
+    return digest.hexdigest()
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Asset library for the SBP Folder Generator CLI.
+
+Indexes every file in the Assets & Resources tree (presets, LUTs, stock
+footage, music and sound effects) in a SQLite database with its name
+tokens, extension, size and category from the folder layout, e.g.
+``Presets & Templates`` / ``LUTs for Video``. Names are searched through a
+full-text index, so a search over hundreds of thousands of files is a
+single indexed query.
+
+Refreshing walks the tree with parallel os.scandir workers and only lists
+directories whose mtime changed since the last index. As with disk usage,
+a file rewritten in place doesn't change its directory's mtime; use a full
+index to pick up new sizes.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .catalog import _like_pattern
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS
+from .generators import project_generator
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS asset_dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER, children TEXT);
+CREATE TABLE IF NOT EXISTS assets (
+    path TEXT PRIMARY KEY, dir TEXT, name TEXT, tokens TEXT, extension TEXT, size INTEGER, mtime REAL,
+    category TEXT, subcategory TEXT
+);
+CREATE INDEX IF NOT EXISTS assets_dir ON assets (dir);
+CREATE INDEX IF NOT EXISTS assets_extension ON assets (extension);
+CREATE INDEX IF NOT EXISTS assets_category ON assets (category COLLATE NOCASE, subcategory COLLATE NOCASE);
+"""
+
+# Word index over name tokens, so searches don't scan every row
+NAME_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS asset_names USING fts5(
+    tokens, content='assets', content_rowid='rowid', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS asset_names_insert AFTER INSERT ON assets BEGIN
+    INSERT INTO asset_names (rowid, tokens) VALUES (new.rowid, new.tokens);
+END;
+CREATE TRIGGER IF NOT EXISTS asset_names_delete AFTER DELETE ON assets BEGIN
+    INSERT INTO asset_names (asset_names, rowid, tokens) VALUES ('delete', old.rowid, old.tokens);
+END;
+"""
+
+COLUMNS = ("path", "name", "extension", "size", "mtime", "category", "subcategory")
+
+# Word boundaries inside names: camelCase, letters next to digits
+CASE_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Za-z])(?=\d)|(?<=\d)(?=[A-Za-z])")
+WORD = re.compile(r"[^\W_]+")
+
+
+def name_tokens(name: str) -> str:
+    """Split a file name into searchable words: 'TealOrange_v2.cube' -> 'tealorange teal orange v 2 cube'."""
+    tokens = []
+    for word in WORD.findall(name):
+        parts = CASE_BOUNDARY.split(word)
+        tokens.extend([word] if len(parts) == 1 else [word] + parts)
+    return " ".join(token.casefold() for token in tokens)
+
+
+def _list_dir(path: str, cached_mtime: Optional[int]) -> Tuple[str, Optional[int], Optional[List[tuple]], Optional[List[str]]]:
+    """List one directory's files and subdirectories, or return None for both if its mtime is unchanged."""
+    try:
+        mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return path, None, None, None
+    if mtime_ns == cached_mtime:
+        return path, mtime_ns, None, None
+    
+    files, children = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        children.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((entry.name, stat.st_size, stat.st_mtime))
+                except OSError:
+                    continue
+    except OSError:
+        return path, None, None, None
+    return path, mtime_ns, files, sorted(children)
+
+
+class AssetLibrary:
+    """An incrementally refreshed, searchable index of the Assets & Resources tree."""
+    
+    def __init__(self, base_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS,
+                 db_file: Optional[Path] = None):
+        root = (base_path / config_manager.config.base_directories["assets"] if base_path
+                else project_generator.get_assets_path())
+        self.root = Path(os.path.abspath(str(root)))
+        self.workers = workers
+        self._db_file = db_file
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.name_index = False
+    
+    @property
+    def db_file(self) -> Path:
+        return self._db_file or config_manager.cache_dir / "assets.db"
+    
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+            try:
+                self._db.executescript(NAME_INDEX_SCHEMA)
+                self.name_index = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5; names are matched with LIKE
+                self.name_index = False
+        return self._db
+    
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """Index the tree, listing only directories whose mtime changed unless full is set."""
+        root = str(self.root)
+        with self._lock:
+            cached = {path: (mtime_ns, json.loads(children)) for path, mtime_ns, children in self.db.execute(
+                "SELECT path, mtime_ns, children FROM asset_dirs WHERE path = ? OR substr(path, 1, ?) = ?",
+                (root, len(root) + 1, root + os.sep))}
+        
+        seen, changed = {}, []
+        if self.root.is_dir():
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = {pool.submit(_list_dir, root, None if full else cached.get(root, (None,))[0])}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path, mtime_ns, files, children = future.result()
+                        if mtime_ns is None:
+                            continue
+                        if files is None:
+                            children = cached[path][1]
+                        else:
+                            changed.append((path, files))
+                        seen[path] = (mtime_ns, children)
+                        for child in children:
+                            child_path = os.path.join(path, child)
+                            child_mtime = None if full else cached.get(child_path, (None,))[0]
+                            pending.add(pool.submit(_list_dir, child_path, child_mtime))
+        
+        removed = [path for path in cached if path not in seen]
+        rows = [self._row(path, *file) for path, files in changed for file in files]
+        with self._lock, self.db:
+            self.db.executemany("DELETE FROM assets WHERE dir = ?", [(path,) for path, _ in changed] +
+                                [(path,) for path in removed])
+            self.db.executemany("DELETE FROM asset_dirs WHERE path = ?", [(path,) for path in removed])
+            self.db.executemany("INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.db.executemany("INSERT OR REPLACE INTO asset_dirs VALUES (?, ?, ?)",
+                                [(path, mtime_ns, json.dumps(children)) for path, (mtime_ns, children) in seen.items()])
+        return {"directories": len(seen), "listed": len(changed), "removed": len(removed), "files": self.count()}
+    
+    def search(self, query: Optional[str] = None, extension: Optional[str] = None, category: Optional[str] = None,
+               limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """Find assets whose names contain every word of the query (as word prefixes), by name."""
+        db = self.db
+        root = str(self.root)
+        clauses = ["substr(path, 1, ?) = ?"]
+        params: List[Any] = [len(root) + 1, root + os.sep]
+        
+        words = WORD.findall(query.casefold()) if query else []
+        if words and self.name_index:
+            clauses.append("rowid IN (SELECT rowid FROM asset_names WHERE asset_names MATCH ?)")
+            params.append(" ".join(f'"{word}"*' for word in words))
+        else:
+            for word in words:
+                clauses.append("tokens LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(word))
+        if extension:
+            clauses.append("extension = ?")
+            params.append(extension.lstrip(".").casefold())
+        if category:
+            clauses.append("(category = ? COLLATE NOCASE OR subcategory = ? COLLATE NOCASE)")
+            params.extend([category, category])
+        
+        sql = f"SELECT {', '.join(COLUMNS)} FROM assets WHERE {' AND '.join(clauses)} ORDER BY name, path"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            rows = db.execute(sql, params).fetchall()
+        assets = []
+        for row in rows:
+            asset = dict(zip(COLUMNS, row))
+            asset["mtime"] = datetime.fromtimestamp(asset["mtime"])
+            assets.append(asset)
+        return assets
+    
+    def count(self) -> int:
+        root = str(self.root)
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM assets WHERE substr(path, 1, ?) = ?",
+                                   (len(root) + 1, root + os.sep)).fetchone()[0]
+    
+    def _row(self, directory: str, name: str, size: int, mtime: float) -> tuple:
+        """Build an asset row, taking the category and subcategory from the folders below the root."""
+        folders = Path(directory).relative_to(self.root).parts
+        category = folders[0] if folders else None
+        subcategory = folders[1] if len(folders) > 1 else None
+        extension = os.path.splitext(name)[1].lstrip(".").casefold()
+        return (os.path.join(directory, name), directory, name, name_tokens(name), extension, size, mtime,
+                category, subcategory)
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+Project catalog for the SBP Folder Generator CLI.
+
+Every generated project is recorded in a local SQLite database with its
+paths, client, date, type, work type and cameras, so finding a project is
+an indexed query instead of a walk over the share. Projects made before the
+catalog existed are added with ``import_archive``, which scans an archive
+once with the parallel scanner, and ``reindex`` rebuilds entries from the
+metadata sidecars written into each generated project.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .config import config_manager
+from .models import ProjectConfig
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path TEXT PRIMARY KEY, name TEXT, name_folded TEXT, client TEXT, client_folded TEXT,
+    date TEXT, type TEXT, work_type TEXT, cameras TEXT, recorded TEXT
+);
+CREATE INDEX IF NOT EXISTS projects_client ON projects (client_folded, date);
+CREATE INDEX IF NOT EXISTS projects_date ON projects (date);
+CREATE INDEX IF NOT EXISTS projects_type ON projects (type, date);
+"""
+
+# Trigram index over project names, so substring searches don't scan every row
+NAME_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS project_names USING fts5(
+    name_folded, content='projects', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS project_names_insert AFTER INSERT ON projects BEGIN
+    INSERT INTO project_names (rowid, name_folded) VALUES (new.rowid, new.name_folded);
+END;
+CREATE TRIGGER IF NOT EXISTS project_names_delete AFTER DELETE ON projects BEGIN
+    INSERT INTO project_names (project_names, rowid, name_folded) VALUES ('delete', old.rowid, old.name_folded);
+END;
+CREATE TRIGGER IF NOT EXISTS project_names_update AFTER UPDATE OF name_folded ON projects BEGIN
+    INSERT INTO project_names (project_names, rowid, name_folded) VALUES ('delete', old.rowid, old.name_folded);
+    INSERT INTO project_names (rowid, name_folded) VALUES (new.rowid, new.name_folded);
+END;
+"""
+
+# The trigram index can only answer searches at least this long
+TRIGRAM = 3
+
+COLUMNS = ("path", "name", "client", "date", "type", "work_type", "cameras")
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.casefold().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _project_row(config: ProjectConfig, project_path: Path, project_type: str) -> tuple:
+    cameras = [assignment.get_folder_name() for assignment in config.camera_assignments] \
+        if config.use_camera_folders else []
+    return (str(project_path), config.project_name, config.client_name, config.project_date,
+            project_type, config.work_type.value, cameras)
+
+
+def _archive_roots(base_path: Optional[Path]) -> Tuple[Optional[Path], Dict[str, Path]]:
+    """Get the absolute base path, if given, and the type folder of each project type."""
+    from .scanner import PROJECT_TYPES
+    
+    config = config_manager.config
+    if base_path:
+        base = Path(os.path.abspath(str(base_path)))
+        return base, {t: base / config.base_directories[t] for t in PROJECT_TYPES}
+    return None, {t: config_manager.get_base_path(t).absolute() for t in PROJECT_TYPES}
+
+
+class ProjectCatalog:
+    """An indexed record of every project in the archive."""
+    
+    def __init__(self, db_file: Optional[Path] = None):
+        self._db_file = db_file
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.name_index = False
+    
+    @property
+    def db_file(self) -> Path:
+        return self._db_file or config_manager.cache_dir / "catalog.db"
+    
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Open the catalog on first use, so importing this module stays cheap."""
+        if self._db is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+            try:
+                self._db.executescript(NAME_INDEX_SCHEMA)
+                self.name_index = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5 or the trigram tokenizer; names are matched with LIKE
+                self.name_index = False
+        return self._db
+    
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def record(self, config: ProjectConfig, project_path: Path, project_type: str) -> None:
+        """Record one generated project folder of the given type ("photography" or "videography")."""
+        self._upsert([_project_row(config, project_path, project_type)])
+    
+    def import_archive(self, base_path: Optional[Path] = None) -> Dict[str, int]:
+        """Add every project found in an archive, and drop catalog entries under it that are gone."""
+        from .archiver import project_date
+        from .generators import project_generator
+        from .scanner import iter_project_folders
+        
+        base, type_roots = _archive_roots(base_path)
+        
+        rows = []
+        for project_type, client_name, year, project_path in iter_project_folders(base):
+            if client_name is not None:
+                name = project_generator.parse_project_folder_name(project_path.name)[1]
+            else:
+                name = project_path.name
+            rows.append((str(project_path), name, client_name, project_date(client_name, year, project_path),
+                         project_type, "client" if client_name is not None else "personal", []))
+        
+        stale = self._paths_under(type_roots.values(), {row[0] for row in rows})
+        # Folder names don't hold cameras or a personal project's full date, so keep what generation recorded
+        self._upsert(rows, keep_recorded=True)
+        self._delete(stale)
+        return {"projects": len(rows), "removed": len(stale)}
+    
+    def reindex(self, base_path: Optional[Path] = None, workers: Optional[int] = None) -> Dict[str, int]:
+        """Rebuild the catalog entries under an archive from the projects' sidecar files.
+        
+        Only folders holding a sidecar are read. Entries for projects without
+        one (added by ``import_archive``) are kept while their folder exists.
+        """
+        from .fsutil import DEFAULT_WORKERS
+        from .sidecar import iter_sidecars
+        
+        _, type_roots = _archive_roots(base_path)
+        root_types = {root: project_type for project_type, root in type_roots.items()}
+        config = config_manager.config
+        # Work folder, the layout levels below it, then the project folder
+        max_depth = 2 + max(len(config.client_layout), len(config.personal_layout))
+        
+        rows, unreadable = [], 0
+        for root, project_path, project_config in iter_sidecars(list(root_types), max_depth,
+                                                                 workers or DEFAULT_WORKERS):
+            if project_config is None:
+                unreadable += 1
+                continue
+            rows.append(_project_row(project_config, project_path, root_types[root]))
+        
+        stale = [path for path in self._paths_under(type_roots.values(), {row[0] for row in rows})
+                 if not os.path.isdir(path)]
+        self._upsert(rows)
+        self._delete(stale)
+        return {"projects": len(rows), "removed": len(stale), "unreadable": unreadable}
+    
+    def find(self, client: Optional[str] = None, name: Optional[str] = None,
+             since: Optional[datetime] = None, until: Optional[datetime] = None,
+             project_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find projects, newest first. Client matches exactly and name as a substring, ignoring case."""
+        db = self.db
+        clauses, params = [], []
+        if client:
+            clauses.append("client_folded = ?")
+            params.append(client.casefold())
+        if name and self.name_index and len(name) >= TRIGRAM:
+            clauses.append("rowid IN (SELECT rowid FROM project_names WHERE project_names MATCH ?)")
+            params.append('"' + name.casefold().replace('"', '""') + '"')
+        elif name:
+            clauses.append("name_folded LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(name))
+        if since:
+            clauses.append("date >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("date <= ?")
+            params.append(until.isoformat())
+        if project_type:
+            clauses.append("type = ?")
+            params.append(project_type)
+        
+        query = f"SELECT {', '.join(COLUMNS)} FROM projects"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY date DESC, path"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            rows = db.execute(query, params).fetchall()
+        projects = []
+        for row in rows:
+            project = dict(zip(COLUMNS, row))
+            project["date"] = datetime.fromisoformat(project["date"]) if project["date"] else None
+            project["cameras"] = json.loads(project["cameras"] or "[]")
+            projects.append(project)
+        return projects
+    
+    def count(self) -> int:
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+    
+    def _paths_under(self, roots, found: set) -> List[str]:
+        """Get the catalogued paths below the given folders that aren't in `found`."""
+        paths = []
+        with self._lock:
+            for root in roots:
+                prefix = str(root) + os.sep
+                paths.extend(path for (path,) in self.db.execute(
+                    "SELECT path FROM projects WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+                    if path not in found)
+        return paths
+    
+    def _delete(self, paths: List[str]) -> None:
+        with self._lock, self.db:
+            self.db.executemany("DELETE FROM projects WHERE path = ?", [(path,) for path in paths])
+    
+    def _upsert(self, rows: List[tuple], keep_recorded: bool = False) -> None:
+        recorded = datetime.now().isoformat()
+        values = [(path, name, name.casefold(), client, client.casefold() if client else None,
+                   date.isoformat() if date else None, project_type, work_type, json.dumps(cameras), recorded)
+                  for path, name, client, date, project_type, work_type, cameras in rows]
+        if keep_recorded:
+            date_value, cameras_value = "COALESCE(projects.date, excluded.date)", "projects.cameras"
+        else:
+            date_value, cameras_value = "excluded.date", "excluded.cameras"
+        with self._lock, self.db:
+            self.db.executemany(
+                "INSERT INTO projects (path, name, name_folded, client, client_folded, date, type, work_type, "
+                "cameras, recorded) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET name = excluded.name, name_folded = excluded.name_folded, "
+                "client = excluded.client, client_folded = excluded.client_folded, type = excluded.type, "
+                f"work_type = excluded.work_type, date = {date_value}, cameras = {cameras_value}, recorded = excluded.recorded",
+                values)
+
+
+# Global catalog instance
+project_catalog = ProjectCatalog()
\ No newline at end of file
@@ -3,6 +3,9 @@ Main CLI interface for the SBP Folder Generator.
 """
 
 import click
+import csv
+import time
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -13,61 +16,92 @@ from rich.panel import Panel
 from rich.text import Text
 
 from .models import ProjectType, WorkType, ProjectConfig, Camera, CameraPurpose, CameraAssignment
-from .client_manager import client_manager
-from .generators import project_generator
+from .client_manager import client_manager, client_file_format, read_client_records, CLIENT_FILE_FORMATS
+from .generators import project_generator, GenerationEvent, FILE_EVENT, FOLDER_EVENT
 from .config import config_manager
+from .directory_index import directory_index
+from .fsutil import DEFAULT_WORKERS
+from .output import output, OUTPUT_FORMATS
+from .completion import CAMERAS, CLIENTS, PURPOSES, cached_candidates, camera_candidates, matching
 
 console = Console()
+err_console = Console(stderr=True)
 
 
-def print_success(message: str):
+MESSAGE_STYLES = {
+    "success": ("✅", "green"),
+    "error": ("❌", "red"),
+    "warning": ("⚠️", "yellow"),
+    "info": ("ℹ️", "blue"),
+}
+
+
+def _print_message(level: str, message: str, out: Optional[Console]):
+    """Print a status message, or emit it as a record in JSON-lines mode."""
+    if output.quiet and level in ("success", "info"):
+        return
+    if output.jsonl:
+        output.emit("message", stderr=out is err_console, level=level, message=message)
+        return
+    icon, style = MESSAGE_STYLES[level]
+    (out or console).print(f"{icon} {message}", style=style)
+
+
+def complete_clients(ctx: click.Context, param: click.Parameter, incomplete: str) -> List[str]:
+    """Complete client names from the completion cache."""
+    return matching(cached_candidates(CLIENTS), incomplete)
+
+
+def complete_cameras(ctx: click.Context, param: click.Parameter, incomplete: str) -> List[str]:
+    """Complete a purpose:camera list from the completion cache."""
+    return camera_candidates(incomplete, cached_candidates(PURPOSES), cached_candidates(CAMERAS))
+
+
+def print_success(message: str, out: Console = None):
     """Print success message with rich formatting."""
-    console.print(f"✅ {message}", style="green")
+    _print_message("success", message, out)
 
 
-def print_error(message: str):
+def print_error(message: str, out: Console = None):
     """Print error message with rich formatting."""
-    console.print(f"❌ {message}", style="red")
+    _print_message("error", message, out)
 
 
-def print_warning(message: str):
+def print_warning(message: str, out: Console = None):
     """Print warning message with rich formatting."""
-    console.print(f"⚠️ {message}", style="yellow")
+    _print_message("warning", message, out)
 
 
-def print_info(message: str):
+def print_info(message: str, out: Console = None):
     """Print info message with rich formatting."""
-    console.print(f"ℹ️ {message}", style="blue")
+    _print_message("info", message, out)
 
 
 def _client_folder_exists(client_name: str, project_type: str, directory_analysis: Dict[str, Any] = None) -> bool:
     """Check if a client actually has corresponding folders in the filesystem."""
     try:
-        from pathlib import Path
-        
-        # Get potential client work paths based on project type
-        base_paths = []
+        matcher = project_generator.layout_matcher
+        # The archive we're in, else each type folder's own volume
+        archive_base = directory_analysis.get("archive_base") if directory_analysis else None
+        project_types = {"photo": ["photography"], "video": ["videography"]}.get(
+            project_type, ["photography", "videography"])
         
-        # Use smart detection base if available
-        if directory_analysis and directory_analysis.get("suggested_base"):
-            base = Path(directory_analysis["suggested_base"])
-        else:
-            base = config_manager.get_base_path()
-        
-        # Check both PHOTO and VIDEO folders for the client
-        folder_names = ["PHOTO", "VIDEO", "Photography", "Videography"]
-        if project_type == "photo":
-            folder_names = ["PHOTO", "Photography"]
-        elif project_type == "video":
-            folder_names = ["VIDEO", "Videography"]
-        
-        for folder_name in folder_names:
-            type_path = base / folder_name
-            if type_path.exists():
-                client_work_path = type_path / "Client Work"
-                if client_work_path.exists():
-                    client_folder = client_work_path / client_name
-                    if client_folder.exists() and client_folder.is_dir():
+        for key in project_types:
+            base = Path(archive_base) if archive_base else config_manager.get_volume_root(key)
+            for type_name in matcher.type_names[key]:
+                for work_name in matcher.client_work_names:
+                    client_work_path = base / type_name / work_name
+                    indexed = directory_index.has_client_folder(client_work_path, client_name)
+                    if indexed is not None:
+                        if indexed:
+                            return True
+                        continue
+                    
+                    client_path = matcher.client_path(client_work_path, client_name)
+                    if client_path is not None:
+                        if client_path.is_dir():
+                            return True
+                    elif client_name in matcher.iter_client_names(client_work_path):
                         return True
         
         return False
@@ -77,13 +111,18 @@ def _client_folder_exists(client_name: str, project_type: str, directory_analysi
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="structure-cli")
-def cli():
+@click.option('--output', 'output_format', type=click.Choice(OUTPUT_FORMATS), default='text', show_default=True,
+              help='Output format; jsonl prints one JSON record per line for scripts')
+@click.option('-q', '--quiet', is_flag=True, help='Only print warnings, errors and requested data')
+@click.pass_context
+def cli(ctx: click.Context, output_format: str, quiet: bool):
     """
     Creative Structure CLI
     
     A powerful tool for generating standardized folder structures for photo and video projects.
     """
-    pass
+    output.configure(output_format, quiet)
+    ctx.call_on_close(output.flush)
 
 
 @cli.command()
@@ -93,7 +132,7 @@ def cli():
 @click.option('--work-type', 'work_type',
               type=click.Choice(['client', 'personal']),
               help='Type of work (client/personal)')
-@click.option('--client', 'client_name',
+@click.option('--client', 'client_name', shell_complete=complete_clients,
               help='Client name (required for client work)')
 @click.option('--project', 'project_name',
               help='Project name')
@@ -108,165 +147,299 @@ def cli():
               help='Include Proxies folder for video projects')
 @click.option('--no-smart-path', is_flag=True,
               help='Disable smart path detection (always create full folder structure)')
-@click.option('--cameras', 
+@click.option('--cameras', shell_complete=complete_cameras,
               help='Camera setup (format: purpose1:camera1,purpose2:camera2) e.g., main:lumix,BTS:DJI-POCKET')
+@click.option('--batch', 'batch_file',
+              type=click.Path(exists=True, file_okay=True, dir_okay=False),
+              help='CSV file with one project per row (columns: type, work_type, client, project, date, cameras)')
+@click.option('--emit', type=click.Choice(['tar', 'zip']),
+              help='Stream the folder structure as an archive instead of creating it')
+@click.option('--list-folders', is_flag=True, help='Print every folder as it is created')
+@click.option('-o', '--output-file', 'output_file', default='-',
+              help='Archive destination for --emit ("-" for stdout)')
+@click.option('--force', is_flag=True, help='Check every folder even if this exact project was already created')
+@click.option('--target', help='Create the folders in an object store instead, e.g. s3://bucket/prefix')
+@click.option('--endpoint-url', help='Object store endpoint for --target, e.g. http://localhost:9000 for MinIO')
 def create(project_type: str, work_type: str, client_name: str, project_name: str, 
-           project_date: str, base_path: str, capture_one: bool, proxies: bool, no_smart_path: bool, cameras: str):
+           project_date: str, base_path: str, capture_one: bool, proxies: bool, no_smart_path: bool, cameras: str,
+           batch_file: str, emit: str, list_folders: bool, output_file: str, force: bool, target: str,
+           endpoint_url: str):
     """Create a new project folder structure."""
     
+    # Keep stdout clean for the archive when streaming it there
+    out = err_console if emit and output_file == '-' else console
+    
     try:
-        # Parse date if provided
-        if project_date:
-            try:
-                parsed_date = datetime.strptime(project_date, '%Y-%m-%d')
-            except ValueError:
-                print_error("Invalid date format. Use YYYY-MM-DD format.")
-                return
-        else:
-            parsed_date = datetime.now()
-        
-        # Validate required fields
-        if not project_type:
-            print_error("Project type is required. Use --type option.")
-            return
-        
-        if not work_type:
-            print_error("Work type is required. Use --work-type option.")
-            return
+        generator = project_generator
+        if target:
+            from .filesystem import filesystem_from_url
+            from .generators import ProjectGenerator
+            generator = ProjectGenerator(filesystem_from_url(target, endpoint_url))
+            # Paths are relative to the target, and the current directory says nothing about it
+            base_path = "/"
         
-        if not project_name:
-            print_error("Project name is required. Use --project option.")
-            return
-        
-        if work_type == 'client' and not client_name:
-            print_error("Client name is required for client work. Use --client option.")
-            return
-        
-        # Parse camera assignments
-        camera_assignments = []
-        use_camera_folders = False
-        
-        if cameras and project_type in ['video', 'both']:
-            try:
-                use_camera_folders = True
-                default_cameras = {cam['name'].lower(): Camera(**cam) for cam in config_manager.config.default_cameras}
-                
-                for assignment_str in cameras.split(','):
-                    assignment_str = assignment_str.strip()
-                    if ':' not in assignment_str:
-                        print_error(f"Invalid camera format: {assignment_str}. Use format: purpose:camera")
-                        return
-                    
-                    purpose_str, camera_str = assignment_str.split(':', 1)
-                    purpose_str = purpose_str.strip().upper()
-                    camera_str = camera_str.strip()
-                    
-                    # Validate purpose
-                    try:
-                        purpose = CameraPurpose(purpose_str.lower())
-                    except ValueError:
-                        # Try common aliases
-                        purpose_aliases = {
-                            'MAIN': CameraPurpose.MAIN,
-                            'PRIMARY': CameraPurpose.MAIN,
-                            'BTS': CameraPurpose.BTS,
-                            'BEHIND': CameraPurpose.BTS,
-                            'SECONDARY': CameraPurpose.SECONDARY,
-                            'SEC': CameraPurpose.SECONDARY,
-                            'DRONE': CameraPurpose.DRONE,
-                            'AERIAL': CameraPurpose.DRONE,
-                            'INTERVIEW': CameraPurpose.INTERVIEW,
-                            'DETAIL': CameraPurpose.DETAIL,
-                            'BACKUP': CameraPurpose.BACKUP
-                        }
-                        if purpose_str in purpose_aliases:
-                            purpose = purpose_aliases[purpose_str]
-                        else:
-                            print_error(f"Invalid purpose: {purpose_str}. Valid options: {', '.join([p.value for p in CameraPurpose])}")
-                            return
-                    
-                    # Find or create camera
-                    camera_key = camera_str.lower().replace('-', ' ').replace('_', ' ')
-                    if camera_key in default_cameras:
-                        camera = default_cameras[camera_key]
-                    else:
-                        # Create custom camera
-                        camera = Camera(name=camera_str)
-                    
-                    assignment = CameraAssignment(camera=camera, purpose=purpose)
-                    camera_assignments.append(assignment)
-                
-                print_info(f"📹 Camera setup: {', '.join([a.get_folder_name() for a in camera_assignments])}")
-                
-            except Exception as e:
-                print_error(f"Error parsing camera assignments: {str(e)}")
+        if batch_file:
+            configs = _iter_batch_configs(batch_file, base_path, capture_one, proxies)
+        else:
+            config = _build_project_config(project_type, work_type, client_name, project_name, project_date,
+                                           base_path, capture_one, proxies, cameras, out)
+            if config is None:
                 return
-        
-        # Create project configuration
-        config = ProjectConfig(
-            project_type=ProjectType(project_type),
-            work_type=WorkType(work_type),
-            project_name=project_name,
-            client_name=client_name,
-            project_date=parsed_date,
-            base_path=base_path,
-            include_capture_one=capture_one,
-            include_proxies=proxies,
-            camera_assignments=camera_assignments,
-            use_camera_folders=use_camera_folders
-        )
+            configs = [config]
         
         # Analyze current directory for smart path detection
-        directory_analysis = project_generator.analyze_current_directory()
+        directory_analysis = generator.analyze_current_directory(Path("/") if target else None)
         
         # Show analysis if we're in structure (but don't ask in non-interactive mode)
         if directory_analysis["is_in_structure"] and not no_smart_path:
-            print_info("🔍 Smart path detection enabled:")
-            print_info(f"   Current directory: {Path.cwd()}")
+            print_info("🔍 Smart path detection enabled:", out)
+            print_info(f"   Current directory: {Path.cwd()}", out)
             if directory_analysis["detected_type"]:
                 type_display = "Photo" if directory_analysis['detected_type'] == "photography" else "Video"
-                print_info(f"   📁 Detected type: {type_display}")
+                print_info(f"   📁 Detected type: {type_display}", out)
             if directory_analysis["detected_work_type"]:
-                print_info(f"   💼 Detected work type: {directory_analysis['detected_work_type'].title()}")
+                print_info(f"   💼 Detected work type: {directory_analysis['detected_work_type'].title()}", out)
             if directory_analysis["detected_client"]:
-                print_info(f"   👥 Detected client: {directory_analysis['detected_client']}")
+                print_info(f"   👥 Detected client: {directory_analysis['detected_client']}", out)
             if directory_analysis["discovered_clients"]:
-                print_info(f"   📁 Found client folders: {', '.join(directory_analysis['discovered_clients'])}")
-            print_info(f"   ⚡ Will skip creating: {', '.join(directory_analysis['skip_folders'])}")
+                print_info(f"   📁 Found client folders: {', '.join(directory_analysis['discovered_clients'])}", out)
+            print_info(f"   ⚡ Will skip creating: {', '.join(directory_analysis['skip_folders'])}", out)
             directory_analysis["use_smart_detection"] = True
         else:
             if no_smart_path and directory_analysis["is_in_structure"]:
-                print_info("📍 Smart path detection disabled by --no-smart-path flag")
+                print_info("📍 Smart path detection disabled by --no-smart-path flag", out)
             directory_analysis["use_smart_detection"] = False
         
-        # Generate project
-        result = project_generator.generate_project(config, directory_analysis)
+        if emit:
+            _emit_archive(configs, directory_analysis, emit, output_file, base_path, out)
+            return
         
-        if result["success"]:
-            print_success(result["message"])
-            print_info(f"Created {len(result['created_folders'])} folders:")
-            for folder in result["created_folders"]:
-                console.print(f"  📁 {folder}")
+        on_event = _print_folder_event if list_folders else None
+        with client_manager.batch():
+            for config in configs:
+                # Generate project, keeping only counts so huge batches stay small
+                result = generator.generate_project(config, directory_analysis, on_event=on_event,
+                                                    keep_folders=False, force=force)
+                _report_generation(config, result, directory_analysis)
+    
+    except Exception as e:
+        print_error(f"Error creating project: {str(e)}", out)
+
+
+def _parse_camera_assignments(cameras: str) -> List[CameraAssignment]:
+    """Parse a purpose:camera list such as 'main:lumix,BTS:DJI-POCKET'."""
+    camera_assignments = []
+    default_cameras = {cam['name'].lower(): Camera(**cam) for cam in config_manager.config.default_cameras}
+    
+    for assignment_str in cameras.split(','):
+        assignment_str = assignment_str.strip()
+        if ':' not in assignment_str:
+            raise ValueError(f"Invalid camera format: {assignment_str}. Use format: purpose:camera")
+        
+        purpose_str, camera_str = assignment_str.split(':', 1)
+        purpose_str = purpose_str.strip().upper()
+        camera_str = camera_str.strip()
+        
+        # Validate purpose
+        try:
+            purpose = CameraPurpose(purpose_str.lower())
+        except ValueError:
+            # Try common aliases
+            purpose_aliases = {
+                'MAIN': CameraPurpose.MAIN,
+                'PRIMARY': CameraPurpose.MAIN,
+                'BTS': CameraPurpose.BTS,
+                'BEHIND': CameraPurpose.BTS,
+                'SECONDARY': CameraPurpose.SECONDARY,
+                'SEC': CameraPurpose.SECONDARY,
+                'DRONE': CameraPurpose.DRONE,
+                'AERIAL': CameraPurpose.DRONE,
+                'INTERVIEW': CameraPurpose.INTERVIEW,
+                'DETAIL': CameraPurpose.DETAIL,
+                'BACKUP': CameraPurpose.BACKUP
+            }
+            if purpose_str in purpose_aliases:
+                purpose = purpose_aliases[purpose_str]
+            else:
+                raise ValueError(f"Invalid purpose: {purpose_str}. Valid options: {', '.join([p.value for p in CameraPurpose])}")
+        
+        # Find or create camera
+        camera_key = camera_str.lower().replace('-', ' ').replace('_', ' ')
+        if camera_key in default_cameras:
+            camera = default_cameras[camera_key]
+        else:
+            # Create custom camera
+            camera = Camera(name=camera_str)
+        
+        camera_assignments.append(CameraAssignment(camera=camera, purpose=purpose))
+    
+    return camera_assignments
+
+
+def _build_project_config(project_type: str, work_type: str, client_name: str, project_name: str,
+                          project_date: str, base_path: str, capture_one: bool, proxies: bool,
+                          cameras: str, out: Console) -> Optional[ProjectConfig]:
+    """Validate command line values and build a project configuration (None if invalid)."""
+    # Parse date if provided
+    if project_date:
+        try:
+            parsed_date = datetime.strptime(project_date, '%Y-%m-%d')
+        except ValueError:
+            print_error("Invalid date format. Use YYYY-MM-DD format.", out)
+            return None
+    else:
+        parsed_date = datetime.now()
+    
+    # Validate required fields
+    if not project_type:
+        print_error("Project type is required. Use --type option.", out)
+        return None
+    
+    if not work_type:
+        print_error("Work type is required. Use --work-type option.", out)
+        return None
+    
+    if not project_name:
+        print_error("Project name is required. Use --project option.", out)
+        return None
+    
+    if work_type == 'client' and not client_name:
+        print_error("Client name is required for client work. Use --client option.", out)
+        return None
+    
+    # Parse camera assignments
+    camera_assignments = []
+    use_camera_folders = False
+    
+    if cameras and project_type in ['video', 'both']:
+        try:
+            camera_assignments = _parse_camera_assignments(cameras)
+            use_camera_folders = True
+            print_info(f"📹 Camera setup: {', '.join([a.get_folder_name() for a in camera_assignments])}", out)
+        except Exception as e:
+            print_error(f"Error parsing camera assignments: {str(e)}", out)
+            return None
+    
+    # Create project configuration
+    return ProjectConfig(
+        project_type=ProjectType(project_type),
+        work_type=WorkType(work_type),
+        project_name=project_name,
+        client_name=client_name,
+        project_date=parsed_date,
+        base_path=base_path,
+        include_capture_one=capture_one,
+        include_proxies=proxies,
+        camera_assignments=camera_assignments,
+        use_camera_folders=use_camera_folders
+    )
+
+
+def _iter_batch_configs(batch_file: str, base_path: str, capture_one: bool, proxies: bool):
+    """Lazily read project configurations from a batch CSV file."""
+    with open(batch_file, 'r', encoding='utf-8', newline='') as f:
+        for line_number, row in enumerate(csv.DictReader(f), start=2):
+            row = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+            project_type = row.get('type', '')
+            cameras = row.get('cameras', '')
             
-            # Add client to database only after successful project creation
-            if config.work_type == WorkType.CLIENT and config.client_name:
-                discovered_clients = directory_analysis.get("discovered_clients", []) if directory_analysis else []
-                database_clients = client_manager.list_clients()
-                
-                if config.client_name not in database_clients:
-                    try:
-                        client_manager.add_client(config.client_name)
-                        if config.client_name in discovered_clients:
-                            print_success(f"Added discovered client to database: {config.client_name}")
-                        else:
-                            print_success(f"Added new client to database: {config.client_name}")
-                    except ValueError as e:
-                        print_warning(f"Could not add client to database: {str(e)}")
+            try:
+                camera_assignments = (_parse_camera_assignments(cameras)
+                                      if cameras and project_type in ['video', 'both'] else [])
+                config = ProjectConfig(
+                    project_type=ProjectType(project_type),
+                    work_type=WorkType(row.get('work_type', '')),
+                    project_name=row.get('project', ''),
+                    client_name=row.get('client') or None,
+                    project_date=datetime.strptime(row['date'], '%Y-%m-%d') if row.get('date') else datetime.now(),
+                    base_path=base_path,
+                    include_capture_one=capture_one,
+                    include_proxies=proxies,
+                    camera_assignments=camera_assignments,
+                    use_camera_folders=bool(camera_assignments)
+                )
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{batch_file}, line {line_number}: {e}") from e
+            yield config
+
+
+def _emit_archive(configs, directory_analysis: Dict[str, Any], archive_format: str, output_file: str,
+                  base_path: Optional[str], out: Console):
+    """Stream the project folders into a tar or zip archive."""
+    from .emitters import ArchiveEmitter
+    
+    stream = click.open_file(output_file, 'wb')
+    with stream:
+        with ArchiveEmitter(stream, archive_format, root=Path(base_path) if base_path else None) as emitter:
+            for config in configs:
+                emitter.add_project(config, directory_analysis)
+    
+    destination = "stdout" if output_file == '-' else output_file
+    print_success(f"Wrote {emitter.folder_count} folders for {emitter.project_count} project(s) "
+                  f"to {destination} ({archive_format})", out)
+
+
+def _print_folder_event(event: GenerationEvent):
+    """Print a folder or starter file as it is created."""
+    if event.kind == FILE_EVENT:
+        if output.jsonl:
+            output.emit("file", path=event.path, existed=event.existed, method=event.method,
+                        bytes_saved=event.bytes_saved)
         else:
-            print_error(result["message"])
+            console.print(f"  📄 {event.path}" + (f" ({event.method})" if event.method else ""), highlight=False)
+        return
+    if event.kind != FOLDER_EVENT:
+        return
+    if output.jsonl:
+        output.emit("folder", path=event.path, existed=event.existed)
+    else:
+        console.print(f"  📁 {event.path}", highlight=False)
+
+
+def _report_generation(config: ProjectConfig, result: Dict[str, Any], directory_analysis: Dict[str, Any]):
+    """Print the outcome of a generation and record new clients."""
+    if output.jsonl:
+        output.emit("result", command="create", project=config.project_name, client=config.client_name,
+                    **{key: value for key, value in result.items() if key != "created_folders" or value})
     
-    except Exception as e:
-        print_error(f"Error creating project: {str(e)}")
+    if result["success"]:
+        if not output.jsonl and result.get("skipped"):
+            print_info(f"{result['message']} (use --force to check every folder again)")
+            if not output.quiet:
+                for project_path in result["project_paths"]:
+                    console.print(f"  📁 {project_path}")
+        elif not output.jsonl:
+            print_success(result["message"])
+            existing = f" ({result['existing_count']} already existed)" if result["existing_count"] else ""
+            print_info(f"Created {result['folder_count']} folders{existing} in:")
+            if not output.quiet:
+                timings = result.get("timings", {})
+                for project_path in result["project_paths"]:
+                    seconds = timings.get(str(project_path))
+                    took = f" [dim]({seconds:.2f}s)[/dim]" if seconds is not None and len(timings) > 1 else ""
+                    console.print(f"  📁 {project_path}{took}")
+            if result.get("file_count"):
+                from .usage import format_bytes
+                methods = ", ".join(f"{count} {method}" for method, count in sorted(result["clone_methods"].items()))
+                print_info(f"Added {result['file_count']} starter files ({methods}), "
+                           f"saving {format_bytes(result['bytes_saved'])}")
+        
+        # Add client to database only after successful project creation
+        if config.work_type == WorkType.CLIENT and config.client_name:
+            discovered_clients = directory_analysis.get("discovered_clients", []) if directory_analysis else []
+            database_clients = client_manager.list_clients()
+            
+            if config.client_name not in database_clients:
+                try:
+                    client_manager.add_client(config.client_name)
+                    if config.client_name in discovered_clients:
+                        print_success(f"Added discovered client to database: {config.client_name}")
+                    else:
+                        print_success(f"Added new client to database: {config.client_name}")
+                except ValueError as e:
+                    print_warning(f"Could not add client to database: {str(e)}")
+    elif not output.jsonl:
+        print_error(result["message"])
 
 
 @cli.command()
@@ -710,31 +883,8 @@ def interactive():
         
         # Confirm creation
         if questionary.confirm("Create this project structure?", default=True).ask():
-            result = project_generator.generate_project(config, directory_analysis)
-            
-            if result["success"]:
-                print_success(result["message"])
-                print_info(f"Created {len(result['created_folders'])} folders:")
-                for folder in result["created_folders"]:
-                    console.print(f"  📁 {folder}")
-                
-                # Add client to database only after successful project creation
-                if config.work_type == WorkType.CLIENT and config.client_name:
-                    # Check if client is from discovered clients or database clients
-                    discovered_clients = directory_analysis.get("discovered_clients", []) if directory_analysis else []
-                    database_clients = client_manager.list_clients()
-                    
-                    if config.client_name not in database_clients:
-                        try:
-                            client_manager.add_client(config.client_name)
-                            if config.client_name in discovered_clients:
-                                print_success(f"Added discovered client to database: {config.client_name}")
-                            else:
-                                print_success(f"Added new client to database: {config.client_name}")
-                        except ValueError as e:
-                            print_warning(f"Could not add client to database: {str(e)}")
-            else:
-                print_error(result["message"])
+            result = project_generator.generate_project(config, directory_analysis, keep_folders=False)
+            _report_generation(config, result, directory_analysis)
         else:
             print_info("Project creation cancelled.")
     
@@ -755,6 +905,11 @@ def list_clients():
     """List all clients."""
     client_list = client_manager.list_clients()
     
+    if output.jsonl:
+        for client_name in client_list:
+            _emit_client(client_name)
+        return
+    
     if not client_list:
         print_info("No clients found.")
         return
@@ -774,6 +929,57 @@ def list_clients():
     console.print(table)
 
 
+def _emit_client(client_name: str):
+    """Emit a client as a JSON-lines record."""
+    client = client_manager.get_client(client_name)
+    output.emit("client", name=client.name, projects=client.projects, project_count=len(client.projects or []),
+                created_date=client.created_date, notes=client.notes)
+
+
+@clients.command('import')
+@click.argument('file', type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option('--format', 'file_format', type=click.Choice(CLIENT_FILE_FORMATS),
+              help='File format (default: from the file extension)')
+def import_clients(file: str, file_format: str):
+    """Add or merge clients from a CSV or JSON-lines file (columns: name, notes, projects, created_date)."""
+    try:
+        file_format = client_file_format(file, file_format)
+        with click.open_file(file, 'r', encoding='utf-8') as stream:
+            result = client_manager.import_clients(read_client_records(stream, file_format))
+    except ValueError as e:
+        print_error(f"Error importing clients: {e}")
+        return
+    
+    if output.jsonl:
+        output.emit("result", command="clients import", added=result["added"], merged=result["merged"],
+                    invalid=[{"line": line, "error": error} for line, error in result["invalid"]])
+        return
+    
+    print_success(f"Imported clients: {result['added']} added, {result['merged']} merged into existing clients")
+    for line, error in result["invalid"][:20]:
+        print_warning(f"Line {line} skipped: {error}")
+    if len(result["invalid"]) > 20:
+        print_warning(f"... and {len(result['invalid']) - 20} more invalid lines")
+
+
+@clients.command('export')
+@click.argument('file', default='-', type=click.Path(dir_okay=False, allow_dash=True))
+@click.option('--format', 'file_format', type=click.Choice(CLIENT_FILE_FORMATS),
+              help='File format (default: from the file extension, csv for stdout)')
+def export_clients(file: str, file_format: str):
+    """Write every client to a CSV or JSON-lines file (stdout by default)."""
+    try:
+        file_format = client_file_format(file, file_format or ("csv" if file == '-' else None))
+    except ValueError as e:
+        print_error(str(e))
+        return
+    
+    with click.open_file(file, 'w', encoding='utf-8', atomic=file != '-') as stream:
+        count = client_manager.export_clients(stream, file_format)
+    if file != '-':
+        print_success(f"Exported {count} clients to {file}")
+
+
 @clients.command('add')
 @click.argument('name')
 @click.option('--notes', help='Optional notes about the client')
@@ -787,7 +993,7 @@ def add_client(name: str, notes: str):
 
 
 @clients.command('remove')
-@click.argument('name')
+@click.argument('name', shell_complete=complete_clients)
 def remove_client(name: str):
     """Remove a client."""
     if client_manager.delete_client(name):
@@ -802,6 +1008,11 @@ def search_clients(query: str):
     """Search for clients by name."""
     results = client_manager.search_clients(query)
     
+    if output.jsonl:
+        for client_name in results:
+            _emit_client(client_name)
+        return
+    
     if not results:
         print_info(f"No clients found matching '{query}'.")
         return
@@ -811,6 +1022,105 @@ def search_clients(query: str):
         console.print(f"  📋 {client_name}")
 
 
+@clients.command('stats')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--sort', 'sort_by', type=click.Choice(['name', 'projects', 'last', 'first']), default='name',
+              show_default=True, help='Sort by client name, project count, last modified or first project date')
+@click.option('--reverse', is_flag=True, help='Reverse the sort order')
+@click.option('--page', type=click.IntRange(min=1), default=1, show_default=True, help='Page to show')
+@click.option('--per-page', type=click.IntRange(min=1), default=50, show_default=True, help='Clients per page')
+@click.option('--refresh', is_flag=True, help='Ignore cached results and rescan every client folder')
+def client_stats(path: str, sort_by: str, reverse: bool, page: int, per_page: int, refresh: bool):
+    """Show per-client project statistics from the folders on disk."""
+    from .scanner import ClientStatsScanner, sort_client_stats
+    
+    scanner = ClientStatsScanner(Path(path) if path else None)
+    stats = sort_client_stats(scanner.scan(use_cache=not refresh), sort_by, reverse)
+    
+    if not stats:
+        print_info("No client folders found.")
+        return
+    
+    pages = (len(stats) + per_page - 1) // per_page
+    page = min(page, pages)
+    shown = stats[(page - 1) * per_page:page * per_page]
+    
+    if output.jsonl:
+        for record in shown:
+            output.emit("client_stats", **record)
+        return
+    
+    table = Table(title=f"📊 Client Stats (page {page} of {pages}, {len(stats)} clients)")
+    table.add_column("Client", style="cyan")
+    table.add_column("Photo", style="green", justify="right")
+    table.add_column("Video", style="green", justify="right")
+    table.add_column("Projects", style="green", justify="right")
+    table.add_column("Last Modified", style="yellow")
+    table.add_column("Date Range", style="magenta")
+    
+    for record in shown:
+        last_modified = "N/A"
+        if record["last_modified"]:
+            last_modified = f"{record['last_modified_project']} ({record['last_modified'].strftime('%Y-%m-%d')})"
+        date_range = "N/A"
+        if record["first_date"]:
+            date_range = f"{record['first_date'].strftime('%Y-%m-%d')} → {record['last_date'].strftime('%Y-%m-%d')}"
+        
+        table.add_row(record["client"], str(record["photo_projects"]), str(record["video_projects"]),
+                      str(record["project_count"]), last_modified, date_range)
+    
+    console.print(table)
+
+
+@cli.group()
+def template():
+    """Manage folder structure templates."""
+    pass
+
+
+@template.command('capture')
+@click.argument('project_dir', type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.option('--name', 'template_name', required=True,
+              help='Template name, e.g. videography_client to replace the built-in one')
+@click.option('--max-depth', type=int, default=4, show_default=True,
+              help='How many folder levels below the project to capture')
+@click.option('--force', is_flag=True, help='Replace an existing template with the same name')
+def capture_template(project_dir: str, template_name: str, max_depth: int, force: bool):
+    """Capture a template from an existing project folder."""
+    from .template_capture import capture_template as capture, save_template
+    
+    try:
+        captured = capture(Path(project_dir), max_depth=max_depth)
+        template_file = save_template(captured, template_name, overwrite=force)
+    except ValueError as e:
+        print_error(str(e))
+        return
+    
+    folder_count = len(captured["folders"]) + sum(len(c) for c in captured.get("subfolders", {}).values())
+    print_success(f"Captured template '{template_name}' ({folder_count} folders) to {template_file}")
+    if captured.get("optional_folders"):
+        print_info(f"Optional folders: {', '.join(captured['optional_folders'])}")
+    if captured.get("camera_folders"):
+        print_info(f"📹 Camera folders go in: {', '.join(captured['camera_folders'])}")
+
+
+@template.command('show')
+@click.argument('template_name')
+def show_template(template_name: str):
+    """Show a template with its inheritance resolved."""
+    try:
+        resolved = project_generator.load_template(template_name)
+    except ValueError as e:
+        print_error(str(e))
+        return
+    
+    if output.jsonl:
+        output.emit("template", name=template_name, template=resolved)
+        return
+    console.print_json(data=resolved)
+
+
 @cli.command()
 @click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
               help='Base path where Assets & Resources should be created')
@@ -820,7 +1130,9 @@ def setup_assets(path: str):
         base_path = Path(path) if path else None
         result = project_generator.generate_assets_structure(base_path)
         
-        if result["success"]:
+        if output.jsonl:
+            output.emit("result", command="setup-assets", **result)
+        elif result["success"]:
             print_success(result["message"])
             print_info(f"Created {len(result['created_folders'])} folders:")
             for folder in result["created_folders"]:
@@ -832,9 +1144,548 @@ def setup_assets(path: str):
         print_error(f"Error setting up assets structure: {str(e)}")
 
 
+@cli.group()
+def assets():
+    """Index and search the Assets & Resources library."""
+    pass
+
+
+@assets.command('index')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the Assets & Resources folder')
+@click.option('--full', is_flag=True, help='Re-list every folder instead of only the ones that changed')
+def index_assets(path: str, full: bool):
+    """Index the asset files, re-listing only folders that changed since the last index."""
+    from .assets import AssetLibrary
+    
+    library = AssetLibrary(Path(path) if path else None)
+    if not library.root.is_dir():
+        print_error(f"Assets folder not found: {library.root} (run setup-assets first)")
+        return
+    
+    result = library.refresh(full=full)
+    if output.jsonl:
+        output.emit("result", command="assets index", root=library.root, **result)
+        return
+    print_success(f"Indexed {result['files']} assets in {result['directories']} folders")
+    print_info(f"Re-listed {result['listed']} folders, {result['removed']} removed")
+
+
+@assets.command('search')
+@click.argument('query', required=False)
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the Assets & Resources folder')
+@click.option('--ext', 'extension', help='Only files with this extension, e.g. cube or wav')
+@click.option('--category', help='Only this category or subcategory, e.g. "LUTs for Video"')
+@click.option('--limit', type=click.IntRange(min=1), default=50, show_default=True, help='Assets to show')
+@click.option('--refresh', is_flag=True, help='Bring the index up to date before searching')
+def search_assets(query: str, path: str, extension: str, category: str, limit: int, refresh: bool):
+    """Search the asset index by name words, extension and category."""
+    from .assets import AssetLibrary
+    from .usage import format_bytes
+    
+    library = AssetLibrary(Path(path) if path else None)
+    if refresh:
+        library.refresh()
+    
+    started = time.perf_counter()
+    results = library.search(query, extension=extension, category=category, limit=limit)
+    elapsed = time.perf_counter() - started
+    
+    if output.jsonl:
+        for asset in results:
+            output.emit("asset", **asset)
+        return
+    if not results:
+        if not library.count():
+            print_warning("The asset index is empty; run `assets index` first.")
+        else:
+            print_info("No matching assets found.")
+        return
+    
+    table = Table(title=f"🎨 Assets ({len(results)} found in {elapsed * 1000:.0f} ms)")
+    table.add_column("Name", style="cyan")
+    table.add_column("Category", style="magenta")
+    table.add_column("Size", style="yellow", justify="right")
+    table.add_column("Modified", style="green")
+    for asset in results:
+        category_name = " / ".join(part for part in (asset["category"], asset["subcategory"]) if part)
+        table.add_row(asset["name"], category_name or "-", format_bytes(asset["size"]),
+                      asset["mtime"].strftime("%Y-%m-%d"))
+    console.print(table)
+    if len(results) == limit:
+        print_info(f"Showing the first {limit} matches (use --limit to see more)")
+
+
+@cli.command()
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--debounce', type=float, default=0.5, show_default=True,
+              help='Seconds of quiet before a batch of changes is applied')
+def watch(path: str, debounce: float):
+    """Watch client folders and keep the client database up to date (Linux)."""
+    from .watcher import ClientFolderWatcher
+    
+    watcher = ClientFolderWatcher(Path(path) if path else None, debounce=debounce)
+    
+    def report(summary: Dict[str, int]):
+        if summary["rescans"]:
+            print_warning("Event queue overflowed, rescanned all client folders")
+        changes = [f"{count} {key.replace('_', ' ')}" for key, count in summary.items()
+                   if count and key not in ("events", "rescans")]
+        if changes:
+            print_info(f"🔄 {', '.join(changes)}")
+    
+    try:
+        print_info(f"👀 Watching client folders under: {', '.join(str(p) for p in watcher.type_folders())}")
+        print_info("Press Ctrl+C to stop.")
+        watcher.run(on_batch=report)
+    except KeyboardInterrupt:
+        print_info("Stopped watching.")
+    except OSError as e:
+        print_error(f"Error watching folders: {str(e)}")
+
+
+@cli.command()
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--by', 'group_by', type=click.Choice(['client', 'project', 'folder']), default='client',
+              show_default=True, help='Group by client, project or project folder (Footage/RAW, Exports...)')
+@click.option('--client', 'client_name', shell_complete=complete_clients, help='Only count this client\'s projects')
+@click.option('--limit', type=click.IntRange(min=1), default=50, show_default=True, help='Rows to show')
+@click.option('--full', is_flag=True, help='Re-list every folder instead of only the ones that changed')
+@click.option('--cached', is_flag=True, help='Report the last walk without touching the archive')
+def usage(path: str, group_by: str, client_name: str, limit: int, full: bool, cached: bool):
+    """Show disk usage per client, project or project folder."""
+    from .usage import UsageIndex, format_bytes
+    
+    index = UsageIndex(Path(path) if path else None)
+    if cached:
+        index.load()
+    else:
+        walk = index.refresh(full=full)
+        print_info(f"Walked {walk['directories']} folders, re-listed {walk['listed']}")
+    
+    rows = index.report(by=group_by, client=client_name)
+    if not rows:
+        print_info("No projects found.")
+        return
+    
+    if output.jsonl:
+        for row in rows[:limit]:
+            # Keep the record's own "type" field; projects carry their type as project_type
+            fields = {("project_type" if key == "type" else key): value for key, value in row.items()}
+            output.emit("usage", by=group_by, **fields)
+        return
+    
+    total = sum(row["bytes"] for row in rows)
+    table = Table(title=f"💾 Disk Usage by {group_by} ({format_bytes(total)})")
+    if group_by == "project":
+        table.add_column("Client", style="cyan")
+        table.add_column("Type", style="magenta")
+        table.add_column("Project", style="cyan")
+    else:
+        table.add_column(group_by.capitalize(), style="cyan")
+        table.add_column("Projects", style="green", justify="right")
+    table.add_column("Size", style="yellow", justify="right")
+    table.add_column("Share", style="green", justify="right")
+    
+    for row in rows[:limit]:
+        share = f"{row['bytes'] / total:.1%}" if total else "-"
+        if group_by == "project":
+            table.add_row(row["client"], row["type"], row["name"], format_bytes(row["bytes"]), share)
+        else:
+            table.add_row(row["name"], str(row["projects"]), format_bytes(row["bytes"]), share)
+    
+    console.print(table)
+    if len(rows) > limit:
+        print_info(f"Showing {limit} of {len(rows)} rows (use --limit to see more)")
+
+
+@cli.command()
+@click.option('--older-than', 'older_than', required=True, help='Minimum project age, e.g. 180d, 26w, 6m or 1y')
+@click.option('--to', 'destination', required=True, type=click.Path(file_okay=False, dir_okay=True),
+              help='Archive volume to move projects to')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--client', 'client_name', shell_complete=complete_clients, help='Only archive this client\'s projects')
+@click.option('--workers', type=click.IntRange(min=1), default=8, show_default=True,
+              help='Files copied in parallel')
+@click.option('--dry-run', is_flag=True, help='List the projects that would be moved')
+@click.option('--keep-source', is_flag=True, help='Copy and verify but leave the source folders in place')
+def archive(older_than: str, destination: str, path: str, client_name: str, workers: int,
+            dry_run: bool, keep_source: bool):
+    """Move old projects to an archive volume, keeping the folder layout."""
+    from .archiver import ArchiveMover, parse_age, select_projects, walk_project
+    from .usage import format_bytes
+    
+    try:
+        age = parse_age(older_than)
+        mover = ArchiveMover(Path(destination), Path(path) if path else None, workers=workers,
+                             remove_source=not keep_source)
+    except ValueError as e:
+        print_error(str(e))
+        return
+    
+    projects = select_projects(mover.base_path, age, client=client_name)
+    if not projects:
+        print_info(f"No projects older than {older_than} found.")
+        return
+    
+    if dry_run and output.jsonl:
+        for project in projects:
+            _, files, _ = walk_project(project["path"])
+            output.emit("project", path=project["path"], date=project["date"], files=len(files),
+                        bytes=sum(size for size, _ in files.values()))
+        return
+    if dry_run:
+        table = Table(title=f"📦 Projects older than {older_than} ({len(projects)})")
+        table.add_column("Project", style="cyan")
+        table.add_column("Date", style="yellow")
+        table.add_column("Files", style="green", justify="right")
+        table.add_column("Size", style="green", justify="right")
+        for project in projects:
+            _, files, _ = walk_project(project["path"])
+            table.add_row(mover.archive_path(project["path"]), project["date"].strftime('%Y-%m-%d'),
+                          str(len(files)), format_bytes(sum(size for size, _ in files.values())))
+        console.print(table)
+        print_info(f"Run without --dry-run to move them to {mover.destination}")
+        return
+    
+    moved = failed = copied = 0
+    started = datetime.now()
+    for result in mover.move_projects(projects):
+        if output.jsonl:
+            output.emit("archive", **result)
+        if result["success"]:
+            moved += 1
+            copied += result["copied_bytes"]
+            rate = result["copied_bytes"] / result["seconds"] if result["seconds"] else 0
+            print_success(f"{result['message']} ({result['files']} files, {format_bytes(result['bytes'])}, "
+                          f"{format_bytes(rate)}/s)")
+        else:
+            failed += 1
+            print_error(f"{result['project']}: {result['message']}")
+    
+    seconds = (datetime.now() - started).total_seconds()
+    print_info(f"Moved {moved} projects, {failed} failed, copied {format_bytes(copied)} in {seconds:.1f}s")
+
+
+@cli.command('dedupe-report')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--min-size', type=click.IntRange(min=1), default=64, show_default=True,
+              help='Ignore files smaller than this many KB')
+@click.option('--limit', type=click.IntRange(min=1), default=20, show_default=True,
+              help='Duplicate groups to list')
+@click.option('--hardlink', is_flag=True, help='Replace copies with hard links to the oldest file')
+def dedupe_report(path: str, min_size: int, limit: int, hardlink: bool):
+    """Find files duplicated across projects."""
+    from .dedupe import DuplicateFinder
+    from .usage import format_bytes
+    
+    finder = DuplicateFinder(Path(path) if path else None, min_size=min_size * 1024)
+    try:
+        scan = finder.scan()
+        print_info(f"Checked {scan['files']} files: {scan['size_candidates']} share a size, "
+                   f"{scan['edge_hashed']} edge-hashed, {scan['full_hashed']} fully hashed")
+        
+        by_project = finder.summary_by_project()
+        if output.jsonl:
+            for row in by_project[:limit]:
+                output.emit("duplicate_project", **row)
+            for group in islice(finder.iter_groups(), limit):
+                output.emit("duplicate_group", **group)
+            if hardlink:
+                output.emit("result", command="dedupe-report", **finder.hardlink())
+            return
+        if not by_project:
+            print_success("No duplicate files found.")
+            return
+        
+        table = Table(title="🧬 Duplicated Data by Project")
+        table.add_column("Client", style="cyan")
+        table.add_column("Project", style="cyan")
+        table.add_column("Copies", style="green", justify="right")
+        table.add_column("Wasted", style="yellow", justify="right")
+        for row in by_project[:limit]:
+            table.add_row(row["client"], row["project"], str(row["files"]), format_bytes(row["wasted"]))
+        console.print(table)
+        
+        table = Table(title=f"📄 Largest Duplicate Groups (top {limit})")
+        table.add_column("Size", style="yellow", justify="right")
+        table.add_column("Copies", style="green", justify="right")
+        table.add_column("Locations", style="cyan")
+        total_wasted = 0
+        for index, group in enumerate(finder.iter_groups()):
+            total_wasted += group["wasted"]
+            if index < limit:
+                locations = [f"{loc['client'] or '(personal)'} / {loc['project']} / {loc['category'] or '.'}"
+                             for loc in group["locations"]]
+                table.add_row(format_bytes(group["size"]), str(group["copies"]), "\n".join(locations))
+        console.print(table)
+        print_info(f"Reclaimable with hard links: {format_bytes(total_wasted)}")
+        
+        if hardlink:
+            result = finder.hardlink()
+            print_success(f"Linked {result['linked']} files, saved {format_bytes(result['saved_bytes'])}")
+            if result["skipped"]:
+                print_warning(f"Skipped {result['skipped']} files that changed or are on another volume")
+    finally:
+        finder.close()
+
+
+@cli.group()
+def proxies():
+    """Manage proxy media."""
+    pass
+
+
+@proxies.command('prune')
+@click.option('--older-than', 'older_than', help='Only projects older than this, e.g. 90d, 6m or 1y')
+@click.option('--client', 'client_name', shell_complete=complete_clients, help='Only this client\'s projects')
+@click.option('--delivered', is_flag=True, help='Only projects with files in Deliverables')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--limit', type=click.IntRange(min=1), default=20, show_default=True, help='Folders to list')
+@click.option('--commit', is_flag=True, help='Delete the proxies listed by the last dry run')
+def prune_proxies(older_than: str, client_name: str, delivered: bool, path: str, limit: int, commit: bool):
+    """Reclaim space by emptying Proxies folders (dry run unless --commit)."""
+    from .archiver import parse_age
+    from .proxies import ProxyPruner
+    from .usage import format_bytes
+    
+    pruner = ProxyPruner(Path(path) if path else None)
+    
+    if commit:
+        try:
+            result = pruner.commit()
+        except ValueError as e:
+            print_error(str(e))
+            return
+        if output.jsonl:
+            output.emit("result", command="proxies prune", **result)
+            return
+        print_success(f"Emptied {result['pruned']} Proxies folders, reclaimed {format_bytes(result['reclaimed_bytes'])}")
+        for skipped in result["skipped"]:
+            print_warning(f"Skipped (changed since the dry run): {skipped}")
+        return
+    
+    try:
+        age = parse_age(older_than) if older_than else None
+    except ValueError as e:
+        print_error(str(e))
+        return
+    
+    entries = pruner.plan(older_than=age, client=client_name, delivered=delivered)
+    if output.jsonl:
+        for entry in entries[:limit]:
+            output.emit("proxies", **entry)
+        return
+    if not entries:
+        print_info("No Proxies folders match.")
+        return
+    
+    total = sum(entry["bytes"] for entry in entries)
+    table = Table(title=f"🎞️ Reclaimable Proxies ({len(entries)} folders, {format_bytes(total)})")
+    table.add_column("Client", style="cyan")
+    table.add_column("Project", style="cyan")
+    table.add_column("Files", style="green", justify="right")
+    table.add_column("Size", style="yellow", justify="right")
+    for entry in entries[:limit]:
+        table.add_row(entry["client"] or "(personal)", entry["project"], str(entry["files"]),
+                      format_bytes(entry["bytes"]))
+    console.print(table)
+    print_info("Dry run only. Run `proxies prune --commit` to delete these files.")
+
+
+@cli.group()
+def views():
+    """Manage the symlink views of the archive."""
+    pass
+
+
+@views.command('sync')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders (views go in _views there)')
+@click.option('--full', is_flag=True, help='Re-examine every project, e.g. after adding camera folders')
+@click.option('--workers', type=click.IntRange(min=1), default=DEFAULT_WORKERS, show_default=True,
+              help='Projects to examine in parallel')
+def sync_views(path: str, full: bool, workers: int):
+    """Update the by-date, by-client and by-camera views, touching only changed projects."""
+    from .views import ViewSync
+    
+    view_sync = ViewSync(Path(path) if path else None, workers)
+    result = view_sync.sync(full=full)
+    if output.jsonl:
+        output.emit("result", command="views sync", root=view_sync.root, **result)
+        return
+    print_success(f"Views up to date: {result['changed']} of {result['projects']} projects changed, "
+                  f"{result['added']} links added, {result['removed']} removed")
+    print_info(f"Views: {view_sync.root}")
+
+
+@cli.group()
+def perms():
+    """Manage folder permissions."""
+    pass
+
+
+@perms.command('apply')
+@click.argument('project_dirs', nargs=-1, type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.option('--all', 'all_projects', is_flag=True, help='Repair every project in the archive')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders (with --all)')
+@click.option('--workers', type=click.IntRange(min=1), default=DEFAULT_WORKERS, show_default=True,
+              help='Projects to repair in parallel')
+def apply_perms(project_dirs: List[str], all_projects: bool, path: str, workers: int):
+    """Give existing project folders the configured permissions, changing only what differs."""
+    from .permissions import PermissionTemplate, repair_permissions
+    
+    if not project_dirs and not all_projects:
+        raise click.UsageError("Pass project folders or --all")
+    
+    try:
+        template = PermissionTemplate.from_config(config_manager.config)
+    except ValueError as e:
+        print_error(f"Invalid folder_permissions: {e}")
+        return
+    if not template:
+        print_warning(f"No folder permissions configured. Add folder_permissions to {config_manager.config_file}")
+        return
+    
+    project_paths = [Path(d) for d in project_dirs]
+    if all_projects:
+        from .scanner import iter_project_folders
+        project_paths.extend(project_path for _, _, _, project_path
+                             in iter_project_folders(Path(path) if path else None))
+    
+    result = repair_permissions(template, project_paths, workers)
+    if output.jsonl:
+        output.emit("result", command="perms apply", **result)
+        return
+    print_success(f"Checked {result['folders']} folders in {result['projects']} projects, "
+                  f"changed {result['changed']}")
+    for error in result["errors"][:20]:
+        print_warning(error)
+    if len(result["errors"]) > 20:
+        print_warning(f"...and {len(result['errors']) - 20} more errors")
+
+
+@cli.group()
+def catalog():
+    """Manage the project catalog."""
+    pass
+
+
+@catalog.command('import')
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+def import_catalog(path: str):
+    """Add the projects already in an archive to the catalog."""
+    from .catalog import project_catalog
+    
+    result = project_catalog.import_archive(Path(path) if path else None)
+    if output.jsonl:
+        output.emit("result", command="catalog import", **result)
+        return
+    print_success(f"Catalogued {result['projects']} projects")
+    if result["removed"]:
+        print_info(f"Removed {result['removed']} projects that are no longer on disk")
+
+
+@cli.command()
+@click.option('--path', type=click.Path(exists=True, file_okay=False, dir_okay=True),
+              help='Base path containing the PHOTO and VIDEO folders')
+@click.option('--workers', type=click.IntRange(min=1), help='Folders to list in parallel')
+def reindex(path: str, workers: int):
+    """Rebuild the project catalog from the sidecar file in each generated project."""
+    from .catalog import project_catalog
+    
+    result = project_catalog.reindex(Path(path) if path else None, workers)
+    if output.jsonl:
+        output.emit("result", command="reindex", **result)
+        return
+    print_success(f"Reindexed {result['projects']} projects from their sidecars")
+    if result["removed"]:
+        print_info(f"Removed {result['removed']} projects that are no longer on disk")
+    if result["unreadable"]:
+        print_warning(f"Skipped {result['unreadable']} projects with unreadable sidecars")
+
+
+@cli.command('bench-fixture')
+@click.argument('path', type=click.Path(file_okay=False, dir_okay=True))
+@click.option('--clients', type=click.IntRange(min=1), default=10000, show_default=True,
+              help='Clients to spread projects over')
+@click.option('--projects', type=click.IntRange(min=1), default=200000, show_default=True, help='Projects to create')
+@click.option('--seed', type=int, default=0, show_default=True, help='The same seed always builds the same archive')
+@click.option('--media-files', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Sparse dummy media files per project folder')
+@click.option('--media-size', type=click.IntRange(min=0), default=24, show_default=True,
+              help='Size of each dummy media file in MB')
+@click.option('--sidecars', is_flag=True, help='Write the project sidecar a generated project gets')
+@click.option('--workers', type=click.IntRange(min=1), help='Processes to build with (default: one per CPU)')
+def bench_fixture(path: str, clients: int, projects: int, seed: int, media_files: int, media_size: int,
+                  sidecars: bool, workers: int):
+    """Build a synthetic archive for load testing detection and scanning."""
+    from .fixtures import build_fixture
+    
+    result = build_fixture(Path(path), clients=clients, projects=projects, seed=seed, media_files=media_files,
+                           media_size=media_size * 1024 * 1024, sidecars=sidecars, workers=workers)
+    if output.jsonl:
+        output.emit("result", command="bench-fixture", **result)
+        return
+    print_success(f"Built {result['projects']} projects, {result['folders']} folders and {result['files']} "
+                  f"media files in {result['seconds']:.1f}s")
+    print_info(f"Archive: {result['path']}")
+
+
+@cli.command()
+@click.argument('name', required=False)
+@click.option('--client', 'client_name', shell_complete=complete_clients, help='Only this client\'s projects')
+@click.option('--since', type=click.DateTime(formats=['%Y-%m-%d']), help='Projects on or after this date')
+@click.option('--until', type=click.DateTime(formats=['%Y-%m-%d']), help='Projects on or before this date')
+@click.option('--type', 'project_type', type=click.Choice(['photo', 'video']), help='Only photo or video projects')
+@click.option('--limit', type=click.IntRange(min=1), default=50, show_default=True, help='Projects to show')
+def find(name: str, client_name: str, since: datetime, until: datetime, project_type: str, limit: int):
+    """Find projects in the catalog by name, client, date or type."""
+    from .catalog import project_catalog
+    
+    if until:
+        until = until.replace(hour=23, minute=59, second=59, microsecond=999999)
+    catalog_type = {"photo": "photography", "video": "videography"}.get(project_type)
+    projects = project_catalog.find(client=client_name, name=name, since=since, until=until,
+                                    project_type=catalog_type, limit=limit)
+    
+    if output.jsonl:
+        for project in projects:
+            output.emit("project", **project)
+        return
+    
+    if not projects:
+        print_info("No projects found. Run `catalog import` to add existing projects to the catalog.")
+        return
+    
+    table = Table(title=f"🔎 Projects ({len(projects)})")
+    table.add_column("Date", style="green")
+    table.add_column("Client", style="cyan")
+    table.add_column("Project", style="cyan")
+    table.add_column("Type", style="yellow")
+    table.add_column("Path", style="dim")
+    for project in projects:
+        date = project["date"].strftime("%Y-%m-%d") if project["date"] else ""
+        table.add_row(date, project["client"] or "(personal)", project["name"], project["type"], project["path"])
+    console.print(table)
+
+
 @cli.command()
 def cameras():
     """Show camera setup examples and available options."""
+    if output.jsonl:
+        output.emit("cameras", purposes=[purpose.value for purpose in CameraPurpose],
+                    cameras=config_manager.config.default_cameras)
+        return
+    
     console.print(Panel.fit("📹 Camera Setup Guide", style="bold blue"))
     
     # Show available purposes
@@ -875,6 +1726,11 @@ def config():
     """Show current configuration."""
     config = config_manager.config
     
+    if output.jsonl:
+        output.emit("config", config_file=config_manager.config_file, clients_file=config_manager.clients_file,
+                    **config.dict())
+        return
+    
     table = Table(title="⚙️ Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
@@ -882,6 +1738,8 @@ def config():
     table.add_row("Photo Folder", config.base_directories["photography"])
     table.add_row("Video Folder", config.base_directories["videography"])
     table.add_row("Assets Folder", config.base_directories["assets"])
+    for project_type, root in sorted(config.volume_roots.items()):
+        table.add_row(f"Volume Root ({project_type})", root)
     table.add_row("Client Work Subfolder", config.client_work_subfolder)
     table.add_row("Personal Work Subfolder", config.personal_work_subfolder)
     table.add_row("Date Format", config.default_options["date_format"])
@@ -2,20 +2,76 @@
 Client management for the SBP Folder Generator CLI.
 """
 
+import csv
 import json
+import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Iterator, Iterable, Tuple, TextIO
 from .models import Client
 from .config import config_manager
+from .completion import CLIENTS, write_candidates
+from .fsutil import atomic_write
+from .output import output
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; writes are still atomic, just unlocked
+    fcntl = None
+
+
+CLIENT_FILE_FORMATS = ("csv", "jsonl")
+
+CLIENT_COLUMNS = ("name", "notes", "projects", "created_date")
+
+# Separates projects within a CSV cell
+PROJECT_SEPARATOR = ";"
+
+
+def client_file_format(path: str, file_format: Optional[str] = None) -> str:
+    """Get a client file's format, from `file_format` or else from its extension."""
+    if file_format:
+        return file_format
+    suffix = Path(path).suffix.lower().lstrip('.')
+    if suffix in ("jsonl", "ndjson"):
+        return "jsonl"
+    if suffix == "csv":
+        return "csv"
+    raise ValueError(f"Can't tell the format of '{path}', pass --format csv or jsonl")
+
+
+def read_client_records(stream: TextIO, file_format: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Read (line number, record) pairs from a CSV or JSON-lines client file."""
+    if file_format == "csv":
+        for line_number, row in enumerate(csv.DictReader(stream), start=2):
+            row = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+            projects = [p.strip() for p in row.get("projects", "").split(PROJECT_SEPARATOR) if p.strip()]
+            yield line_number, {"name": row.get("name") or row.get("client"), "notes": row.get("notes"),
+                                "projects": projects, "created_date": row.get("created_date")}
+    elif file_format == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {line_number}: {e}") from e
+            yield line_number, record if isinstance(record, dict) else {}
+    else:
+        raise ValueError(f"Unsupported client file format: {file_format}")
 
 
 class ClientManager:
     """Manages client information and operations."""
     
-    def __init__(self):
-        self.clients_file = config_manager.clients_file
+    def __init__(self, clients_file: Optional[Path] = None):
+        self.clients_file = clients_file or config_manager.clients_file
+        self.lock_file = self.clients_file.with_name(self.clients_file.name + ".lock")
         self._clients: Optional[Dict[str, Client]] = None
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._batch_depth = 0
     
     @property
     def clients(self) -> Dict[str, Client]:
@@ -26,7 +82,91 @@ class ClientManager:
     
     def load_clients(self) -> Dict[str, Client]:
         """Load clients from file."""
-        self._clients = {}
+        self._clients = self._read_clients_file()
+        self._dirty.clear()
+        self._deleted.clear()
+        return self._clients
+    
+    def save_clients(self) -> None:
+        """Save clients to file, merging with changes made by other writers."""
+        if self._clients is None:
+            return
+        
+        with self._locked():
+            # A damaged file must not be replaced by only this process's changes
+            on_disk = self._read_clients_file(strict=True)
+            
+            for name in self._deleted:
+                on_disk.pop(name, None)
+            for name in self._dirty:
+                if name in self._clients:
+                    on_disk[name] = self._merge_client(on_disk.get(name), self._clients[name])
+            
+            self._write_clients_file(on_disk)
+        
+        self._clients = on_disk
+        self._dirty.clear()
+        self._deleted.clear()
+    
+    @contextmanager
+    def batch(self) -> Iterator["ClientManager"]:
+        """Coalesce every change made inside the block into a single write."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and (self._dirty or self._deleted):
+                self.save_clients()
+    
+    def _changed(self, name: str, deleted: bool = False) -> None:
+        """Record a changed client and write it out unless a batch is open."""
+        if deleted:
+            self._dirty.discard(name)
+            self._deleted.add(name)
+        else:
+            self._deleted.discard(name)
+            self._dirty.add(name)
+        
+        if self._batch_depth == 0:
+            self.save_clients()
+    
+    @staticmethod
+    def _merge_client(theirs: Optional[Client], ours: Client) -> Client:
+        """Merge our copy of a client record into the one on disk."""
+        if theirs is None:
+            return ours
+        
+        # Projects are only ever appended, so keep everyone's
+        projects = list(theirs.projects)
+        projects.extend(p for p in ours.projects if p not in projects)
+        
+        client_data = ours.dict()
+        client_data['projects'] = projects
+        client_data['created_date'] = min(theirs.created_date, ours.created_date)
+        return Client(**client_data)
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the clients database."""
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self.lock_file, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    
+    def _read_clients_file(self, strict: bool = False) -> Dict[str, Client]:
+        """Read the clients file, setting aside a damaged file instead of losing it.
+        
+        A damaged file reads as empty with a warning, or with strict raises
+        ValueError so nothing is saved over it.
+        """
+        clients = {}
         
         if self.clients_file.exists():
             try:
@@ -38,30 +178,46 @@ class ClientManager:
                     if 'created_date' in data and isinstance(data['created_date'], str):
                         data['created_date'] = datetime.fromisoformat(data['created_date'])
                     
-                    self._clients[name] = Client(**data)
-            except (json.JSONDecodeError, ValueError) as e:
-                # If file is corrupted, start fresh
-                print(f"Warning: Could not load clients file: {e}")
-                self._clients = {}
+                    clients[name] = Client(**data)
+            except (json.JSONDecodeError, ValueError, AttributeError, TypeError) as e:
+                backup = self._back_up_damaged_file()
+                if strict:
+                    raise ValueError(f"Clients file {self.clients_file} can't be read ({e}), not saving over it; "
+                                     f"a copy is kept at {backup}") from e
+                output.warn(f"Could not load clients file: {e}")
+                output.warn(f"The unreadable file was kept at {backup}")
+                clients = {}
         
-        return self._clients
+        return clients
     
-    def save_clients(self) -> None:
-        """Save clients to file."""
-        if self._clients is None:
-            return
-        
+    def _back_up_damaged_file(self) -> Path:
+        """Copy a damaged clients file aside once, named after its mtime so rereading it adds no copies."""
+        modified = datetime.fromtimestamp(self.clients_file.stat().st_mtime)
+        backup = self.clients_file.with_name(f"{self.clients_file.name}.corrupt-{modified.strftime('%Y%m%d-%H%M%S')}")
+        if not backup.exists():
+            shutil.copy2(self.clients_file, backup)
+        return backup
+    
+    def _write_clients_file(self, clients: Dict[str, Client]) -> None:
+        """Write clients through a temporary file and rename it into place."""
         # Convert to serializable format
         clients_data = {}
-        for name, client in self._clients.items():
+        for name, client in clients.items():
             client_dict = client.dict()
             # Convert datetime to string for JSON serialization
             if isinstance(client_dict['created_date'], datetime):
                 client_dict['created_date'] = client_dict['created_date'].isoformat()
             clients_data[name] = client_dict
         
-        with open(self.clients_file, 'w', encoding='utf-8') as f:
+        with atomic_write(self.clients_file, durable=True) as f:
             json.dump(clients_data, f, indent=2, default=str)
+        
+        # Keep the shell completion cache in step; it is rebuilt on demand if this fails
+        if self.clients_file == config_manager.clients_file:
+            try:
+                write_candidates(CLIENTS, clients.keys())
+            except OSError:
+                pass
     
     def add_client(self, name: str, notes: Optional[str] = None) -> Client:
         """Add a new client."""
@@ -70,7 +226,7 @@ class ClientManager:
         
         client = Client(name=name, notes=notes)
         self._clients[name] = client
-        self.save_clients()
+        self._changed(name)
         
         return client
     
@@ -91,7 +247,7 @@ class ClientManager:
         client_data.update(updates)
         
         self._clients[name] = Client(**client_data)
-        self.save_clients()
+        self._changed(name)
         
         return self._clients[name]
     
@@ -101,7 +257,21 @@ class ClientManager:
             return False
         
         del self._clients[name]
-        self.save_clients()
+        self._changed(name, deleted=True)
+        return True
+    
+    def rename_client(self, old_name: str, new_name: str) -> bool:
+        """Rename a client, keeping its projects and notes."""
+        if old_name not in self.clients or new_name in self.clients:
+            return False
+        
+        client_data = self._clients.pop(old_name).dict()
+        client_data['name'] = new_name
+        self._clients[new_name] = Client(**client_data)
+        with self.batch():
+            self._changed(old_name, deleted=True)
+            self._changed(new_name)
+        
         return True
     
     def add_project_to_client(self, client_name: str, project_name: str) -> bool:
@@ -112,10 +282,84 @@ class ClientManager:
         
         if project_name not in client.projects:
             client.projects.append(project_name)
-            self.save_clients()
+            self._changed(client_name)
         
         return True
     
+    def import_clients(self, records: Iterable[Tuple[int, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Add or merge many (line number, record) pairs with a single write.
+        
+        Names are matched ignoring case, against each other and the existing
+        clients. Merged records keep every project and note and the earliest
+        creation date. Invalid records are skipped and reported by line.
+        """
+        result = {"added": 0, "merged": 0, "invalid": []}
+        staged: Dict[str, Client] = {}
+        for line_number, record in records:
+            try:
+                client = Client(name=str(record.get("name") or ""), notes=record.get("notes") or None,
+                                projects=record.get("projects") or [],
+                                created_date=record.get("created_date") or datetime.now())
+                key = client.name.casefold()
+                staged[key] = self._merge_import(staged.get(key), client)
+            except (ValueError, TypeError) as e:
+                errors = e.errors() if hasattr(e, "errors") else []
+                message = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in errors)
+                result["invalid"].append((line_number, message or str(e)))
+        
+        existing = {name.casefold(): name for name in self.clients}
+        with self.batch():
+            for key, client in staged.items():
+                name = existing.get(key)
+                if name is None:
+                    self._clients[client.name] = client
+                    self._changed(client.name)
+                    result["added"] += 1
+                    continue
+                merged = self._merge_import(self._clients[name], client)
+                if merged is not self._clients[name]:
+                    self._clients[name] = merged
+                    self._changed(name)
+                result["merged"] += 1
+        
+        return result
+    
+    @staticmethod
+    def _merge_import(ours: Optional[Client], theirs: Client) -> Client:
+        """Merge an imported record into a client, keeping our name; returns `ours` if nothing is new."""
+        if ours is None:
+            return theirs
+        
+        known = set(ours.projects)
+        new_projects = [p for p in theirs.projects if p not in known]
+        
+        notes = ours.notes
+        if theirs.notes and theirs.notes not in (notes or ""):
+            notes = f"{notes}\n{theirs.notes}" if notes else theirs.notes
+        
+        created_date = min(ours.created_date, theirs.created_date)
+        if not new_projects and notes == ours.notes and created_date == ours.created_date:
+            return ours
+        return Client(name=ours.name, notes=notes, projects=ours.projects + new_projects, created_date=created_date)
+    
+    def export_clients(self, stream: TextIO, file_format: str) -> int:
+        """Write every client to a CSV or JSON-lines stream."""
+        if file_format not in CLIENT_FILE_FORMATS:
+            raise ValueError(f"Unsupported client file format: {file_format}")
+        
+        writer = csv.writer(stream) if file_format == "csv" else None
+        if writer:
+            writer.writerow(CLIENT_COLUMNS)
+        for client in sorted(self.clients.values(), key=lambda c: c.name.casefold()):
+            created_date = client.created_date.isoformat()
+            if writer:
+                writer.writerow([client.name, client.notes or "", PROJECT_SEPARATOR.join(client.projects),
+                                 created_date])
+            else:
+                stream.write(json.dumps({"name": client.name, "notes": client.notes, "projects": client.projects,
+                                         "created_date": created_date}, ensure_ascii=False) + "\n")
+        return len(self.clients)
+    
     def search_clients(self, query: str) -> List[str]:
         """Search for clients by name (case-insensitive)."""
         query_lower = query.lower()
@@ -0,0 +1,121 @@
+"""
+Starter file cloning for the SBP Folder Generator CLI.
+
+Templates can give every new project starter files from the Assets &
+Resources tree: LUTs, presets, blank edit projects or a brief. Instead of
+copying them into each project, files are cloned with a reflink (the
+FICLONE ioctl on Btrfs, XFS, bcachefs and similar), which shares the data
+until either side changes. Where reflinks aren't supported they are
+copied, except files the template marks immutable (LUTs, presets, stock
+media), which are hard linked: a hard link is the asset itself, so editing
+it in place would change the original for every project.
+"""
+
+import errno
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Set, Tuple
+
+
+# From linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+COPY = "copy"
+
+# Errors meaning a method can't work between two volumes, rather than a problem with one file
+UNSUPPORTED_ERRORS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EPERM,
+                      errno.EMLINK}
+
+
+def starter_file(entry: Any) -> Tuple[str, bool]:
+    """Get (asset path, immutable) for a template's ``files`` entry.
+    
+    An entry is an asset path, or ``{"source": path, "immutable": true}``
+    for assets that projects only read and may therefore share a hard link.
+    """
+    if isinstance(entry, str):
+        return entry, False
+    return entry["source"], bool(entry.get("immutable", False))
+
+
+def iter_source_files(source: Path, destination: Path) -> Iterator[Tuple[Path, Path]]:
+    """Yield (source file, destination) pairs for a file, or for every file below a folder."""
+    if source.is_file():
+        yield source, destination
+        return
+    if not source.is_dir():
+        raise ValueError(f"Starter file not found in assets: {source}")
+    for folder, dirs, files in os.walk(source):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        relative = Path(folder).relative_to(source)
+        for name in sorted(files):
+            if not name.startswith('.'):
+                yield Path(folder) / name, destination / relative / name
+
+
+class FileCloner:
+    """Clones files by the cheapest method that works between their volumes."""
+    
+    def __init__(self):
+        # (method, source device, destination device) pairs known not to work
+        self._unsupported: Set[Tuple[str, int, int]] = set()
+        self._lock = threading.Lock()
+    
+    def clone(self, source: Path, destination: Path, immutable: bool = False) -> Tuple[str, int]:
+        """Clone a file to a new destination; returns the method used and the bytes it saved.
+        
+        Only an `immutable` file may be hard linked, as edits to a hard link
+        change the source too.
+        """
+        source_stat = os.stat(source)
+        devices = (source_stat.st_dev, os.stat(destination.parent).st_dev)
+        
+        methods = [(REFLINK, self._reflink)]
+        if immutable:
+            methods.append((HARDLINK, self._hardlink))
+        for method, attempt in methods:
+            if (method, *devices) in self._unsupported:
+                continue
+            try:
+                attempt(source, destination)
+                return method, source_stat.st_size
+            except FileExistsError:
+                raise
+            except OSError as e:
+                if e.errno not in UNSUPPORTED_ERRORS:
+                    raise
+                with self._lock:
+                    self._unsupported.add((method, *devices))
+        
+        with open(source, 'rb') as src, open(destination, 'xb') as dst:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(source, destination)
+        return COPY, 0
+    
+    def _reflink(self, source: Path, destination: Path) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            raise OSError(errno.ENOSYS, "Reflinks are not supported on this platform")
+        
+        with open(source, 'rb') as src:
+            fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                fcntl.ioctl(fd, FICLONE, src.fileno())
+            except OSError:
+                os.close(fd)
+                os.unlink(destination)
+                raise
+            os.close(fd)
+        shutil.copystat(source, destination)
+    
+    def _hardlink(self, source: Path, destination: Path) -> None:
+        os.link(source, destination)
+
+
+# Global cloner instance
+file_cloner = FileCloner()
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Shell completion for the SBP Folder Generator CLI.
+
+Click answers completions by running the whole CLI, which imports rich,
+questionary and pydantic and loads every client on each keypress. Client
+names, camera names and camera purposes are instead kept in small cache
+files, rewritten whenever the clients database or the configuration is
+saved, and ``main`` answers completions for them from those files before
+anything heavy is imported. Everything else falls through to click.
+
+This module must stay importable with the standard library alone.
+"""
+
+import os
+import sys
+from typing import Iterable, List, Optional, Tuple
+from .fsutil import atomic_write
+
+
+# Must match ConfigManager.config_dir / cache_dir
+CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".sbp-generator")
+CACHE_DIR = os.path.join(CONFIG_DIR, "cache", "completion")
+
+COMPLETE_VAR = "_SBP_GEN_COMPLETE"
+
+# Cache files and the file each one is derived from
+CLIENTS = "clients"
+CAMERAS = "cameras"
+PURPOSES = "purposes"
+SOURCES = {
+    CLIENTS: os.path.join(CONFIG_DIR, "data", "clients.json"),
+    CAMERAS: os.path.join(CONFIG_DIR, "config.json"),
+    PURPOSES: os.path.join(CONFIG_DIR, "config.json"),
+}
+
+CLIENT_OPTIONS = ("--client",)
+CAMERAS_OPTION = "--cameras"
+
+
+def write_candidates(kind: str, values: Iterable[str], cache_dir: Optional[str] = None) -> None:
+    """Replace one cache file with the given values, one per line."""
+    cache_dir = cache_dir or CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, kind)
+    with atomic_write(path) as f:
+        f.write("\n".join(sorted(set(v for v in values if v and "\n" not in v), key=str.casefold)))
+
+
+def read_candidates(kind: str, cache_dir: Optional[str] = None) -> Optional[List[str]]:
+    """Read one cache file, or None if it is missing or older than the file it came from."""
+    path = os.path.join(cache_dir or CACHE_DIR, kind)
+    try:
+        cached = os.stat(path).st_mtime_ns
+        with open(path, 'r', encoding='utf-8') as f:
+            values = f.read().split("\n")
+    except OSError:
+        return None
+    
+    if cache_dir is None:
+        try:
+            if os.stat(SOURCES[kind]).st_mtime_ns > cached:
+                return None
+        except OSError:
+            pass
+    return [v for v in values if v]
+
+
+def matching(values: Iterable[str], incomplete: str) -> List[str]:
+    """Get the values starting with `incomplete`, ignoring case."""
+    prefix = incomplete.casefold()
+    return [v for v in values if v.casefold().startswith(prefix)]
+
+
+def camera_candidates(incomplete: str, purposes: List[str], cameras: List[str]) -> List[str]:
+    """Complete the last entry of a purpose:camera list such as 'main:lumix,BTS:'."""
+    done, _, current = incomplete.rpartition(",")
+    done = f"{done}," if done else ""
+    if ":" not in current:
+        return [f"{done}{purpose}:" for purpose in matching(purposes, current)]
+    purpose, _, camera = current.partition(":")
+    return [f"{done}{purpose}:{name}" for name in matching(cameras, camera)]
+
+
+def refresh_cache(cache_dir: Optional[str] = None) -> None:
+    """Rebuild every cache file from the clients database and configuration."""
+    from .client_manager import client_manager
+    from .config import config_manager
+    from .models import CameraPurpose
+    
+    write_candidates(CLIENTS, client_manager.list_clients(), cache_dir)
+    write_candidates(CAMERAS, [cam["name"] for cam in config_manager.config.default_cameras], cache_dir)
+    write_candidates(PURPOSES, [purpose.value for purpose in CameraPurpose], cache_dir)
+
+
+def cached_candidates(kind: str) -> List[str]:
+    """Read a cache file, rebuilding the cache first if it is stale."""
+    values = read_candidates(kind)
+    if values is None:
+        refresh_cache()
+        values = read_candidates(kind) or []
+    return values
+
+
+def fast_complete(args: List[str], incomplete: str, cache_dir: Optional[str] = None) -> Optional[List[str]]:
+    """Answer a completion from the cache files, or None to leave it to click."""
+    previous = args[-1] if args else None
+    if previous in CLIENT_OPTIONS:
+        clients = read_candidates(CLIENTS, cache_dir)
+        return None if clients is None else matching(clients, incomplete)
+    
+    if previous == CAMERAS_OPTION:
+        purposes = read_candidates(PURPOSES, cache_dir)
+        cameras = read_candidates(CAMERAS, cache_dir)
+        if purposes is None or cameras is None:
+            return None
+        return camera_candidates(incomplete, purposes, cameras)
+    
+    if args[-2:] == ["clients", "remove"] and not incomplete.startswith("-"):
+        clients = read_candidates(CLIENTS, cache_dir)
+        return None if clients is None else matching(clients, incomplete)
+    
+    return None
+
+
+def _split(line: str) -> List[str]:
+    """Split a command line like click does, keeping an unterminated last word."""
+    import shlex
+    lexer = shlex.shlex(line, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words = []
+    try:
+        for word in lexer:
+            words.append(word)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _completion_args(shell: str) -> Tuple[List[str], str]:
+    """Get the words before the cursor and the word being completed, as click's shell classes do."""
+    words = _split(os.environ["COMP_WORDS"])
+    if shell == "fish":
+        incomplete = os.environ["COMP_CWORD"]
+        incomplete = _split(incomplete)[0] if incomplete else ""
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+    
+    cword = int(os.environ["COMP_CWORD"])
+    return words[1:cword], words[cword] if cword < len(words) else ""
+
+
+def _format(shell: str, value: str) -> str:
+    if shell == "zsh":
+        return f"plain\n{value}\n_"
+    return f"plain,{value}"
+
+
+def main():
+    """Entry point: answer cached completions directly, otherwise run the full CLI."""
+    instruction = os.environ.get(COMPLETE_VAR, "")
+    shell, _, action = instruction.partition("_")
+    if action == "complete" and shell in ("bash", "zsh", "fish"):
+        try:
+            values = fast_complete(*_completion_args(shell))
+        except (KeyError, ValueError, IndexError):
+            values = None
+        if values is not None:
+            sys.stdout.write("\n".join(_format(shell, value) for value in values) + "\n")
+            sys.stdout.flush()
+            sys.exit(0)
+    
+    from .cli import main as cli_main
+    cli_main()
\ No newline at end of file
@@ -6,7 +6,8 @@ import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-from .models import AppConfig
+from .models import AppConfig, CameraPurpose
+from .completion import CAMERAS, PURPOSES, write_candidates
 
 
 class ConfigManager:
@@ -17,6 +18,8 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.json"
         self.data_dir = self.config_dir / "data"
         self.clients_file = self.data_dir / "clients.json"
+        self.templates_dir = self.config_dir / "templates"
+        self.cache_dir = self.config_dir / "cache"
         self._config: Optional[AppConfig] = None
         
         # Ensure directories exist
@@ -49,6 +52,13 @@ class ConfigManager:
             
         with open(self.config_file, 'w', encoding='utf-8') as f:
             json.dump(self._config.dict(), f, indent=2, default=str)
+        
+        # Keep the shell completion cache in step; it is rebuilt on demand if this fails
+        try:
+            write_candidates(CAMERAS, [cam["name"] for cam in self._config.default_cameras])
+            write_candidates(PURPOSES, [purpose.value for purpose in CameraPurpose])
+        except OSError:
+            pass
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration with new values."""
@@ -61,11 +71,14 @@ class ConfigManager:
         self._config = AppConfig(**current_data)
         self.save_config()
     
+    def get_volume_root(self, project_type: str = None) -> Path:
+        """Get the folder holding a base directory: its configured volume root, else the cwd."""
+        root = self.config.volume_roots.get(project_type) if project_type else None
+        return Path(root).expanduser() if root else Path.cwd()
+    
     def get_base_path(self, project_type: str = None) -> Path:
         """Get base path for projects, optionally for specific type."""
-        # For now, return current working directory
-        # This can be configured later to use a specific base path
-        base = Path.cwd()
+        base = self.get_volume_root(project_type)
         
         if project_type:
             type_folder = self.config.base_directories.get(project_type, project_type)
@@ -0,0 +1,301 @@
+"""
+Duplicate file detection for the SBP Folder Generator CLI.
+
+Finds files copied between projects in three stages, each only looking at
+the survivors of the one before: files of the same size, then files whose
+first and last blocks hash the same, then a full hash. File records and
+hashes live in a SQLite database rather than in memory, and hashes are kept
+between runs for files whose size and mtime haven't changed.
+"""
+
+import hashlib
+import os
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS, walk_tree
+from .scanner import iter_project_folders
+
+
+# Bytes hashed from each end of a file in the quick stage
+EDGE_BLOCK = 64 * 1024
+
+HASH_CHUNK = 1024 * 1024
+
+DEFAULT_MIN_SIZE = 64 * 1024
+
+# Paths handed to the process pool at a time, so memory doesn't grow with the archive
+HASH_BATCH = 2000
+
+# Project listings in flight per listing worker
+LIST_WINDOW = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY, type TEXT, client TEXT, name TEXT, path TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, project_id INTEGER, size INTEGER, mtime_ns INTEGER,
+    dev INTEGER, ino INTEGER, edge_hash TEXT, full_hash TEXT, seen INTEGER
+);
+CREATE INDEX IF NOT EXISTS files_size ON files (size);
+CREATE INDEX IF NOT EXISTS files_edge ON files (size, edge_hash);
+CREATE INDEX IF NOT EXISTS files_full ON files (full_hash);
+CREATE INDEX IF NOT EXISTS files_inode ON files (dev, ino);
+"""
+
+
+def edge_hash(path: str, size: int) -> Tuple[str, Optional[str], Optional[str]]:
+    """Hash the first and last blocks of a file; small files are hashed whole."""
+    try:
+        with open(path, 'rb') as f:
+            if size <= 2 * EDGE_BLOCK:
+                digest = hashlib.blake2b(f.read()).hexdigest()
+                return path, digest, digest
+            digest = hashlib.blake2b(f.read(EDGE_BLOCK))
+            f.seek(size - EDGE_BLOCK)
+            digest.update(f.read(EDGE_BLOCK))
+            return path, digest.hexdigest(), None
+    except OSError:
+        return path, None, None
+
+
+def full_hash(path: str) -> Tuple[str, Optional[str]]:
+    """Hash a whole file."""
+    digest = hashlib.blake2b()
+    buffer = bytearray(HASH_CHUNK)
+    view = memoryview(buffer)
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+                digest.update(view[:count])
+    except OSError:
+        return path, None
+    return path, digest.hexdigest()
+
+
+def _list_files(project_path: Path) -> List[Tuple[str, int, int, int, int]]:
+    """List (path, size, mtime_ns, dev, ino) for every regular file in a project."""
+    files = []
+    for entry, _ in walk_tree(project_path):
+        try:
+            if entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                files.append((entry.path, stat.st_size, stat.st_mtime_ns, stat.st_dev, stat.st_ino))
+        except OSError:
+            continue
+    return files
+
+
+def _iter_file_lists(projects: Iterable[Tuple], workers: int) -> Iterator[Tuple[Tuple, List[Tuple]]]:
+    """List projects' files in parallel, in order, holding only a bounded window of listings at once."""
+    window = workers * LIST_WINDOW
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for project in projects:
+            pending.append((project, pool.submit(_list_files, project[3])))
+            if len(pending) >= window:
+                project, future = pending.popleft()
+                yield project, future.result()
+        while pending:
+            project, future = pending.popleft()
+            yield project, future.result()
+
+
+def _batches(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class DuplicateFinder:
+    """Finds duplicate files across every project in an archive."""
+    
+    def __init__(self, base_path: Optional[Path] = None, db_file: Optional[Path] = None,
+                 min_size: int = DEFAULT_MIN_SIZE, workers: Optional[int] = None):
+        # Without an explicit base path each type folder is found on its own volume
+        self.base_path = Path(os.path.abspath(str(base_path))) if base_path else None
+        self.db_file = db_file or config_manager.cache_dir / "dedupe.db"
+        self.min_size = max(1, min_size)
+        self.workers = workers or os.cpu_count() or 1
+        self.stats = {"files": 0, "size_candidates": 0, "edge_hashed": 0, "full_hashed": 0}
+        
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.db_file))
+        self.db.executescript(SCHEMA)
+    
+    def close(self) -> None:
+        self.db.close()
+    
+    def scan(self) -> Dict[str, int]:
+        """Record every project file, then narrow duplicates down by size, edge hash and full hash."""
+        self._record_files()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            self._hash_edges(pool)
+            self._hash_full(pool)
+        return self.stats
+    
+    def _record_files(self) -> None:
+        db = self.db
+        run = (db.execute("SELECT COALESCE(MAX(seen), 0) FROM files").fetchone()[0] or 0) + 1
+        
+        with db:
+            for (project_type, client, _, project_path), files in _iter_file_lists(
+                    iter_project_folders(self.base_path), DEFAULT_WORKERS):
+                db.execute("INSERT OR IGNORE INTO projects (type, client, name, path) VALUES (?, ?, ?, ?)",
+                           (project_type, client, project_path.name, str(project_path)))
+                project_id = db.execute("SELECT id FROM projects WHERE path = ?",
+                                        (str(project_path),)).fetchone()[0]
+                
+                files = [f for f in files if f[1] >= self.min_size]
+                self.stats["files"] += len(files)
+                # Hashes survive only while the file's size and mtime are unchanged
+                db.executemany(
+                    "INSERT INTO files (path, project_id, size, mtime_ns, dev, ino, seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET "
+                    "project_id = excluded.project_id, dev = excluded.dev, ino = excluded.ino, "
+                    "seen = excluded.seen, "
+                    "edge_hash = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                    "THEN edge_hash END, "
+                    "full_hash = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                    "THEN full_hash END, "
+                    "size = excluded.size, mtime_ns = excluded.mtime_ns",
+                    ((path, project_id, size, mtime_ns, dev, ino, run)
+                     for path, size, mtime_ns, dev, ino in files))
+            
+            db.execute("DELETE FROM files WHERE seen != ?", (run,))
+            db.execute("DELETE FROM projects WHERE id NOT IN (SELECT DISTINCT project_id FROM files)")
+            # Hard links share their contents, so a hash known for one path holds for all of them
+            for column in ("edge_hash", "full_hash"):
+                db.execute(f"UPDATE files SET {column} = (SELECT o.{column} FROM files o WHERE o.dev = files.dev "
+                           f"AND o.ino = files.ino AND o.{column} IS NOT NULL) WHERE {column} IS NULL")
+    
+    def _hash_edges(self, pool: ProcessPoolExecutor) -> None:
+        self.stats["size_candidates"] = self.db.execute(
+            "SELECT COUNT(*) FROM files WHERE size IN "
+            "(SELECT size FROM files GROUP BY size HAVING COUNT(DISTINCT dev || ':' || ino) > 1)").fetchone()[0]
+        # One path per inode; the list is drained before the updates below touch the table
+        rows = self.db.execute(
+            "SELECT MIN(path), size, dev, ino FROM files WHERE edge_hash IS NULL AND size IN "
+            "(SELECT size FROM files GROUP BY size HAVING COUNT(DISTINCT dev || ':' || ino) > 1) "
+            "GROUP BY dev, ino").fetchall()
+        self._hash_rows(pool, rows, edge_hash,
+                        "UPDATE files SET edge_hash = ?, full_hash = COALESCE(?, full_hash) "
+                        "WHERE dev = ? AND ino = ?", "edge_hashed")
+    
+    def _hash_full(self, pool: ProcessPoolExecutor) -> None:
+        rows = self.db.execute(
+            "SELECT MIN(f.path), f.size, f.dev, f.ino FROM files f JOIN "
+            "(SELECT size, edge_hash FROM files WHERE edge_hash IS NOT NULL GROUP BY size, edge_hash "
+            "HAVING COUNT(DISTINCT dev || ':' || ino) > 1) g "
+            "ON f.size = g.size AND f.edge_hash = g.edge_hash "
+            "WHERE f.full_hash IS NULL GROUP BY f.dev, f.ino").fetchall()
+        self._hash_rows(pool, rows, full_hash,
+                        "UPDATE files SET full_hash = ? WHERE dev = ? AND ino = ?", "full_hashed")
+    
+    def _hash_rows(self, pool: ProcessPoolExecutor, rows: List[Tuple[str, int, int, int]], worker,
+                   update: str, stat_key: str) -> None:
+        """Hash rows in bounded batches and store each result for every path sharing the inode."""
+        for batch in _batches(rows, HASH_BATCH):
+            inodes = {path: (dev, ino) for path, _, dev, ino in batch}
+            if worker is full_hash:
+                results = pool.map(full_hash, [row[0] for row in batch], chunksize=16)
+            else:
+                results = pool.map(edge_hash, [row[0] for row in batch], [row[1] for row in batch], chunksize=64)
+            with self.db:
+                for path, *digests in results:
+                    if digests[0] is not None:
+                        self.db.execute(update, (*digests, *inodes[path]))
+            self.stats[stat_key] += len(batch)
+    
+    def iter_groups(self) -> Iterator[Dict[str, Any]]:
+        """Yield duplicate groups, largest waste first, with the project of every copy."""
+        groups = self.db.execute(
+            "SELECT full_hash, size, COUNT(DISTINCT dev || ':' || ino) AS copies FROM files "
+            "WHERE full_hash IS NOT NULL GROUP BY full_hash, size HAVING copies > 1 "
+            "ORDER BY size * (copies - 1) DESC")
+        
+        for digest, size, copies in groups:
+            locations = []
+            for path, client, project, project_path, dev, ino, mtime_ns in self.db.execute(
+                    "SELECT f.path, p.client, p.name, p.path, f.dev, f.ino, f.mtime_ns FROM files f "
+                    "JOIN projects p ON p.id = f.project_id WHERE f.full_hash = ? AND f.size = ? "
+                    "ORDER BY f.mtime_ns, f.path", (digest, size)):
+                relative = Path(path).relative_to(project_path)
+                locations.append({"path": Path(path), "client": client, "project": project,
+                                  "category": relative.parts[0] if len(relative.parts) > 1 else "",
+                                  "inode": (dev, ino), "mtime_ns": mtime_ns})
+            yield {"hash": digest, "size": size, "copies": copies, "wasted": size * (copies - 1),
+                   "locations": locations}
+    
+    def summary_by_project(self) -> List[Dict[str, Any]]:
+        """Total duplicated bytes per client and project (every copy after the oldest counts)."""
+        totals: Dict[Tuple, Dict[str, Any]] = {}
+        for group in self.iter_groups():
+            seen_inodes = {group["locations"][0]["inode"]}
+            for location in group["locations"][1:]:
+                if location["inode"] in seen_inodes:
+                    continue
+                seen_inodes.add(location["inode"])
+                key = (location["client"] or "(personal)", location["project"])
+                row = totals.setdefault(key, {"client": key[0], "project": key[1], "files": 0, "wasted": 0})
+                row["files"] += 1
+                row["wasted"] += group["size"]
+        return sorted(totals.values(), key=lambda r: r["wasted"], reverse=True)
+    
+    def hardlink(self) -> Dict[str, int]:
+        """Replace every copy with a hard link to the oldest one in its group."""
+        result = {"linked": 0, "skipped": 0, "saved_bytes": 0}
+        for group in self.iter_groups():
+            keep = group["locations"][0]
+            if not _unchanged(keep["path"], group["size"], keep["mtime_ns"]):
+                # Linking to a kept file edited since hashing would replace every copy with other content
+                result["skipped"] += len({location["inode"] for location in group["locations"]}) - 1
+                continue
+            linked_inodes = {keep["inode"]}
+            for location in group["locations"][1:]:
+                if location["inode"] in linked_inodes:
+                    continue
+                if _replace_with_link(keep["path"], location, group["size"]):
+                    linked_inodes.add(location["inode"])
+                    result["linked"] += 1
+                    result["saved_bytes"] += group["size"]
+                else:
+                    result["skipped"] += 1
+        return result
+
+
+def _unchanged(path: Path, size: int, mtime_ns: int) -> bool:
+    """Check that a file still has the size and mtime it was hashed with."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns)
+
+
+def _replace_with_link(original: Path, location: Dict[str, Any], size: int) -> bool:
+    """Swap a duplicate for a hard link, unless it changed since it was hashed or is on another volume."""
+    path = location["path"]
+    try:
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (size, location["mtime_ns"]):
+            return False
+        if stat.st_dev != original.stat().st_dev:
+            return False
+        temporary = path.with_name(f".{path.name}.sbp-link")
+        os.link(original, temporary)
+        os.replace(temporary, path)
+    except OSError:
+        return False
+    return True
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Directory index for the SBP Folder Generator CLI.
+
+The index is a snapshot of the client and project folders found under each
+"Client Work" folder. It is kept current by ``sbp-gen watch`` so that other
+commands can look up client folders without scanning the share.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from .config import config_manager
+from .fsutil import atomic_write
+
+
+class DirectoryIndex:
+    """Client and project folders under every watched Client Work folder."""
+    
+    def __init__(self, index_file: Optional[Path] = None):
+        self.index_file = index_file or config_manager.data_dir / "directory_index.json"
+        self._data: Optional[Dict] = None
+    
+    @property
+    def data(self) -> Dict:
+        """Get index data, loading from file if needed."""
+        if self._data is None:
+            self.load()
+        return self._data
+    
+    def load(self) -> Dict:
+        """Load the index from file."""
+        self._data = {"watcher_pid": None, "updated_at": None, "client_work": {}}
+        
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self._data.update(json.load(f))
+            except (json.JSONDecodeError, ValueError, OSError):
+                # A damaged index is only a cache, rebuild it on the next watch
+                self._data["client_work"] = {}
+        
+        return self._data
+    
+    def save(self) -> None:
+        """Save the index atomically so readers never see a partial file."""
+        if self._data is None:
+            return
+        
+        self._data["updated_at"] = datetime.now().isoformat()
+        with atomic_write(self.index_file) as f:
+            json.dump(self._data, f)
+    
+    def is_live(self) -> bool:
+        """Check whether a watcher is currently keeping the index up to date."""
+        pid = self.data.get("watcher_pid")
+        if not pid:
+            return False
+        
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # The process exists but belongs to another user
+            return True
+        except OSError:
+            return False
+        return True
+    
+    def get_clients(self, client_work_path: Path) -> Optional[List[str]]:
+        """Get indexed client folders, or None if the folder isn't indexed by a live watcher."""
+        if not self.is_live():
+            return None
+        
+        clients = self.data["client_work"].get(_key(client_work_path))
+        if clients is None:
+            return None
+        return sorted(clients.keys())
+    
+    def has_client_folder(self, client_work_path: Path, client_name: str) -> Optional[bool]:
+        """Check for a client folder, or return None if the index can't answer."""
+        clients = self.get_clients(client_work_path)
+        if clients is None:
+            return None
+        return client_name in clients
+    
+    # Mutations used by the watcher
+    
+    def set_client_work(self, client_work_path: Path, clients: Dict[str, List[str]]) -> None:
+        """Replace everything known about a Client Work folder."""
+        self.data["client_work"][_key(client_work_path)] = clients
+    
+    def drop_client_work(self, client_work_path: Path) -> None:
+        """Forget a Client Work folder."""
+        self.data["client_work"].pop(_key(client_work_path), None)
+    
+    def add_client(self, client_work_path: Path, client_name: str, projects: List[str] = None) -> None:
+        """Record a client folder."""
+        clients = self.data["client_work"].setdefault(_key(client_work_path), {})
+        clients[client_name] = sorted(projects or [])
+    
+    def remove_client(self, client_work_path: Path, client_name: str) -> None:
+        """Forget a client folder."""
+        self.data["client_work"].get(_key(client_work_path), {}).pop(client_name, None)
+    
+    def rename_client(self, client_work_path: Path, old_name: str, new_name: str) -> None:
+        """Move a client's indexed projects to its new folder name."""
+        clients = self.data["client_work"].setdefault(_key(client_work_path), {})
+        clients[new_name] = clients.pop(old_name, [])
+    
+    def add_project(self, client_work_path: Path, client_name: str, project_name: str) -> None:
+        """Record a project folder inside a client folder."""
+        clients = self.data["client_work"].setdefault(_key(client_work_path), {})
+        projects = clients.setdefault(client_name, [])
+        if project_name not in projects:
+            projects.append(project_name)
+            projects.sort()
+    
+    def remove_project(self, client_work_path: Path, client_name: str, project_name: str) -> None:
+        """Forget a project folder inside a client folder."""
+        projects = self.data["client_work"].get(_key(client_work_path), {}).get(client_name, [])
+        if project_name in projects:
+            projects.remove(project_name)
+    
+    def set_watcher(self, pid: Optional[int]) -> None:
+        """Mark the index as owned by a watcher process (or by none)."""
+        self.data["watcher_pid"] = pid
+
+
+def _key(path: Path) -> str:
+    """Normalise a path into an index key without resolving symlinks."""
+    return os.path.abspath(str(path))
+
+
+# Global directory index instance
+directory_index = DirectoryIndex()
@@ -0,0 +1,113 @@
+"""
+Archive emitters for the SBP Folder Generator CLI.
+
+Streams the folder tree a project would get into a tar or zip archive
+instead of creating it on disk, e.g. to hand a skeleton to a freelancer.
+"""
+
+import os
+import tarfile
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, Optional, Set
+from .models import ProjectConfig
+from .generators import project_generator, ProjectGenerator
+
+
+ARCHIVE_FORMATS = ("tar", "zip")
+
+
+class ArchiveEmitter:
+    """Writes project skeletons as directory entries of a streaming archive."""
+    
+    def __init__(self, fileobj: BinaryIO, archive_format: str, root: Optional[Path] = None,
+                 generator: ProjectGenerator = None):
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        
+        self.archive_format = archive_format
+        self.root = Path(os.path.abspath(str(root or Path.cwd())))
+        self.generator = generator or project_generator
+        self.mtime = time.time()
+        self.folder_count = 0
+        self.project_count = 0
+        # Folders above project roots (type, work and client folders) are shared
+        # between projects; everything below is forgotten once a project is written
+        self._shared: Set[str] = set()
+        
+        if archive_format == "tar":
+            # "w|" writes a pure stream, so stdout and pipes work and nothing is buffered
+            self._tar = tarfile.open(fileobj=fileobj, mode="w|")
+            self._zip = None
+        else:
+            # zipfile falls back to data descriptors when the stream isn't seekable
+            self._tar = None
+            self._zip = zipfile.ZipFile(fileobj, mode="w")
+    
+    def add_project(self, config: ProjectConfig, directory_analysis: Dict[str, Any] = None) -> int:
+        """Add every folder generate_project would create for this config."""
+        folders_before = self.folder_count
+        
+        for type_config, project_path, template in self.generator.plan_project(config, directory_analysis):
+            project_name = self._archive_name(project_path)
+            for parent in reversed(PurePosixPath(project_name).parents):
+                if str(parent) != "." and str(parent) not in self._shared:
+                    self._shared.add(str(parent))
+                    self._add_directory(str(parent))
+            
+            seen = {project_name}
+            self._add_directory(project_name)
+            for folder_path in self.generator.iter_folders(project_path, template, type_config):
+                name = self._archive_name(folder_path)
+                # Include intermediate folders such as Footage/ for Footage/Proxies
+                missing = []
+                for parent in PurePosixPath(name).parents:
+                    if str(parent) in seen or str(parent) in self._shared or str(parent) == ".":
+                        break
+                    missing.append(str(parent))
+                for parent in reversed(missing):
+                    seen.add(parent)
+                    self._add_directory(parent)
+                if name not in seen:
+                    seen.add(name)
+                    self._add_directory(name)
+        
+        self.project_count += 1
+        return self.folder_count - folders_before
+    
+    def close(self) -> None:
+        """Finish the archive (the underlying stream is left open)."""
+        if self._tar is not None:
+            self._tar.close()
+        if self._zip is not None:
+            self._zip.close()
+    
+    def __enter__(self) -> "ArchiveEmitter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _archive_name(self, path: Path) -> str:
+        """Get a path's name inside the archive, relative to the emitter root."""
+        absolute = Path(os.path.abspath(str(path)))
+        try:
+            relative = absolute.relative_to(self.root)
+        except ValueError:
+            relative = absolute.relative_to(absolute.anchor)
+        return relative.as_posix()
+    
+    def _add_directory(self, name: str) -> None:
+        if self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = self.mtime
+            self._tar.addfile(info)
+        else:
+            info = zipfile.ZipInfo(name + "/", date_time=time.localtime(self.mtime)[:6])
+            info.external_attr = (0o40755 << 16) | 0x10
+            self._zip.writestr(info, b"")
+        
+        self.folder_count += 1
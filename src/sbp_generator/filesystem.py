@@ -0,0 +1,318 @@
+"""
+Filesystem backends for the SBP Folder Generator CLI.
+
+Project generation and directory analysis only need a few operations: make
+a folder, check for a folder, list the folders inside one and write a
+project's small metadata sidecar. ``FileSystem`` describes them, with
+implementations for the local disk, an in-memory tree for tests and
+benchmarks, and S3-compatible object stores, where a folder is a zero-byte
+``name/`` marker object.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Any, Dict, List, Optional, Set, Tuple
+from .cloning import COPY, file_cloner
+from .fsutil import atomic_write, list_subdirectories
+from .permissions import ResolvedPermission, apply_permission
+
+
+# Marker objects written per round trip to the object store
+OBJECT_STORE_BATCH = 256
+
+OBJECT_STORE_WORKERS = 16
+
+
+class FileSystem(ABC):
+    """The folder operations generation and analysis use."""
+    
+    @abstractmethod
+    def mkdir(self, path: PurePath) -> bool:
+        """Make a folder and any missing parents; returns False if it already existed."""
+    
+    @abstractmethod
+    def is_dir(self, path: PurePath) -> bool:
+        """Check whether a folder exists."""
+    
+    @abstractmethod
+    def list_dirs(self, path: PurePath) -> List[str]:
+        """List the names of the visible folders inside a folder, or [] if it can't be read."""
+    
+    @abstractmethod
+    def write_file(self, path: PurePath, data: bytes) -> None:
+        """Write a small file, making its folder if needed."""
+    
+    def clone_file(self, source: Path, destination: PurePath, immutable: bool = False) -> Tuple[str, int]:
+        """Put a local file at a new path; returns the method used and the bytes that saved.
+        
+        An `immutable` file is one projects only read, so it may share its data with the source.
+        """
+        self.write_file(destination, Path(source).read_bytes())
+        return COPY, 0
+    
+    def set_permissions(self, path: PurePath, permission: ResolvedPermission) -> None:
+        """Give a folder a mode, group and default ACL; stores without permissions ignore this."""
+    
+    def flush(self) -> None:
+        """Finish any writes still buffered."""
+    
+    def identity(self) -> str:
+        """Name the storage this filesystem writes to, so ledger entries aren't shared between stores."""
+        return "local"
+
+
+class LocalFileSystem(FileSystem):
+    """Folders on a local or mounted disk."""
+    
+    def mkdir(self, path: PurePath) -> bool:
+        path = Path(path)
+        try:
+            # Parents are almost always made first, so try the single mkdir
+            path.mkdir()
+            return True
+        except FileExistsError:
+            if not path.is_dir():
+                raise
+            return False
+        except FileNotFoundError:
+            path.mkdir(parents=True, exist_ok=True)
+            return True
+    
+    def is_dir(self, path: PurePath) -> bool:
+        return os.path.isdir(path)
+    
+    def list_dirs(self, path: PurePath) -> List[str]:
+        return [e.name for e in list_subdirectories(path, follow_symlinks=True)]
+    
+    def set_permissions(self, path: PurePath, permission: ResolvedPermission) -> None:
+        apply_permission(Path(path), permission)
+    
+    def clone_file(self, source: Path, destination: PurePath, immutable: bool = False) -> Tuple[str, int]:
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        return file_cloner.clone(Path(source), destination, immutable)
+    
+    def write_file(self, path: PurePath, data: bytes) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, 'wb') as f:
+            f.write(data)
+
+
+class MemoryFileSystem(FileSystem):
+    """A folder tree held in memory."""
+    
+    def __init__(self):
+        self._children: Dict[str, Set[str]] = {"/": set()}
+        self._files: Dict[str, bytes] = {}
+        self.permissions: Dict[str, ResolvedPermission] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(path: PurePath) -> str:
+        return str(PurePosixPath("/", *PurePath(path).parts))
+    
+    def mkdir(self, path: PurePath) -> bool:
+        key = self._key(path)
+        with self._lock:
+            if key in self._children:
+                return False
+            missing = [key]
+            parent = PurePosixPath(key).parent
+            while str(parent) not in self._children:
+                missing.append(str(parent))
+                parent = parent.parent
+            for folder in reversed(missing):
+                self._children[folder] = set()
+                self._children[str(PurePosixPath(folder).parent)].add(PurePosixPath(folder).name)
+            return True
+    
+    def is_dir(self, path: PurePath) -> bool:
+        return self._key(path) in self._children
+    
+    def list_dirs(self, path: PurePath) -> List[str]:
+        with self._lock:
+            return sorted(name for name in self._children.get(self._key(path), ()) if not name.startswith('.'))
+    
+    def write_file(self, path: PurePath, data: bytes) -> None:
+        self.mkdir(PurePath(path).parent)
+        with self._lock:
+            self._files[self._key(path)] = data
+    
+    def set_permissions(self, path: PurePath, permission: ResolvedPermission) -> None:
+        with self._lock:
+            self.permissions[self._key(path)] = permission
+    
+    def read_file(self, path: PurePath) -> bytes:
+        return self._files[self._key(path)]
+    
+    def identity(self) -> str:
+        return f"memory:{id(self)}"
+    
+    def folders(self) -> List[str]:
+        """Every folder in the tree, as absolute POSIX paths."""
+        return sorted(key for key in self._children if key != "/")
+
+
+class ObjectStoreFileSystem(FileSystem):
+    """Folders as marker objects in an S3-compatible bucket, such as AWS S3 or MinIO.
+    
+    Paths map to keys below `prefix`. Markers are queued and written in
+    batches by a thread pool sharing the client's connection pool. Existing
+    folders are found by listing each level once, top down, stopping at the
+    first missing one, so making a project costs a few listings plus
+    parallel PUTs rather than a round trip per folder.
+    """
+    
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None, endpoint_url: Optional[str] = None,
+                 workers: int = OBJECT_STORE_WORKERS, batch_size: int = OBJECT_STORE_BATCH):
+        if client is None:
+            try:
+                import boto3
+                from botocore.config import Config
+            except ImportError:
+                raise ValueError("Object store targets need boto3: pip install 'sbp-folder-generator[s3]'")
+            client = boto3.client("s3", endpoint_url=endpoint_url,
+                                  config=Config(max_pool_connections=workers, retries={"mode": "adaptive"}))
+        
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = client
+        self.batch_size = batch_size
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._known: Set[str] = set()
+        self._listed: Set[str] = set()
+        self._pending: List[str] = []
+    
+    def identity(self) -> str:
+        return f"s3://{self.bucket}/{self.prefix}"
+    
+    def _key(self, path: PurePath) -> str:
+        parts = [part for part in PurePath(path).parts if part not in (PurePath(path).anchor, ".")]
+        return "/".join(([self.prefix] if self.prefix else []) + parts) + "/"
+    
+    def _parent_key(self, key: str) -> str:
+        parent = key[:-1].rpartition("/")[0]
+        return f"{parent}/" if parent else ""
+    
+    def _list(self, key: str) -> List[str]:
+        """List the folders directly below a key."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        prefixes = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=key, Delimiter="/"):
+            prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+        return prefixes
+    
+    def _chain(self, key: str) -> List[str]:
+        """Get the folder keys from the top of the prefix down to `key`."""
+        chain = [key]
+        parent = self._parent_key(key)
+        while parent and parent.rstrip("/") != self.prefix:
+            chain.append(parent)
+            parent = self._parent_key(parent)
+        return chain[::-1]
+    
+    def mkdir(self, path: PurePath) -> bool:
+        key = self._key(path)
+        chain = self._chain(key)
+        while True:
+            with self._lock:
+                if key in self._known:
+                    return False
+                
+                # Walk down from the top, listing each level once, until a folder turns out to be
+                # missing; everything below it is new and needs no listing
+                unlisted = None
+                for index, folder in enumerate(chain):
+                    parent = self._parent_key(folder)
+                    if parent not in self._listed:
+                        unlisted = parent
+                        break
+                    if folder not in self._known:
+                        break
+                else:
+                    return False
+                
+                if unlisted is None:
+                    missing = chain[index:]
+                    self._known.update(missing)
+                    self._listed.update(missing)
+                    self._pending.extend(missing)
+                    if len(self._pending) >= self.batch_size:
+                        batch, self._pending = self._pending, []
+                    else:
+                        batch = None
+                    break
+            
+            # List without holding the lock, so other workers aren't queued behind the round trip
+            prefixes = self._list(unlisted)
+            with self._lock:
+                self._known.update(prefixes)
+                self._listed.add(unlisted)
+        
+        if batch:
+            self._write(batch)
+        return True
+    
+    def is_dir(self, path: PurePath) -> bool:
+        key = self._key(path)
+        with self._lock:
+            if key in self._known:
+                return True
+        response = self.client.list_objects_v2(Bucket=self.bucket, Prefix=key, MaxKeys=1)
+        return response.get("KeyCount", len(response.get("Contents", []))) > 0
+    
+    def list_dirs(self, path: PurePath) -> List[str]:
+        self.flush()
+        try:
+            prefixes = self._list(self._key(path))
+        except Exception:
+            return []
+        names = [prefix[:-1].rpartition("/")[2] for prefix in prefixes]
+        return [name for name in names if not name.startswith('.')]
+    
+    def write_file(self, path: PurePath, data: bytes) -> None:
+        self.mkdir(PurePath(path).parent)
+        self.client.put_object(Bucket=self.bucket, Key=self._key(path)[:-1], Body=data)
+    
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._write(batch)
+    
+    def _write(self, keys: List[str]) -> None:
+        """PUT a batch of markers in parallel, raising the first failure."""
+        futures = [self._pool.submit(self.client.put_object, Bucket=self.bucket, Key=key, Body=b"")
+                   for key in keys]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            with self._lock:
+                self._known.difference_update(keys)
+            raise OSError(f"Could not write {len(errors)} folder markers to {self.bucket}: {errors[0]}")
+    
+    def close(self) -> None:
+        self.flush()
+        self._pool.shutdown()
+
+
+def filesystem_from_url(url: Optional[str], endpoint_url: Optional[str] = None) -> FileSystem:
+    """Get the filesystem for a target such as s3://bucket/prefix or memory://; local disk otherwise."""
+    if not url:
+        return LocalFileSystem()
+    if url.startswith("s3://"):
+        bucket, _, prefix = url[len("s3://"):].partition("/")
+        if not bucket:
+            raise ValueError(f"No bucket in target: {url}")
+        return ObjectStoreFileSystem(bucket, prefix, endpoint_url=endpoint_url)
+    if url == "memory://":
+        return MemoryFileSystem()
+    raise ValueError(f"Unsupported target: {url}")
+
+
+# Global local filesystem instance
+local_filesystem = LocalFileSystem()
\ No newline at end of file
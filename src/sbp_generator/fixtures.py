@@ -0,0 +1,156 @@
+"""
+Synthetic archives for the SBP Folder Generator CLI.
+
+Builds archives with the shapes that make detection and scanning slow:
+thousands of clients, hundreds of thousands of photo, video and combined
+projects, camera folder fan-outs and personal year folders. Every project
+is derived from the seed and its own index, so the same arguments always
+build the same tree, and chunks of projects are built in separate
+processes. Folders come from the configured templates and layouts through
+``plan_project``; the clients database, catalog and ledger are left alone.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .config import config_manager
+from .filesystem import local_filesystem
+from .generators import project_generator
+from .models import Camera, CameraAssignment, CameraPurpose, ProjectConfig, ProjectType, WorkType
+from .sidecar import dump_sidecar, sidecar_path
+
+
+# Projects built per task handed to a worker process
+CHUNK_SIZE = 500
+
+# Relative share of each project type, and the share of personal projects
+TYPE_WEIGHTS = {ProjectType.PHOTOGRAPHY: 45, ProjectType.VIDEOGRAPHY: 35, ProjectType.BOTH: 20}
+PERSONAL_SHARE = 0.15
+
+FIRST_YEAR = 2012
+YEARS = 13
+
+# Dummy media files are sparse, so their size costs no disk space
+DEFAULT_MEDIA_SIZE = 24 * 1024 * 1024
+
+WORDS = (
+    "Alpine", "Amber", "Atlas", "Beacon", "Birch", "Bloom", "Canyon", "Cedar", "Coastal", "Copper",
+    "Delta", "Ember", "Fjord", "Harbor", "Horizon", "Indigo", "Juniper", "Lantern", "Linen", "Lumen",
+    "Maple", "Meadow", "Nova", "Oak", "Orbit", "Pine", "Prairie", "Quarry", "Ridge", "Sable",
+    "Sierra", "Slate", "Summit", "Tidal", "Velvet", "Willow",
+)
+CLIENT_SUFFIXES = ("Studio", "Media", "Foods", "Records", "Outdoors", "Hotels", "Labs", "Apparel")
+PROJECT_KINDS = ("Launch", "Lookbook", "Campaign", "Wedding", "Portraits", "Event", "Interview", "Promo")
+
+
+def fixture_client_name(index: int) -> str:
+    """Get the name of the fixture client with this index."""
+    return f"{WORDS[index % len(WORDS)]} {CLIENT_SUFFIXES[index // len(WORDS) % len(CLIENT_SUFFIXES)]} {index}"
+
+
+def fixture_project(seed: int, index: int, clients: int, base_path: Path) -> ProjectConfig:
+    """Get the project with this index, the same for every run with the same seed."""
+    rng = random.Random(seed * 1_000_003 + index)
+    project_type = rng.choices(list(TYPE_WEIGHTS), weights=list(TYPE_WEIGHTS.values()))[0]
+    
+    # Every client gets a project first; after that a few clients get most of the work
+    if index < clients:
+        client_name = fixture_client_name(index)
+    elif rng.random() < PERSONAL_SHARE:
+        client_name = None
+    else:
+        client_name = fixture_client_name(int(clients * rng.random() ** 3))
+    
+    cameras = config_manager.config.default_cameras
+    camera_count = rng.choice((0, 1, 2, 3, 4) if project_type != ProjectType.PHOTOGRAPHY else (0, 0, 1, 2))
+    camera_count = min(camera_count, len(cameras))
+    assignments = [CameraAssignment(camera=Camera(**camera), purpose=purpose)
+                   for camera, purpose in zip(rng.sample(cameras, camera_count),
+                                              rng.sample(list(CameraPurpose), camera_count))]
+    
+    return ProjectConfig(
+        project_type=project_type,
+        work_type=WorkType.CLIENT if client_name else WorkType.PERSONAL,
+        project_name=f"{rng.choice(WORDS)} {rng.choice(PROJECT_KINDS)} {index}",
+        client_name=client_name,
+        project_date=datetime(FIRST_YEAR, 1, 1) + timedelta(days=rng.randrange(YEARS * 365)),
+        base_path=str(base_path),
+        include_capture_one=rng.random() < 0.3,
+        include_proxies=rng.random() < 0.5,
+        camera_assignments=assignments,
+        use_camera_folders=bool(assignments)
+    )
+
+
+def _write_media(folders: List[Path], count: int, size: int, is_photo: bool) -> int:
+    """Spread sparse dummy media files over the leaf folders of a project."""
+    parents = {folder.parent for folder in folders}
+    leaves = [folder for folder in folders if folder not in parents]
+    if not leaves:
+        return 0
+    
+    prefix, extension = ("IMG", "CR3") if is_photo else ("CLIP", "MP4")
+    for number in range(count):
+        with open(leaves[number % len(leaves)] / f"{prefix}_{number:04d}.{extension}", 'wb') as f:
+            f.truncate(size)
+    return count
+
+
+def _build_chunk(task: Tuple[str, int, int, int, int, int, int, bool]) -> Tuple[int, int, int]:
+    """Build projects start..stop; returns (projects, folders, files) made."""
+    base_path, seed, start, stop, clients, media_files, media_size, sidecars = task
+    folder_count = file_count = 0
+    
+    for index in range(start, stop):
+        config = fixture_project(seed, index, clients, Path(base_path))
+        for type_config, project_path, template in project_generator.plan_project(config):
+            local_filesystem.mkdir(project_path)
+            made = [folder for folder in project_generator.iter_folders(project_path, template, type_config)
+                    if local_filesystem.mkdir(folder)]
+            folder_count += len(made) + 1
+            
+            if sidecars:
+                project_generator.filesystem.write_file(sidecar_path(project_path), dump_sidecar(type_config))
+            if media_files:
+                file_count += _write_media(made, media_files, media_size,
+                                           type_config.project_type == ProjectType.PHOTOGRAPHY)
+    
+    return stop - start, folder_count, file_count
+
+
+def build_fixture(base_path: Path, clients: int = 10000, projects: int = 200000, seed: int = 0,
+                  media_files: int = 0, media_size: int = DEFAULT_MEDIA_SIZE, sidecars: bool = False,
+                  workers: Optional[int] = None) -> Dict[str, Any]:
+    """Build a synthetic archive below base_path.
+    
+    media_files sparse files are spread over each project's leaf folders, and
+    sidecars adds the .sbp/project.json a generated project would get.
+    """
+    if clients < 1 or projects < 1:
+        raise ValueError("A fixture needs at least one client and one project")
+    
+    base = os.path.abspath(str(base_path))
+    os.makedirs(base, exist_ok=True)
+    tasks = [(base, seed, start, min(start + CHUNK_SIZE, projects), clients, media_files, media_size, sidecars)
+             for start in range(0, projects, CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_build_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_build_chunk, tasks))
+    project_count, folder_count, file_count = (sum(column) for column in zip(*results))
+    
+    return {
+        "path": base,
+        "projects": project_count,
+        "folders": folder_count,
+        "files": file_count,
+        "seconds": time.perf_counter() - started
+    }
\ No newline at end of file
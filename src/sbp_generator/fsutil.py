@@ -0,0 +1,103 @@
+"""
+Shared filesystem helpers for the SBP Folder Generator CLI.
+
+One tree walker, one folder lister, one atomic file writer and the default
+size of the thread pools that list folders, so the commands that scan the
+archive agree on how they do it.
+
+This module must stay importable with the standard library alone.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import IO, Callable, Iterator, List, Optional, Tuple, Union
+
+
+# Folder listing waits on the disk (or the network share) far more than on the CPU
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def skip_errors(path: str, error: OSError) -> None:
+    """Walk error handler that leaves out folders that can't be listed."""
+
+
+def raise_errors(path: str, error: OSError) -> None:
+    """Walk error handler that stops the walk at the first folder that can't be listed."""
+    raise error
+
+
+def walk_tree(root: PathLike, max_depth: Optional[int] = None, include_hidden: bool = True,
+              descend: Optional[Callable[[os.DirEntry, str], bool]] = None,
+              on_error: Callable[[str, OSError], None] = skip_errors) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, path relative to root) for everything below a folder.
+    
+    The walk is depth first with an explicit stack, so deep trees don't hit
+    the recursion limit. Symlinks are yielded but never followed. Folders
+    more than `max_depth` levels down (1 lists only `root`), hidden entries
+    unless `include_hidden` is set, and folders `descend` rejects are not
+    entered. Each folder is read in full before its entries are yielded,
+    so callers may delete what they are given.
+    """
+    stack = [(os.fspath(root), "", 1)]
+    while stack:
+        path, relative, depth = stack.pop()
+        try:
+            with os.scandir(path) as iterator:
+                entries = list(iterator)
+        except OSError as e:
+            on_error(path, e)
+            continue
+        
+        for entry in entries:
+            if not include_hidden and entry.name.startswith('.'):
+                continue
+            entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+            yield entry, entry_relative
+            if max_depth is not None and depth >= max_depth:
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir and (descend is None or descend(entry, entry_relative)):
+                stack.append((entry.path, entry_relative, depth + 1))
+
+
+def list_subdirectories(path: PathLike, include_hidden: bool = False,
+                        follow_symlinks: bool = False) -> List[os.DirEntry]:
+    """List the subdirectories of one folder (empty if it can't be read)."""
+    try:
+        with os.scandir(path) as entries:
+            return [e for e in entries if (include_hidden or not e.name.startswith('.'))
+                    and e.is_dir(follow_symlinks=follow_symlinks)]
+    except OSError:
+        return []
+
+
+@contextmanager
+def atomic_write(path: PathLike, mode: str = 'w', durable: bool = False) -> Iterator[IO]:
+    """Write a file through a temporary file beside it, renamed into place once the block completes.
+    
+    Readers see either the old file or the whole new one, never a partial
+    write. With `durable` the data is flushed to disk before the rename.
+    The temporary file is removed if the block raises.
+    """
+    directory, name = os.path.split(os.fspath(path))
+    # Unique per thread, as several workers may write the same file
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, mode, **({} if 'b' in mode else {"encoding": "utf-8"})) as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
\ No newline at end of file
@@ -2,28 +2,127 @@
 Folder structure generators for the SBP Folder Generator CLI.
 """
 
+import hashlib
 import json
+import os
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Callable, NamedTuple
 from .models import ProjectConfig, ProjectType, WorkType, FolderStructure
 from .config import config_manager
 from .client_manager import client_manager
+from .directory_index import directory_index
+from .template_resolver import TemplateResolver
+from .path_matcher import LayoutMatcher, render_segment, segment_token
+from .catalog import ProjectCatalog, project_catalog
+from .ledger import GenerationLedger, generation_ledger
+from .sidecar import dump_sidecar, sidecar_path
+from .filesystem import FileSystem, LocalFileSystem, local_filesystem
+from .permissions import PermissionTemplate
+from .cloning import iter_source_files, starter_file
+
+
+# Generation event kinds
+PROJECT_EVENT = "project"
+FOLDER_EVENT = "folder"
+PROJECT_DONE_EVENT = "project_done"
+FILE_EVENT = "file"
+
+# Events buffered between volume worker threads and the consumer
+EVENT_QUEUE_SIZE = 1024
+
+# The base_directories and volume_roots key of each single project type
+VOLUME_KEYS = {ProjectType.PHOTOGRAPHY: "photography", ProjectType.VIDEOGRAPHY: "videography"}
+
+# A camera_folders entry for camera folders directly in the project folder
+PROJECT_ROOT = "."
+
+
+class GenerationEvent(NamedTuple):
+    """One step of a generation: a project root being started or finished, or a folder or starter file being made."""
+    kind: str
+    path: Path
+    existed: bool = False
+    seconds: float = 0.0
+    method: str = ""
+    bytes_saved: int = 0
+
+
+class GenerationSummary:
+    """Aggregates generation events into counts, optionally keeping the folder list."""
+    
+    def __init__(self, keep_folders: bool = True):
+        self.keep_folders = keep_folders
+        self.folders: List[Path] = []
+        self.project_paths: List[Path] = []
+        self.timings: Dict[str, float] = {}
+        self.folder_count = 0
+        self.existing_count = 0
+        self.file_count = 0
+        self.bytes_saved = 0
+        self.clone_methods: Dict[str, int] = {}
+    
+    def add(self, event: GenerationEvent) -> None:
+        if event.kind == PROJECT_EVENT:
+            self.project_paths.append(event.path)
+            return
+        if event.kind == PROJECT_DONE_EVENT:
+            self.timings[str(event.path)] = event.seconds
+            return
+        if event.kind == FILE_EVENT:
+            if not event.existed:
+                self.file_count += 1
+                self.bytes_saved += event.bytes_saved
+                self.clone_methods[event.method] = self.clone_methods.get(event.method, 0) + 1
+            return
+        
+        self.folder_count += 1
+        if event.existed:
+            self.existing_count += 1
+        if self.keep_folders:
+            self.folders.append(event.path)
 
 
 class ProjectGenerator:
     """Generates folder structures for projects."""
     
-    def __init__(self):
+    def __init__(self, filesystem: Optional[FileSystem] = None, catalog: Optional[ProjectCatalog] = None,
+                 ledger: Optional[GenerationLedger] = None):
         self.config = config_manager.config
+        self.filesystem = filesystem or local_filesystem
+        self.catalog = catalog or project_catalog
+        self.ledger = ledger or generation_ledger
         self.templates_dir = Path(__file__).parent / "templates"
+        self.user_templates_dir = config_manager.templates_dir
+        self.template_resolver = TemplateResolver(
+            [self.user_templates_dir, self.templates_dir],
+            fallback=self._get_default_structure
+        )
+        self._layout_matcher: Optional[LayoutMatcher] = None
+        self._permissions: Optional[Tuple[Any, PermissionTemplate]] = None
+    
+    @property
+    def layout_matcher(self) -> LayoutMatcher:
+        """The compiled layout matcher, rebuilt when the configuration object changes."""
+        if self._layout_matcher is None or self._layout_matcher.config is not self.config:
+            self._layout_matcher = LayoutMatcher(self.config, self.filesystem)
+        return self._layout_matcher
+    
+    @property
+    def permission_template(self) -> PermissionTemplate:
+        """The folder permission rules, rebuilt when the configuration object changes."""
+        if self._permissions is None or self._permissions[0] is not self.config:
+            self._permissions = (self.config, PermissionTemplate.from_config(self.config))
+        return self._permissions[1]
     
     def analyze_current_directory(self, current_path: Path = None) -> Dict[str, Any]:
         """Analyze the current directory to see if we're already in part of the expected structure."""
         if current_path is None:
             current_path = Path.cwd()
         
-        path_parts = current_path.parts
         analysis = {
             "is_in_structure": False,
             "detected_type": None,  # photography, videography, assets
@@ -33,160 +132,50 @@ class ProjectGenerator:
             "discovered_clients": [],  # list of existing client folders
             "client_work_path": None,  # path to Client Work folder for discovering clients
             "suggested_base": current_path,
+            "archive_base": None,  # folder holding the type folder we're in
             "skip_folders": []
         }
         
-        # Check if we're in any of the expected base directories
-        for i, part in enumerate(path_parts):
-            if part in [self.config.base_directories["photography"], "Photography", "PHOTO"]:
-                analysis["is_in_structure"] = True
-                analysis["detected_type"] = "photography"
-                
-                # If we're IN the PHOTO directory (it's the last part), use current path as base
-                # If we're deeper in the structure, use the parent of PHOTO
-                if i == len(path_parts) - 1:
-                    # We're directly in the PHOTO directory
-                    analysis["suggested_base"] = current_path
-                else:
-                    # We're deeper in the structure
-                    analysis["suggested_base"] = Path(*path_parts[:i])
-                
-                analysis["skip_folders"].append("photography")
-                
-                # Check if we're deeper in the structure
-                if i + 1 < len(path_parts):
-                    next_part = path_parts[i + 1]
-                    if next_part in [self.config.client_work_subfolder, "Client Work"]:
-                        analysis["detected_work_type"] = "client"
-                        analysis["skip_folders"].extend(["photography", "client_work"])
-                        
-                        # Store the Client Work path for discovering clients
-                        client_work_path = Path(*path_parts[:i+2])
-                        analysis["client_work_path"] = client_work_path
-                        
-                        # Discover existing clients in the Client Work folder
-                        if client_work_path.exists():
-                            try:
-                                for item in client_work_path.iterdir():
-                                    if item.is_dir() and not item.name.startswith('.'):
-                                        analysis["discovered_clients"].append(item.name)
-                            except (PermissionError, OSError):
-                                pass  # Skip if we can't read the directory
-                        
-                        # Check for client name
-                        if i + 2 < len(path_parts):
-                            analysis["detected_client"] = path_parts[i + 2]
-                            analysis["skip_folders"].append("client_folder")
-                    
-                    elif next_part in [self.config.personal_work_subfolder, "Personal Work"]:
-                        analysis["detected_work_type"] = "personal"
-                        analysis["skip_folders"].extend(["photography", "personal_work"])
-                        
-                        # Check for year
-                        if i + 2 < len(path_parts) and path_parts[i + 2].isdigit():
-                            analysis["detected_year"] = int(path_parts[i + 2])
-                            analysis["skip_folders"].append("year_folder")
-                
-                break
-                
-            elif part in [self.config.base_directories["videography"], "Videography", "VIDEO"]:
-                analysis["is_in_structure"] = True
-                analysis["detected_type"] = "videography"
-                
-                # If we're IN the VIDEO directory (it's the last part), use current path as base
-                # If we're deeper in the structure, use the parent of VIDEO
-                if i == len(path_parts) - 1:
-                    # We're directly in the VIDEO directory
-                    analysis["suggested_base"] = current_path
-                else:
-                    # We're deeper in the structure
-                    analysis["suggested_base"] = Path(*path_parts[:i])
-                
-                analysis["skip_folders"].append("videography")
-                
-                # Similar logic for videography
-                if i + 1 < len(path_parts):
-                    next_part = path_parts[i + 1]
-                    if next_part in [self.config.client_work_subfolder, "Client Work"]:
-                        analysis["detected_work_type"] = "client"
-                        analysis["skip_folders"].extend(["videography", "client_work"])
-                        
-                        # Store the Client Work path for discovering clients
-                        client_work_path = Path(*path_parts[:i+2])
-                        analysis["client_work_path"] = client_work_path
-                        
-                        # Discover existing clients in the Client Work folder
-                        if client_work_path.exists():
-                            try:
-                                for item in client_work_path.iterdir():
-                                    if item.is_dir() and not item.name.startswith('.'):
-                                        analysis["discovered_clients"].append(item.name)
-                            except (PermissionError, OSError):
-                                pass  # Skip if we can't read the directory
-                        
-                        if i + 2 < len(path_parts):
-                            analysis["detected_client"] = path_parts[i + 2]
-                            analysis["skip_folders"].append("client_folder")
-                    
-                    elif next_part in [self.config.personal_work_subfolder, "Personal Work"]:
-                        analysis["detected_work_type"] = "personal"
-                        analysis["skip_folders"].extend(["videography", "personal_work"])
-                        
-                        if i + 2 < len(path_parts) and path_parts[i + 2].isdigit():
-                            analysis["detected_year"] = int(path_parts[i + 2])
-                            analysis["skip_folders"].append("year_folder")
-                
-                break
+        match = self.layout_matcher.match(current_path)
+        if match is None:
+            return analysis
         
-        # Additional client discovery: if we're in the same level as Client Work, check for clients there too
-        if analysis["is_in_structure"] and not analysis["discovered_clients"]:
-            potential_client_work_paths = []
-            
-            # If we're directly in a PHOTO/VIDEO directory, check for Client Work subfolder
-            if analysis["detected_type"]:
-                # Check if Client Work exists in current directory (when we're in PHOTO/VIDEO directly)
-                current_client_work = current_path / self.config.client_work_subfolder
-                if not current_client_work.exists():
-                    current_client_work = current_path / "Client Work"
-                if current_client_work.exists():
-                    potential_client_work_paths.append(current_client_work)
-                
-                # Also search in parent directories
-                current_parent = current_path.parent
-                while current_parent != current_parent.parent:  # Don't go to root
-                    for type_folder in [self.config.base_directories["photography"], self.config.base_directories["videography"], "Photography", "Videography", "PHOTO", "VIDEO"]:
-                        type_path = current_parent / type_folder
-                        if type_path.exists():
-                            client_work_path = type_path / self.config.client_work_subfolder
-                            if not client_work_path.exists():
-                                client_work_path = type_path / "Client Work"
-                            if client_work_path.exists() and client_work_path not in potential_client_work_paths:
-                                potential_client_work_paths.append(client_work_path)
-                    current_parent = current_parent.parent
-                    if len(str(current_parent)) < 10:  # Prevent going too high up
-                        break
-            
-            # Discover clients from any found Client Work paths
-            for client_work_path in potential_client_work_paths:
-                try:
-                    for item in client_work_path.iterdir():
-                        if item.is_dir() and not item.name.startswith('.') and item.name not in analysis["discovered_clients"]:
-                            analysis["discovered_clients"].append(item.name)
-                except (PermissionError, OSError):
-                    pass
+        archive_base = match["archive_base"]
+        analysis.update(match)
+        analysis["is_in_structure"] = True
+        
+        # Discover existing clients in the Client Work folder we're in, or else in every
+        # Client Work folder of the archive we're in (found by listing, not probing names)
+        if analysis["client_work_path"] is not None:
+            client_work_paths = [analysis["client_work_path"]]
+        else:
+            client_work_paths = self.layout_matcher.client_work_paths(archive_base)
+        
+        for client_work_path in client_work_paths:
+            for client_name in self.discover_clients(client_work_path):
+                if client_name not in analysis["discovered_clients"]:
+                    analysis["discovered_clients"].append(client_name)
         
         return analysis
+    
+    def discover_clients(self, client_work_path: Path) -> List[str]:
+        """List client folders in a Client Work folder, using the watch index when it is live."""
+        # The watch index only follows local folders
+        if isinstance(self.filesystem, LocalFileSystem):
+            indexed = directory_index.get_clients(client_work_path)
+            if indexed is not None:
+                return indexed
+        
+        return self.layout_matcher.iter_client_names(client_work_path)
 
     def load_template(self, template_name: str) -> Dict[str, Any]:
-        """Load folder structure template from JSON file."""
-        template_file = self.templates_dir / f"{template_name}.json"
-        
-        if not template_file.exists():
-            # Return default structure if template doesn't exist
-            return self._get_default_structure(template_name)
+        """Load a folder structure template, resolving `extends`/`include`/`remove`.
         
-        with open(template_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        User templates (e.g. from `template capture`) override the bundled ones,
+        which in turn override the built-in default structures. The result is
+        cached and shared, so treat it as read-only.
+        """
+        return self.template_resolver.resolve(template_name)
     
     def _get_default_structure(self, template_name: str) -> Dict[str, Any]:
         """Get default folder structure if template file doesn't exist."""
@@ -281,12 +270,28 @@ class ProjectGenerator:
             # For personal work, just use project name
             return config.project_name
     
+    def parse_project_folder_name(self, folder_name: str) -> Tuple[Optional[datetime], str]:
+        """Split a client project folder name back into its date and project name.
+        
+        Returns (None, folder_name) for names without a leading date, such as
+        personal projects.
+        """
+        date_format = self.config.default_options["date_format"]
+        position = folder_name.find('-')
+        while position != -1:
+            try:
+                return datetime.strptime(folder_name[:position], date_format), folder_name[position + 1:]
+            except ValueError:
+                position = folder_name.find('-', position + 1)
+        
+        return None, folder_name
+    
     def get_project_base_path(self, config: ProjectConfig, analysis: Dict[str, Any] = None) -> Path:
         """Get the base path where the project should be created, considering current directory analysis."""
         if config.base_path:
             base = Path(config.base_path)
         else:
-            base = config_manager.get_base_path()
+            base = config_manager.get_volume_root(VOLUME_KEYS.get(config.project_type))
         
         # If we have directory analysis and should use smart path detection
         if analysis and analysis.get("is_in_structure") and analysis.get("use_smart_detection"):
@@ -321,52 +326,62 @@ class ProjectGenerator:
         else:
             full_path = base
         
-        # Add client folder for client work
-        if (config.work_type == WorkType.CLIENT and config.client_name and 
-            "client_folder" not in skip_folders):
-            full_path = full_path / config.client_name
-        elif (config.work_type == WorkType.PERSONAL and 
-              "year_folder" not in skip_folders):
-            # Add year folder for personal work
-            year = str(config.project_date.year)
-            full_path = full_path / year
+        # Add the client or year levels of the layout that aren't already in the path
+        if config.work_type == WorkType.CLIENT and config.client_name:
+            layout = self.config.client_layout
+        elif config.work_type == WorkType.PERSONAL:
+            layout = self.config.personal_layout
+        else:
+            layout = []
+        
+        for segment in layout:
+            if segment_token(segment) not in skip_folders:
+                full_path = full_path / render_segment(segment, config.client_name, config.project_date.year)
         
         return full_path
     
-    def create_folders(self, base_path: Path, template: Dict[str, Any], config: ProjectConfig) -> List[Path]:
-        """Create folders based on template and configuration."""
-        created_folders = []
+    def iter_folders(self, base_path: Path, template: Dict[str, Any], config: ProjectConfig) -> Iterator[Path]:
+        """Yield every folder a template creates for this configuration, in creation order."""
+        # Templates may list where camera folders go; otherwise they go in RAW and Proxies
+        camera_folders = template.get("camera_folders")
+        cameras = config.camera_assignments if config.use_camera_folders else []
+        is_video = config.project_type in [ProjectType.VIDEOGRAPHY, ProjectType.BOTH]
+        
+        # "." puts camera folders in the project folder itself
+        if cameras and camera_folders is not None and PROJECT_ROOT in camera_folders:
+            for camera_assignment in cameras:
+                yield base_path / camera_assignment.get_folder_name()
         
-        # Create main folders
+        # Main folders
         for folder_name in template.get("folders", []):
-            folder_path = base_path / folder_name
-            folder_path.mkdir(parents=True, exist_ok=True)
-            created_folders.append(folder_path)
+            yield base_path / folder_name
+            
+            if cameras and camera_folders is not None and folder_name in camera_folders:
+                for camera_assignment in cameras:
+                    yield base_path / folder_name / camera_assignment.get_folder_name()
         
-        # Create subfolders
+        # Subfolders
         subfolders = template.get("subfolders", {})
         for parent_folder, child_folders in subfolders.items():
             parent_path = base_path / parent_folder
-            parent_path.mkdir(parents=True, exist_ok=True)
+            if not child_folders:
+                yield parent_path
             
             for child_folder in child_folders:
                 child_path = parent_path / child_folder
-                child_path.mkdir(parents=True, exist_ok=True)
-                created_folders.append(child_path)
+                yield child_path
                 
-                # Create camera folders if enabled and this is a RAW folder
-                if (config.use_camera_folders and 
-                    child_folder == "RAW" and 
-                    config.camera_assignments and
-                    config.project_type in [ProjectType.VIDEOGRAPHY, ProjectType.BOTH]):
-                    
-                    for camera_assignment in config.camera_assignments:
-                        camera_folder_name = camera_assignment.get_folder_name()
-                        camera_folder_path = child_path / camera_folder_name
-                        camera_folder_path.mkdir(parents=True, exist_ok=True)
-                        created_folders.append(camera_folder_path)
-        
-        # Create optional folders based on configuration
+                # Camera folders if enabled and this is a RAW folder
+                if camera_folders is not None:
+                    wants_cameras = f"{parent_folder}/{child_folder}" in camera_folders
+                else:
+                    wants_cameras = child_folder == "RAW" and is_video
+                
+                if cameras and wants_cameras:
+                    for camera_assignment in cameras:
+                        yield child_path / camera_assignment.get_folder_name()
+        
+        # Optional folders based on configuration
         optional_folders = template.get("optional_folders", [])
         for optional_folder in optional_folders:
             should_create = False
@@ -378,74 +393,240 @@ class ProjectGenerator:
             
             if should_create:
                 folder_path = base_path / optional_folder
-                folder_path.mkdir(parents=True, exist_ok=True)
-                created_folders.append(folder_path)
+                yield folder_path
                 
-                # Create camera folders in Proxies if enabled
-                if (config.use_camera_folders and 
-                    "Proxies" in optional_folder and 
-                    config.camera_assignments and
-                    config.project_type in [ProjectType.VIDEOGRAPHY, ProjectType.BOTH]):
-                    
-                    for camera_assignment in config.camera_assignments:
-                        camera_folder_name = camera_assignment.get_folder_name()
-                        camera_folder_path = folder_path / camera_folder_name
-                        camera_folder_path.mkdir(parents=True, exist_ok=True)
-                        created_folders.append(camera_folder_path)
-        
-        return created_folders
+                # Camera folders in Proxies if enabled
+                if camera_folders is not None:
+                    wants_cameras = optional_folder in camera_folders
+                else:
+                    wants_cameras = "Proxies" in optional_folder and is_video
+                
+                if cameras and wants_cameras:
+                    for camera_assignment in cameras:
+                        yield folder_path / camera_assignment.get_folder_name()
+    
+    def iter_create_folders(self, base_path: Path, template: Dict[str, Any], config: ProjectConfig) -> Iterator[GenerationEvent]:
+        """Create folders and starter files from a template, yielding an event as each one is made.
+        
+        New folders then get their permission template rules, deepest first so
+        a read-only folder doesn't stop its subfolders or files being made;
+        existing folders are left as they are.
+        """
+        permissions = self.permission_template
+        pending = []
+        for folder_path in self.iter_folders(base_path, template, config):
+            existed = not self.filesystem.mkdir(folder_path)
+            if not existed and permissions:
+                permission = permissions.for_folder(folder_path.relative_to(base_path).as_posix())
+                if permission is not None:
+                    pending.append((folder_path, permission))
+            yield GenerationEvent(FOLDER_EVENT, folder_path, existed)
+        
+        yield from self._iter_starter_files(base_path, template, config)
+        
+        for folder_path, permission in reversed(pending):
+            self.filesystem.set_permissions(folder_path, permission)
+    
+    def _iter_starter_files(self, base_path: Path, template: Dict[str, Any], config: ProjectConfig) -> Iterator[GenerationEvent]:
+        """Clone the template's starter files from the assets folder, leaving existing files alone."""
+        files = template.get("files")
+        if not files:
+            return
+        
+        assets_path = self.get_assets_path(config)
+        for destination, entry in files.items():
+            source, immutable = starter_file(entry)
+            for source_file, destination_file in iter_source_files(assets_path / source, base_path / destination):
+                try:
+                    method, saved = self.filesystem.clone_file(source_file, destination_file, immutable)
+                except FileExistsError:
+                    yield GenerationEvent(FILE_EVENT, destination_file, existed=True)
+                    continue
+                yield GenerationEvent(FILE_EVENT, destination_file, method=method, bytes_saved=saved)
+    
+    def get_assets_path(self, config: Optional[ProjectConfig] = None) -> Path:
+        """Get the Assets & Resources folder starter files are taken from."""
+        if config is not None and config.base_path:
+            base = Path(config.base_path)
+        else:
+            base = config_manager.get_volume_root("assets")
+        return base / self.config.base_directories["assets"]
+    
+    def create_folders(self, base_path: Path, template: Dict[str, Any], config: ProjectConfig) -> List[Path]:
+        """Create folders based on template and configuration."""
+        folders = [event.path for event in self.iter_create_folders(base_path, template, config)
+                   if event.kind == FOLDER_EVENT]
+        self.filesystem.flush()
+        return folders
+    
+    def plan_project(self, config: ProjectConfig, directory_analysis: Dict[str, Any] = None) -> List[Tuple[ProjectConfig, Path, Dict[str, Any]]]:
+        """Work out the (type config, project path, template) for each project folder to create."""
+        project_folder_name = self.generate_project_folder_name(config)
+        
+        # Handle both photo and video projects
+        project_types = []
+        if config.project_type == ProjectType.BOTH:
+            project_types = [ProjectType.PHOTOGRAPHY, ProjectType.VIDEOGRAPHY]
+        else:
+            project_types = [config.project_type]
+        
+        plan = []
+        for project_type in project_types:
+            # Create a new config for each type
+            type_config = ProjectConfig(**config.dict())
+            type_config.project_type = project_type
+            
+            # Get base path for this project type
+            base_path = self.get_project_base_path(type_config, directory_analysis)
+            project_path = base_path / project_folder_name
+            
+            # Determine template name
+            if project_type == ProjectType.PHOTOGRAPHY:
+                template_name = f"photography_{config.work_type.value}"
+            else:
+                template_name = f"videography_{config.work_type.value}"
+            
+            plan.append((type_config, project_path, self.load_template(template_name)))
+        
+        return plan
     
-    def generate_project(self, config: ProjectConfig, directory_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate a complete project structure."""
+    def iter_generate_project(self, config: ProjectConfig, directory_analysis: Dict[str, Any] = None) -> Iterator[GenerationEvent]:
+        """Generate a project structure, yielding events as folders are created.
+        
+        The trees of a `both` project are created concurrently, one thread per
+        type, so photo and video folders on separate volumes cost the slower of
+        the two rather than the sum.
+        """
+        yield from self._iter_plan(config, self.plan_project(config, directory_analysis))
+    
+    def _iter_plan(self, config: ProjectConfig, plan: List[Tuple[ProjectConfig, Path, Dict[str, Any]]]) -> Iterator[GenerationEvent]:
+        if len(plan) == 1:
+            yield from self._iter_project_tree(*plan[0])
+        else:
+            yield from self._iter_concurrently(plan)
+        self.filesystem.flush()
+        
+        # Add project to client if it's client work
+        if config.work_type == WorkType.CLIENT and config.client_name:
+            client_manager.add_project_to_client(config.client_name, self.generate_project_folder_name(config))
+        
+        for type_config, project_path, _ in plan:
+            self.filesystem.write_file(sidecar_path(project_path), dump_sidecar(type_config))
+            # The catalog holds local paths; object store keys would read as folders on this machine
+            if isinstance(self.filesystem, LocalFileSystem):
+                self.catalog.record(type_config, project_path, VOLUME_KEYS[type_config.project_type])
+    
+    def _iter_project_tree(self, type_config: ProjectConfig, project_path: Path, template: Dict[str, Any]) -> Iterator[GenerationEvent]:
+        started = time.monotonic()
+        yield GenerationEvent(PROJECT_EVENT, project_path)
+        yield from self.iter_create_folders(project_path, template, type_config)
+        yield GenerationEvent(PROJECT_DONE_EVENT, project_path, seconds=time.monotonic() - started)
+    
+    def _iter_concurrently(self, plan: List[Tuple[ProjectConfig, Path, Dict[str, Any]]]) -> Iterator[GenerationEvent]:
+        """Create each planned tree in its own thread, yielding events as they arrive."""
+        events: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        stop = threading.Event()
+        finished = object()
+        
+        def create(item):
+            try:
+                for event in self._iter_project_tree(*item):
+                    if stop.is_set():
+                        break
+                    events.put(event)
+            except Exception as e:
+                events.put(e)
+            finally:
+                events.put(finished)
+        
+        for item in plan:
+            threading.Thread(target=create, args=(item,), daemon=True).start()
+        
+        remaining = len(plan)
+        error = None
+        try:
+            while remaining:
+                item = events.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    error = error or item
+                    stop.set()
+                else:
+                    yield item
+        finally:
+            # If the consumer stopped early, let the workers finish without blocking on the queue
+            stop.set()
+            while remaining:
+                if events.get() is finished:
+                    remaining -= 1
+        
+        if error is not None:
+            raise error
+    
+    def plan_hash(self, plan: List[Tuple[ProjectConfig, Path, Dict[str, Any]]]) -> str:
+        """Hash a resolved plan: where it goes, its templates, permissions and every folder they expand to."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(self.filesystem.identity().encode())
+        digest.update(json.dumps(self.config.folder_permissions, sort_keys=True).encode())
+        for type_config, project_path, template in plan:
+            digest.update(b"\0project\0" + os.path.abspath(project_path).encode())
+            digest.update(json.dumps(template, sort_keys=True, default=str).encode())
+            for folder_path in self.iter_folders(project_path, template, type_config):
+                digest.update(b"\0" + str(folder_path.relative_to(project_path)).encode())
+        return digest.hexdigest()
+    
+    def generate_project(self, config: ProjectConfig, directory_analysis: Dict[str, Any] = None,
+                         on_event: Optional[Callable[[GenerationEvent], None]] = None,
+                         keep_folders: bool = True, force: bool = False) -> Dict[str, Any]:
+        """Generate a complete project structure.
+        
+        Pass keep_folders=False for large generations to get only counts in
+        the result, and on_event to see each folder as it is created. A plan
+        already in the generation ledger is skipped once its project roots are
+        found to exist, unless force is set.
+        """
+        summary = GenerationSummary(keep_folders)
         results = {
             "success": True,
             "message": "",
-            "created_folders": [],
-            "project_paths": []
+            "created_folders": summary.folders,
+            "project_paths": summary.project_paths,
+            "skipped": False
         }
         
         try:
             project_folder_name = self.generate_project_folder_name(config)
+            plan = self.plan_project(config, directory_analysis)
+            plan_hash = self.plan_hash(plan)
             
-            # Handle both photo and video projects
-            project_types = []
-            if config.project_type == ProjectType.BOTH:
-                project_types = [ProjectType.PHOTOGRAPHY, ProjectType.VIDEOGRAPHY]
-            else:
-                project_types = [config.project_type]
-            
-            for project_type in project_types:
-                # Create a new config for each type
-                type_config = ProjectConfig(**config.dict())
-                type_config.project_type = project_type
-                
-                # Get base path for this project type
-                base_path = self.get_project_base_path(type_config, directory_analysis)
-                project_path = base_path / project_folder_name
-                
-                # Determine template name
-                if project_type == ProjectType.PHOTOGRAPHY:
-                    template_name = f"photography_{config.work_type.value}"
-                else:
-                    template_name = f"videography_{config.work_type.value}"
-                
-                # Load template and create folders
-                template = self.load_template(template_name)
-                created_folders = self.create_folders(project_path, template, type_config)
-                
-                results["created_folders"].extend(created_folders)
-                results["project_paths"].append(project_path)
+            entry = None if force else self.ledger.get(plan_hash)
+            if entry is not None and all(self.filesystem.is_dir(path) for _, path, _ in plan):
+                summary.project_paths.extend(path for _, path, _ in plan)
+                results.update(skipped=True, folder_count=entry["folder_count"],
+                               existing_count=entry["folder_count"], timings={}, file_count=0, bytes_saved=0,
+                               clone_methods={},
+                               message=f"Already created: {project_folder_name}")
+                return results
             
-            # Add project to client if it's client work
-            if config.work_type == WorkType.CLIENT and config.client_name:
-                client_manager.add_project_to_client(config.client_name, project_folder_name)
+            for event in self._iter_plan(config, plan):
+                summary.add(event)
+                if on_event is not None:
+                    on_event(event)
             
+            self.ledger.record(plan_hash, summary.project_paths, summary.folder_count)
             results["message"] = f"Successfully created project: {project_folder_name}"
             
         except Exception as e:
             results["success"] = False
             results["message"] = f"Error creating project: {str(e)}"
         
+        results["folder_count"] = summary.folder_count
+        results["existing_count"] = summary.existing_count
+        results["timings"] = summary.timings
+        results["file_count"] = summary.file_count
+        results["bytes_saved"] = summary.bytes_saved
+        results["clone_methods"] = summary.clone_methods
         return results
     
     def generate_assets_structure(self, base_path: Optional[Path] = None) -> Dict[str, Any]:
@@ -458,7 +639,7 @@ class ProjectGenerator:
         
         try:
             if base_path is None:
-                base_path = config_manager.get_base_path()
+                base_path = config_manager.get_volume_root("assets")
             
             assets_path = base_path / self.config.base_directories["assets"]
             template = self.load_template("assets")
@@ -472,6 +653,7 @@ class ProjectGenerator:
             
             created_folders = self.create_folders(assets_path, template, dummy_config)
             results["created_folders"] = created_folders
+            results["folder_count"] = len(created_folders)
             results["message"] = f"Successfully created Assets & Resources structure at: {assets_path}"
             
         except Exception as e:
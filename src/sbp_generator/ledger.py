@@ -0,0 +1,70 @@
+"""
+Generation ledger for the SBP Folder Generator CLI.
+
+Records every completed generation under a hash of its resolved plan: the
+project paths, the templates and the folders they expand to. Repeating an
+identical request can then be answered from the ledger after checking that
+the project roots still exist, instead of repeating every mkdir.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .config import config_manager
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    plan_hash TEXT PRIMARY KEY, project_paths TEXT, folder_count INTEGER, completed TEXT
+);
+"""
+
+
+class GenerationLedger:
+    """Completed generations, keyed by plan hash."""
+    
+    def __init__(self, db_file: Optional[Path] = None):
+        self._db_file = db_file
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def db_file(self) -> Path:
+        return self._db_file or config_manager.cache_dir / "ledger.db"
+    
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+    
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def get(self, plan_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the completed generation with this plan hash, if any."""
+        with self._lock:
+            row = self.db.execute("SELECT project_paths, folder_count, completed FROM generations WHERE plan_hash = ?",
+                                  (plan_hash,)).fetchone()
+        if row is None:
+            return None
+        return {"project_paths": [Path(p) for p in json.loads(row[0])], "folder_count": row[1],
+                "completed": datetime.fromisoformat(row[2])}
+    
+    def record(self, plan_hash: str, project_paths: List[Path], folder_count: int) -> None:
+        with self._lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?)",
+                            (plan_hash, json.dumps([str(p) for p in project_paths]), folder_count,
+                             datetime.now().isoformat()))
+
+
+# Global ledger instance
+generation_ledger = GenerationLedger()
\ No newline at end of file
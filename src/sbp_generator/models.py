@@ -2,7 +2,7 @@
 Data models for the SBP Folder Generator CLI.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, validator
@@ -64,6 +64,13 @@ class CameraAssignment(BaseModel):
         return f"{self.purpose.value}-{self.camera.get_folder_name()}"
 
 
+def is_camera_folder(name: str) -> bool:
+    """Check for a camera folder name as get_folder_name() makes them, such as 'drone-DJI-Mini-3'."""
+    purpose, _, camera = name.partition("-")
+    return (purpose.casefold() in {p.value.casefold() for p in CameraPurpose} and bool(camera)
+            and all(c.isalnum() or c == "-" for c in camera))
+
+
 class Client(BaseModel):
     """Model for client information."""
     name: str
@@ -77,6 +84,13 @@ class Client(BaseModel):
             raise ValueError('Client name cannot be empty')
         return v.strip()
 
+    @validator('created_date')
+    def created_date_must_be_naive(cls, v):
+        # Imported dates may carry a UTC offset; store every date naive so they can be compared
+        if v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
 
 class ProjectConfig(BaseModel):
     """Configuration for project creation."""
@@ -104,6 +118,26 @@ class ProjectConfig(BaseModel):
         return v.strip() if v else None
 
 
+class FolderPermission(BaseModel):
+    """Model for the permissions given to project folders matching a pattern."""
+    folder: str
+    mode: Optional[str] = None
+    group: Optional[str] = None
+    default_acl: Optional[str] = None
+
+    @validator('mode')
+    def mode_must_be_octal(cls, v):
+        if v is None:
+            return v
+        try:
+            mode = int(v, 8)
+        except ValueError:
+            raise ValueError(f'Mode must be octal, e.g. 2775: {v}')
+        if not 0 <= mode <= 0o7777:
+            raise ValueError(f'Mode out of range: {v}')
+        return v
+
+
 class FolderStructure(BaseModel):
     """Model for folder structure definitions."""
     name: str
@@ -125,6 +159,25 @@ class AppConfig(BaseModel):
     }
     client_work_subfolder: str = "Client Work"
     personal_work_subfolder: str = "Personal Work"
+    # Other names recognised for existing folders when detecting where we are
+    type_folder_aliases: Dict[str, List[str]] = {
+        "photography": ["Photography", "PHOTO"],
+        "videography": ["Videography", "VIDEO"]
+    }
+    work_folder_aliases: Dict[str, List[str]] = {
+        "client": ["Client Work"],
+        "personal": ["Personal Work"]
+    }
+    # Folder levels below the work folders, e.g. ["{client_initial}", "{client}"] to shard clients
+    client_layout: List[str] = ["{client}"]
+    personal_layout: List[str] = ["{year}"]
+    # Folders holding PHOTO/VIDEO; when set, only type folders directly inside them are recognised
+    archive_roots: List[str] = []
+    # Per-volume roots holding each base directory, e.g. {"videography": "/Volumes/Video RAID"}
+    volume_roots: Dict[str, str] = {}
+    # Applied in order to folders inside each project, later matches overriding earlier ones, e.g.
+    # [{"folder": "*", "mode": "2775", "group": "studio"}, {"folder": "Contracts & Briefs", "mode": "2550"}]
+    folder_permissions: List[Dict[str, str]] = []
     default_cameras: List[Dict[str, str]] = [
         {"name": "Lumix", "brand": "Panasonic"},
         {"name": "DJI POCKET", "brand": "DJI"},
@@ -0,0 +1,91 @@
+"""
+Output modes for the SBP Folder Generator CLI.
+
+In the default text mode commands render with rich. In JSON-lines mode they
+emit one JSON record per line instead, collected in a buffer and written in
+large chunks so big runs don't pay for a terminal write per folder.
+"""
+
+import json
+import sys
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, List, Optional, TextIO
+
+
+OUTPUT_FORMATS = ("text", "jsonl")
+
+# Flush once this many characters are buffered
+BUFFER_SIZE = 64 * 1024
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "dict"):
+        return value.dict()
+    return str(value)
+
+
+class OutputWriter:
+    """Writes JSON-lines records through a buffer, and remembers the output settings."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.output_format = "text"
+        self.quiet = False
+        self._stream = stream
+        self._buffer: List[str] = []
+        self._buffered = 0
+
+    def configure(self, output_format: str = "text", quiet: bool = False, stream: Optional[TextIO] = None) -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.flush()
+        self.output_format = output_format
+        self.quiet = quiet
+        self._stream = stream
+
+    @property
+    def jsonl(self) -> bool:
+        return self.output_format == "jsonl"
+
+    def emit(self, record_type: str, stderr: bool = False, **fields: Any) -> None:
+        """Queue one record, e.g. emit("client", name="ABC Corp")."""
+        line = json.dumps({"type": record_type, **fields}, default=_json_default, ensure_ascii=False) + "\n"
+        if stderr:
+            # Diagnostics go straight out so they interleave sensibly with stdout data
+            sys.stderr.write(line)
+            sys.stderr.flush()
+            return
+
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= BUFFER_SIZE:
+            self.flush()
+
+    def warn(self, message: str) -> None:
+        """Report a warning on stderr, as a record in JSON-lines mode, so it never mixes with stdout data."""
+        if self.jsonl:
+            self.emit("message", stderr=True, level="warning", message=message)
+        else:
+            sys.stderr.write(f"Warning: {message}\n")
+            sys.stderr.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        # Looked up at flush time so redirected or captured stdout is honoured
+        stream = self._stream or sys.stdout
+        stream.write("".join(self._buffer))
+        stream.flush()
+        self._buffer = []
+        self._buffered = 0
+
+
+# Global output instance
+output = OutputWriter()
\ No newline at end of file
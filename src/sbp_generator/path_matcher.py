@@ -0,0 +1,247 @@
+"""
+Archive layout matching for the SBP Folder Generator CLI.
+
+The layout described by ``AppConfig`` (type folders and their aliases, the
+work folders, and the levels below them such as ``{client}`` or
+``{year}``) is compiled into a trie of folder-name segments. Matching a
+path is then a single pass over its parts with a dictionary lookup per
+level, and needs no filesystem access at all.
+
+Layout segments are literal folder names or one of the placeholders below,
+so sharded clients can be described as ``["{client_initial}", "{client}"]``
+and an extra level as ``["Clients", "{client}"]``.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .models import AppConfig
+from .filesystem import FileSystem, local_filesystem
+
+
+CLIENT = "{client}"
+CLIENT_INITIAL = "{client_initial}"
+YEAR = "{year}"
+
+# The skip_folders entry recorded when a layout level is already part of the path
+SEGMENT_TOKENS = {CLIENT: "client_folder", CLIENT_INITIAL: "client_shard", YEAR: "year_folder"}
+
+PROJECT_TYPES = ("photography", "videography")
+
+
+def segment_token(segment: str) -> str:
+    """Get the skip_folders entry for a layout segment."""
+    return SEGMENT_TOKENS.get(segment, f"level:{segment}")
+
+
+def render_segment(segment: str, client_name: Optional[str] = None, year: Optional[int] = None) -> str:
+    """Get the folder name a layout segment stands for."""
+    if segment == CLIENT:
+        return client_name
+    if segment == CLIENT_INITIAL:
+        initial = client_name[:1].upper()
+        return initial if initial.isalpha() else "#"
+    if segment == YEAR:
+        return str(year)
+    return segment
+
+
+def segment_matches(segment: str, name: str) -> bool:
+    """Check whether a folder name can stand at a layout level."""
+    if name.startswith('.'):
+        return False
+    if segment == YEAR:
+        return name.isdigit()
+    return segment in SEGMENT_TOKENS or name == segment
+
+
+def validate_layout(layout: List[str], required: str) -> None:
+    """Check a layout has exactly one `required` placeholder and only known placeholders."""
+    for segment in layout:
+        if segment.startswith("{") and segment not in SEGMENT_TOKENS:
+            raise ValueError(f"Unknown layout placeholder: {segment}")
+        if not segment or "/" in segment or "\\" in segment:
+            raise ValueError(f"Invalid layout segment: '{segment}'")
+    if layout.count(required) != 1:
+        raise ValueError(f"Layout {layout} must contain {required} exactly once")
+
+
+class _Node:
+    """One level of the layout: the analysis fields it sets and the levels below it."""
+    
+    __slots__ = ("token", "fields", "capture", "children", "wildcard")
+    
+    def __init__(self, token: Optional[str] = None, fields: Optional[Dict[str, Any]] = None,
+                 capture: Optional[str] = None):
+        self.token = token
+        self.fields = fields or {}
+        self.capture = capture
+        self.children: Dict[str, "_Node"] = {}
+        self.wildcard: Optional["_Node"] = None
+    
+    def step(self, part: str) -> Optional["_Node"]:
+        child = self.children.get(part)
+        if child is not None:
+            return child
+        if self.wildcard is not None and not part.startswith('.'):
+            if self.wildcard.capture == "detected_year" and not part.isdigit():
+                return None
+            return self.wildcard
+        return None
+
+
+class LayoutMatcher:
+    """Matches paths against the archive layout in O(depth)."""
+    
+    def __init__(self, config: AppConfig, filesystem: Optional[FileSystem] = None):
+        self.config = config
+        self.filesystem = filesystem or local_filesystem
+        self.archive_roots = [Path(os.path.abspath(os.path.expanduser(root))) for root in config.archive_roots]
+        self.client_work_names = self._names(config.client_work_subfolder, config.work_folder_aliases.get("client"))
+        self.personal_work_names = self._names(config.personal_work_subfolder,
+                                               config.work_folder_aliases.get("personal"))
+        self.type_names = {project_type: self._names(config.base_directories[project_type],
+                                                     config.type_folder_aliases.get(project_type))
+                           for project_type in PROJECT_TYPES}
+        
+        validate_layout(config.client_layout, CLIENT)
+        validate_layout(config.personal_layout, YEAR)
+        
+        self.root = _Node()
+        for project_type, names in self.type_names.items():
+            type_node = _Node(project_type, {"detected_type": project_type})
+            for name in names:
+                self.root.children.setdefault(name, type_node)
+            
+            client_node = _Node("client_work", {"detected_work_type": "client"})
+            for name in self.client_work_names:
+                type_node.children[name] = client_node
+            self._add_layout(client_node, config.client_layout)
+            
+            personal_node = _Node("personal_work", {"detected_work_type": "personal"})
+            for name in self.personal_work_names:
+                type_node.children[name] = personal_node
+            self._add_layout(personal_node, config.personal_layout)
+    
+    @staticmethod
+    def _names(name: str, aliases: Optional[List[str]]) -> List[str]:
+        return [name] + [alias for alias in (aliases or []) if alias != name]
+    
+    @staticmethod
+    def _add_layout(node: _Node, layout: List[str]) -> None:
+        for segment in layout:
+            if segment == CLIENT:
+                child = _Node(segment_token(segment), capture="detected_client")
+            elif segment == YEAR:
+                child = _Node(segment_token(segment), capture="detected_year")
+            else:
+                child = _Node(segment_token(segment))
+            
+            if segment in SEGMENT_TOKENS:
+                node.wildcard = child
+            else:
+                node.children[segment] = child
+            node = child
+    
+    def match(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Match a path against the layout.
+        
+        Returns None when the path isn't inside a type folder. Otherwise
+        returns the detected fields, the skip_folders tokens for every level
+        already in the path, the deepest matched folder as `suggested_base`,
+        and `archive_base`, the folder holding the type folder.
+        """
+        parts = Path(os.path.abspath(str(path))).parts
+        start = self._find_type_folder(parts)
+        if start is None:
+            return None
+        
+        result: Dict[str, Any] = {
+            "detected_type": None,
+            "detected_work_type": None,
+            "detected_client": None,
+            "detected_year": None,
+            "skip_folders": [],
+            "client_work_path": None,
+            "archive_base": Path(*parts[:start]),
+        }
+        
+        node = self.root
+        end = start
+        for index in range(start, len(parts)):
+            child = node.step(parts[index])
+            if child is None:
+                break
+            node = child
+            end = index + 1
+            result.update(node.fields)
+            result["skip_folders"].append(node.token)
+            if node.capture == "detected_client":
+                result["detected_client"] = parts[index]
+            elif node.capture == "detected_year":
+                result["detected_year"] = int(parts[index])
+            if node.token == "client_work":
+                result["client_work_path"] = Path(*parts[:end])
+        
+        result["suggested_base"] = Path(*parts[:end])
+        return result
+    
+    def _find_type_folder(self, parts: Tuple[str, ...]) -> Optional[int]:
+        """Find where the type folder sits in a path's parts."""
+        if self.archive_roots:
+            # Only a type folder directly inside a configured archive root counts
+            for root in self.archive_roots:
+                depth = len(root.parts)
+                if parts[:depth] == root.parts and depth < len(parts) and parts[depth] in self.root.children:
+                    return depth
+            return None
+        
+        for index, part in enumerate(parts):
+            if part in self.root.children:
+                return index
+        return None
+    
+    def client_work_paths(self, archive_base: Path) -> List[Path]:
+        """Find the Client Work folders of an archive with one listing per level."""
+        paths = []
+        for type_entry in self.filesystem.list_dirs(archive_base):
+            if type_entry not in self.root.children:
+                continue
+            for work_entry in self.filesystem.list_dirs(archive_base / type_entry):
+                if work_entry in self.client_work_names:
+                    paths.append(archive_base / type_entry / work_entry)
+        return paths
+    
+    def client_levels(self) -> List[str]:
+        """Get the layout levels between Client Work and the client folder."""
+        layout = self.config.client_layout
+        return layout[:layout.index(CLIENT)]
+    
+    def client_path(self, client_work_path: Path, client_name: str) -> Optional[Path]:
+        """Get where the layout puts a client's folder, or None if a level above it is a year."""
+        levels = self.client_levels()
+        if YEAR in levels:
+            return None
+        return client_work_path.joinpath(*(render_segment(segment, client_name) for segment in levels + [CLIENT]))
+    
+    def iter_client_names(self, client_work_path: Path) -> List[str]:
+        """List the client folders below a Client Work folder, following the layout."""
+        return [path.name for _, path in self.walk_layout(client_work_path, self.client_levels() + [CLIENT])]
+    
+    def walk_layout(self, folder: Path, layout: List[str],
+                    list_dirs: Optional[Callable[[Path], List[str]]] = None) -> List[Tuple[Dict[str, str], Path]]:
+        """Find the folders a run of layout levels leads to below a folder.
+        
+        Returns (folder name each placeholder matched, folder) pairs. Literal
+        levels are joined without a listing, so only placeholder levels cost
+        one listing per folder. `list_dirs` defaults to the filesystem's.
+        """
+        list_dirs = list_dirs or self.filesystem.list_dirs
+        matches: List[Tuple[Dict[str, str], Path]] = [({}, folder)]
+        for segment in layout:
+            if segment in SEGMENT_TOKENS:
+                matches = [({**captured, segment: name}, path / name) for captured, path in matches
+                           for name in list_dirs(path) if segment_matches(segment, name)]
+            else:
+                matches = [(captured, path / segment) for captured, path in matches]
+        return matches
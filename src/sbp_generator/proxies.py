@@ -0,0 +1,155 @@
+"""
+Proxy cleanup for the SBP Folder Generator CLI.
+
+Finds the Proxies folders that ``create_folders`` makes when proxies are
+enabled, measures them in parallel and removes their contents for projects
+that match age, client or delivery rules. Pruning is two steps: a dry run
+saves a plan, and a commit deletes exactly what that plan listed, skipping
+anything that changed in between.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS, atomic_write, raise_errors, walk_tree
+from .generators import project_generator
+from .archiver import project_date
+from .scanner import iter_project_folders, type_roots
+
+
+DELIVERABLES_FOLDER = "Deliverables"
+
+PROXY_TEMPLATES = ("videography_client", "videography_personal")
+
+
+def proxy_folders() -> Set[str]:
+    """Get the project-relative Proxies folders the video templates can create."""
+    folders = set()
+    for template_name in PROXY_TEMPLATES:
+        template = project_generator.load_template(template_name)
+        folders.update(f for f in template.get("optional_folders", []) if "Proxies" in f)
+    return folders or {"Footage/Proxies"}
+
+
+def tree_size(path: Path) -> Tuple[int, int]:
+    """Count the files and bytes below a folder."""
+    files = size = 0
+    for entry, _ in walk_tree(path):
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                files += 1
+                size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return files, size
+
+
+def empty_tree(path: Path) -> None:
+    """Delete every file below a folder, keeping the folders themselves, such as per-camera Proxies folders."""
+    for entry, _ in walk_tree(path, on_error=raise_errors):
+        if not entry.is_dir(follow_symlinks=False):
+            os.unlink(entry.path)
+
+
+def has_deliverables(project_path: Path) -> bool:
+    """Check whether a project's Deliverables folder holds at least one file."""
+    for entry, _ in walk_tree(project_path / DELIVERABLES_FOLDER):
+        if not entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+            return True
+    return False
+
+
+class ProxyPruner:
+    """Plans and applies the removal of proxy media from finished projects."""
+    
+    def __init__(self, base_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS,
+                 plan_file: Optional[Path] = None):
+        self.base_path = Path(os.path.abspath(str(base_path))) if base_path else None
+        # The plan is only valid for the type folders it was made from
+        self.roots = {project_type: str(root) for project_type, root in type_roots(self.base_path)}
+        self.workers = workers
+        self.plan_file = plan_file or config_manager.cache_dir / "proxies_plan.json"
+    
+    def plan(self, older_than: Optional[timedelta] = None, client: Optional[str] = None,
+             delivered: bool = False, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Find and measure the Proxies folders of matching projects, and save them as the plan."""
+        cutoff = (now or datetime.now()) - older_than if older_than else None
+        relative_folders = sorted(proxy_folders())
+        
+        candidates = []
+        for _, client_name, year, project_path in iter_project_folders(self.base_path):
+            if client and client_name != client:
+                continue
+            if cutoff is not None:
+                date = project_date(client_name, year, project_path)
+                if date is None or date >= cutoff:
+                    continue
+            for relative in relative_folders:
+                candidates.append((client_name, project_path, project_path / relative))
+        
+        def measure(candidate):
+            client_name, project_path, proxies_path = candidate
+            if not proxies_path.is_dir():
+                return None
+            if delivered and not has_deliverables(project_path):
+                return None
+            files, size = tree_size(proxies_path)
+            if not files:
+                return None
+            return {"client": client_name, "project": project_path.name, "path": str(proxies_path),
+                    "files": files, "bytes": size}
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            entries = [entry for entry in pool.map(measure, candidates) if entry]
+        
+        entries.sort(key=lambda e: e["bytes"], reverse=True)
+        self._save_plan(entries)
+        return entries
+    
+    def load_plan(self) -> List[Dict[str, Any]]:
+        """Load the plan saved by the last dry run for this archive."""
+        try:
+            with open(self.plan_file, 'r', encoding='utf-8') as f:
+                plan = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            raise ValueError("No saved prune plan, run `proxies prune` without --commit first")
+        if plan.get("roots") != self.roots:
+            saved = ", ".join((plan.get("roots") or {}).values())
+            raise ValueError(f"The saved plan is for {saved or 'another archive'}, not {', '.join(self.roots.values())}")
+        return plan["entries"]
+    
+    def commit(self) -> Dict[str, Any]:
+        """Empty the Proxies folders in the saved plan that are unchanged since it was made."""
+        entries = self.load_plan()
+        
+        def prune(entry):
+            proxies_path = Path(entry["path"])
+            if tree_size(proxies_path) != (entry["files"], entry["bytes"]):
+                return entry, False
+            try:
+                empty_tree(proxies_path)
+            except OSError:
+                return entry, False
+            return entry, True
+        
+        result = {"pruned": 0, "skipped": [], "reclaimed_bytes": 0}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for entry, pruned in pool.map(prune, entries):
+                if pruned:
+                    result["pruned"] += 1
+                    result["reclaimed_bytes"] += entry["bytes"]
+                else:
+                    result["skipped"].append(entry["path"])
+        
+        os.remove(self.plan_file)
+        return result
+    
+    def _save_plan(self, entries: List[Dict[str, Any]]) -> None:
+        self.plan_file.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.plan_file) as f:
+            json.dump({"roots": self.roots, "created": datetime.now().isoformat(),
+                       "entries": entries}, f)
\ No newline at end of file
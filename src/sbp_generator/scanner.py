@@ -0,0 +1,219 @@
+"""
+Archive scanning for the SBP Folder Generator CLI.
+
+Finds client and project folders on disk (rather than in the clients
+database) using parallel os.scandir workers, with results cached against
+directory modification times so unchanged folders are never re-listed.
+
+Client stats still stat every project folder on each scan, as the assets
+index stats every directory: work inside a project changes the project's
+mtime but not its client's, so a cache keyed on client folders alone would
+report a stale "last modified" project. A repeat scan therefore costs one
+stat per project, run across the worker pool, and no directory listings
+for clients that haven't changed.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS, atomic_write, list_subdirectories
+from .generators import project_generator
+from .path_matcher import CLIENT, YEAR, LayoutMatcher
+
+
+PROJECT_TYPES = ("photography", "videography")
+
+
+def client_work_roots(base_path: Optional[Path] = None) -> List[Tuple[str, Path]]:
+    """Get the (project type, Client Work folder) pairs for an archive."""
+    config = config_manager.config
+    return [(project_type, type_root(base_path, project_type) / config.client_work_subfolder)
+            for project_type in PROJECT_TYPES]
+
+
+def type_root(base_path: Optional[Path], project_type: str) -> Path:
+    """Get a type folder, on its own volume unless an explicit base path is given."""
+    if base_path:
+        return Path(base_path) / config_manager.config.base_directories[project_type]
+    return config_manager.get_base_path(project_type)
+
+
+def type_roots(base_path: Optional[Path] = None) -> List[Tuple[str, Path]]:
+    """Get the (project type, absolute type folder) pairs for an archive."""
+    return [(project_type, Path(os.path.abspath(str(type_root(base_path, project_type)))))
+            for project_type in PROJECT_TYPES]
+
+
+def iter_client_folders(base_path: Optional[Path] = None) -> Iterator[Tuple[str, str, Path]]:
+    """Yield (project type, client name, folder holding the client's projects) for every client on disk.
+    
+    Clients are found through the client layout, so sharded or nested
+    Client Work folders are followed; the folder yielded is the client
+    folder, or the levels the layout puts below it.
+    """
+    config = config_manager.config
+    matcher = LayoutMatcher(config)
+    for project_type, client_work_path in client_work_roots(base_path):
+        for captured, path in matcher.walk_layout(client_work_path, config.client_layout):
+            yield project_type, captured[CLIENT], path
+
+
+def iter_project_folders(base_path: Optional[Path] = None) -> Iterator[Tuple[str, Optional[str], Optional[str], Path]]:
+    """Yield (project type, client name, year, project folder) for every project on disk.
+    
+    Client projects have no year folder and personal projects have no client.
+    """
+    config = config_manager.config
+    for project_type, client_name, projects_path in iter_client_folders(base_path):
+        for entry in list_subdirectories(projects_path):
+            yield project_type, client_name, None, Path(entry.path)
+    
+    matcher = LayoutMatcher(config)
+    for project_type in PROJECT_TYPES:
+        personal_work = type_root(base_path, project_type) / config.personal_work_subfolder
+        for captured, projects_path in matcher.walk_layout(personal_work, config.personal_layout):
+            for entry in list_subdirectories(projects_path):
+                yield project_type, None, captured[YEAR], Path(entry.path)
+
+
+class MtimeCache:
+    """A JSON cache of per-directory results, valid while the directory's mtime is unchanged."""
+    
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._changed = False
+    
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+    
+    def get(self, path: Path, mtime_ns: int) -> Optional[Any]:
+        """Get the cached value for a directory if it hasn't changed since."""
+        entry = self.entries.get(str(path))
+        if entry is not None and entry["mtime_ns"] == mtime_ns:
+            return entry["value"]
+        return None
+    
+    def put(self, path: Path, mtime_ns: int, value: Any) -> None:
+        self.entries[str(path)] = {"mtime_ns": mtime_ns, "value": value}
+        self._changed = True
+    
+    def prune(self, keep: set, roots: List[Path]) -> None:
+        """Drop entries below `roots` for directories that are no longer there."""
+        prefixes = tuple(os.path.join(str(root), '') for root in roots)
+        for key in [k for k in self.entries if k.startswith(prefixes) and k not in keep]:
+            del self.entries[key]
+            self._changed = True
+    
+    def save(self) -> None:
+        if not self._changed:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.cache_file) as f:
+            json.dump(self._entries, f)
+        self._changed = False
+
+
+class ClientStatsScanner:
+    """Collects per-client project statistics from the folders on disk."""
+    
+    def __init__(self, base_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS,
+                 cache_file: Optional[Path] = None):
+        self.base_path = base_path
+        self.workers = workers
+        self.cache = MtimeCache(cache_file or config_manager.cache_dir / "client_stats.json")
+    
+    def scan(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """Scan every Client Work folder and return one stats record per client."""
+        client_folders = list(iter_client_folders(self.base_path))
+        self.cache.entries  # Load once before the workers share it
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            listings = list(pool.map(lambda folder: self._list_projects(folder[2], use_cache), client_folders))
+        
+        self.cache.prune({str(path) for _, _, path in client_folders},
+                         [root for _, root in client_work_roots(self.base_path)])
+        self.cache.save()
+        
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (project_type, client_name, _), projects in zip(client_folders, listings):
+            record = stats.setdefault(client_name, {
+                "client": client_name,
+                "photo_projects": 0,
+                "video_projects": 0,
+                "projects": set(),
+                "last_modified": None,
+                "last_modified_project": None,
+                "first_date": None,
+                "last_date": None,
+            })
+            record["photo_projects" if project_type == "photography" else "video_projects"] += len(projects)
+            
+            for project_name, mtime in projects:
+                record["projects"].add(project_name)
+                if record["last_modified"] is None or mtime > record["last_modified"]:
+                    record["last_modified"] = mtime
+                    record["last_modified_project"] = project_name
+                
+                project_date, _ = project_generator.parse_project_folder_name(project_name)
+                if project_date:
+                    if record["first_date"] is None or project_date < record["first_date"]:
+                        record["first_date"] = project_date
+                    if record["last_date"] is None or project_date > record["last_date"]:
+                        record["last_date"] = project_date
+        
+        results = []
+        for record in stats.values():
+            record["project_count"] = len(record.pop("projects"))
+            if record["last_modified"] is not None:
+                record["last_modified"] = datetime.fromtimestamp(record["last_modified"])
+            results.append(record)
+        return results
+    
+    def _list_projects(self, client_path: Path, use_cache: bool) -> List[Tuple[str, float]]:
+        """List (project folder, mtime) pairs in a folder holding a client's projects.
+        
+        Only the folder names are cached against that folder's mtime;
+        work inside a project changes the project's mtime but not its
+        client's, so each project is stat'ed on every scan.
+        """
+        try:
+            mtime_ns = client_path.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        names = self.cache.get(client_path, mtime_ns) if use_cache else None
+        if names is None or not all(isinstance(name, str) for name in names):
+            names = [entry.name for entry in list_subdirectories(client_path)]
+            self.cache.put(client_path, mtime_ns, names)
+        
+        projects = []
+        for name in names:
+            try:
+                projects.append((name, os.stat(client_path / name, follow_symlinks=False).st_mtime))
+            except OSError:
+                continue
+        return projects
+
+
+def sort_client_stats(stats: List[Dict[str, Any]], sort_by: str = "name", reverse: bool = False) -> List[Dict[str, Any]]:
+    """Sort client stats by name, projects, last (modified) or first (project date)."""
+    oldest = datetime.min
+    keys = {
+        "name": lambda r: r["client"].lower(),
+        "projects": lambda r: (r["project_count"], r["client"].lower()),
+        "last": lambda r: (r["last_modified"] or oldest, r["client"].lower()),
+        "first": lambda r: (r["first_date"] or oldest, r["client"].lower()),
+    }
+    return sorted(stats, key=keys[sort_by], reverse=reverse)
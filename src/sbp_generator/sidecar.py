@@ -0,0 +1,79 @@
+"""
+Project sidecars for the SBP Folder Generator CLI.
+
+Every generated project folder gets a ``.sbp/project.json`` file holding
+the full ``ProjectConfig`` it was made from: client, date, type, work type,
+cameras and options, none of which survive in the folder name alone. Indexes
+such as the project catalog can then be rebuilt from the archive itself by
+reading one small file per project, found with a parallel walk that stops
+descending at each project root.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from .fsutil import DEFAULT_WORKERS, list_subdirectories
+from .models import ProjectConfig
+
+
+SIDECAR_DIR = ".sbp"
+SIDECAR_FILE = "project.json"
+SIDECAR_VERSION = 1
+
+
+def sidecar_path(project_path: Path) -> Path:
+    return Path(project_path) / SIDECAR_DIR / SIDECAR_FILE
+
+
+def dump_sidecar(config: ProjectConfig) -> bytes:
+    """Serialise a project's configuration as sidecar contents."""
+    data = {"version": SIDECAR_VERSION, "generated": datetime.now().isoformat(), "config": config.dict()}
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def read_sidecar(project_path: Path) -> Optional[ProjectConfig]:
+    """Read a project's sidecar, or None if it is missing or can't be parsed."""
+    try:
+        with open(sidecar_path(project_path), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return ProjectConfig(**data["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _scan(path: str) -> Tuple[bool, List[str]]:
+    """List a folder's visible subfolders, or report that it is a project root."""
+    entries = list_subdirectories(path, include_hidden=True)
+    if any(entry.name == SIDECAR_DIR for entry in entries):
+        return True, []
+    return False, [entry.path for entry in entries if not entry.name.startswith('.')]
+
+
+def iter_sidecars(roots: List[Path], max_depth: int,
+                  workers: int = DEFAULT_WORKERS) -> Iterator[Tuple[Path, Path, Optional[ProjectConfig]]]:
+    """Yield (root, project folder, config) for every project with a sidecar below the roots.
+    
+    Folders are listed one level at a time across a thread pool. A folder
+    holding a sidecar is a project root and is never descended into, and
+    nothing deeper than `max_depth` below a root is listed, so the insides of
+    projects are never walked. The config is None for a sidecar that can't
+    be read.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        level = [(Path(root), str(root)) for root in roots]
+        for depth in range(max_depth + 1):
+            if not level:
+                break
+            projects, next_level = [], []
+            for (root, path), (is_project, children) in zip(level, pool.map(_scan, [path for _, path in level])):
+                if is_project:
+                    projects.append((root, Path(path)))
+                elif depth < max_depth:
+                    next_level.extend((root, child) for child in children)
+            
+            configs = pool.map(read_sidecar, [path for _, path in projects])
+            for (root, path), config in zip(projects, configs):
+                yield root, path, config
+            level = next_level
\ No newline at end of file
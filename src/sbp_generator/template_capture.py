@@ -0,0 +1,107 @@
+"""
+Template capture for the SBP Folder Generator CLI.
+
+Turns the folder layout of an existing, well-organised project back into a
+template that ``ProjectGenerator.load_template`` can use.
+"""
+
+import json
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .config import config_manager
+from .fsutil import atomic_write, list_subdirectories
+from .generators import PROJECT_ROOT
+from .models import is_camera_folder
+
+
+DEFAULT_MAX_DEPTH = 4
+
+# Folders created by `create_folders` only when the matching option is set
+OPTIONAL_MARKERS = ("Capture One", "Proxies")
+
+TEMPLATE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+def _list_subdirectories(path: str) -> List[str]:
+    """List visible subdirectory names in order, without following symlinks."""
+    return sorted(entry.name for entry in list_subdirectories(path))
+
+
+def capture_template(project_dir: Path, max_depth: int = DEFAULT_MAX_DEPTH) -> Dict[str, Any]:
+    """Build a template from the folders of an existing project.
+    
+    Only directories are read; files, hidden entries and anything below
+    ``max_depth`` are ignored, and camera folders are collapsed into a
+    ``camera_folders`` entry so they fan out from the project's camera setup.
+    """
+    if not project_dir.is_dir():
+        raise ValueError(f"Not a directory: {project_dir}")
+    
+    folders: List[str] = []
+    subfolders: Dict[str, List[str]] = {}
+    optional_folders: List[str] = []
+    camera_folders: List[str] = []
+    
+    queue = deque([("", 0)])
+    while queue:
+        relative, depth = queue.popleft()
+        children = _list_subdirectories(os.path.join(project_dir, relative) if relative else str(project_dir))
+        if not children:
+            continue
+        
+        if any(is_camera_folder(name) for name in children):
+            camera_folders.append(relative or PROJECT_ROOT)
+        
+        regular = []
+        for name in children:
+            if is_camera_folder(name):
+                continue  # Recreated from the camera setup, contents are footage
+            
+            child = f"{relative}/{name}" if relative else name
+            if any(marker in name for marker in OPTIONAL_MARKERS):
+                optional_folders.append(child)
+                # Only look inside for camera folders, the rest is generated media
+                if any(is_camera_folder(n) for n in _list_subdirectories(os.path.join(project_dir, child))):
+                    camera_folders.append(child)
+                continue
+            
+            regular.append(name)
+            if depth + 1 < max_depth:
+                queue.append((child, depth + 1))
+        
+        if not relative:
+            folders.extend(regular)
+        elif regular:
+            subfolders[relative] = regular
+    
+    template: Dict[str, Any] = {"folders": folders}
+    if subfolders:
+        template["subfolders"] = subfolders
+    if optional_folders:
+        template["optional_folders"] = optional_folders
+    if camera_folders:
+        template["camera_folders"] = camera_folders
+    return template
+
+
+def save_template(template: Dict[str, Any], name: str, overwrite: bool = False,
+                  templates_dir: Optional[Path] = None) -> Path:
+    """Save a template to the user templates folder."""
+    if not TEMPLATE_NAME_PATTERN.match(name):
+        raise ValueError(f"Invalid template name: {name}")
+    
+    templates_dir = templates_dir or config_manager.templates_dir
+    templates_dir.mkdir(parents=True, exist_ok=True)
+    template_file = templates_dir / f"{name}.json"
+    
+    if template_file.exists() and not overwrite:
+        raise ValueError(f"Template '{name}' already exists (use --force to replace it)")
+    
+    with atomic_write(template_file) as f:
+        json.dump(template, f, indent=2)
+        f.write("\n")
+    
+    return template_file
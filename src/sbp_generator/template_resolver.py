@@ -0,0 +1,339 @@
+"""
+Template inheritance for the SBP Folder Generator CLI.
+
+Templates can build on each other:
+    
+    {
+      "extends": "videography_personal",
+      "include": ["_client_paperwork"],
+      "folders": ["Thumbnail & Graphics"],
+      "remove": ["Audio"]
+    }
+
+``extends`` names one parent and ``include`` lists partial templates (by
+convention named with a leading underscore) merged in after it. The
+template's own entries come last: lists are appended without duplicates,
+``subfolders`` entries replace the inherited entry for the same folder,
+and ``remove`` drops folders (and everything below them) from the result.
+A list entry written as ``{"name": "Deliverables", "after": "Edited"}`` (or
+``"before"``) is placed next to that inherited entry instead of at the end.
+``files`` maps paths in the project to starter files or folders in the
+Assets & Resources tree, written as ``{"source": ..., "immutable": true}``
+for assets projects only read; entries for the same path replace
+inherited ones.
+
+Resolved templates are validated once and cached, in memory and on disk,
+with the modification time and size of every template file in the chain.
+A cached template is used without parsing anything while those match.
+"""
+
+import hashlib
+import json
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .cloning import starter_file
+from .config import config_manager
+from .fsutil import atomic_write
+
+
+LIST_KEYS = ("folders", "optional_folders", "camera_folders")
+COMPOSITION_KEYS = ("extends", "include", "remove")
+
+# Bump when the compiled format changes so stale cache entries are ignored
+CACHE_VERSION = 3
+
+# Look a template up in every layer
+ANY_LAYER = -1
+
+# Stat key of a template file that isn't there
+MISSING = (0, -1)
+
+
+class TemplateResolver:
+    """Resolves template inheritance into flat, validated templates."""
+    
+    def __init__(self, search_dirs: List[Path], fallback: Callable[[str], Dict[str, Any]] = None,
+                 cache_dir: Optional[Path] = None):
+        # Earlier directories win, so user templates can shadow bundled ones
+        self.search_dirs = search_dirs
+        self.fallback = fallback
+        self.cache_dir = cache_dir or config_manager.cache_dir / "templates"
+        self._compiled: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+    
+    def resolve(self, name: str) -> Dict[str, Any]:
+        """Get the flattened template for a name."""
+        cached = self._compiled.get(name)
+        if cached is not None and self._is_current(cached[0]):
+            return cached[1]
+        
+        # One cache file per name and search path, checked against the
+        # stat of every file the last resolution looked at before parsing
+        key = json.dumps([CACHE_VERSION, name, [str(d) for d in self.search_dirs]])
+        cache_file = self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+        
+        entry = self._read_cache(cache_file)
+        if entry is not None and entry.get("version") == CACHE_VERSION and self._is_current(entry["signature"]):
+            signature, template = entry["signature"], entry["template"]
+        else:
+            signature = []
+            template = _flatten(self._build(name, ANY_LAYER, signature, [], required=False))
+            self._write_cache(cache_file, {"version": CACHE_VERSION, "signature": signature,
+                                           "template": template})
+        
+        self._compiled[name] = (signature, template)
+        return template
+    
+    def clear(self) -> None:
+        """Forget every compiled template held in memory."""
+        self._compiled.clear()
+    
+    # Loading
+    
+    def _find(self, name: str, after_layer: int, signature: List[List[Any]]) -> Tuple[int, Optional[Path]]:
+        """Find a template file, only looking in layers after `after_layer`.
+        
+        A template that extends its own name (a user videography_client
+        extending the bundled one) resolves to the next layer down. Every
+        path looked at goes into `signature`, missing ones too, so adding
+        a template that would shadow it is noticed.
+        """
+        for layer, directory in enumerate(self.search_dirs):
+            if layer <= after_layer:
+                continue
+            template_file = directory / f"{name}.json"
+            stat_key = _stat_key(template_file)
+            signature.append(["file", str(template_file), *stat_key])
+            if stat_key != MISSING:
+                return layer, template_file
+        return len(self.search_dirs), None
+    
+    def _load_raw(self, name: str, after_layer: int, signature: List[List[Any]],
+                  required: bool = True) -> Tuple[int, Dict[str, Any]]:
+        layer, template_file = self._find(name, after_layer, signature)
+        if template_file is not None:
+            try:
+                return layer, json.loads(template_file.read_bytes())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Template '{name}' is not valid JSON: {e}")
+        
+        # Built-in default structures act as the lowest layer
+        if after_layer < len(self.search_dirs) and self.fallback is not None:
+            data = self.fallback(name)
+            # Unknown names resolve to an empty structure, but a parent or
+            # include that doesn't exist is almost certainly a typo
+            if data.get("folders") or data.get("subfolders") or not required:
+                signature.append(["fallback", name, _digest(data), 0])
+                return layer, data
+        
+        raise ValueError(f"Template not found: {name}")
+    
+    def _references(self, name: str, layer: int, data: Dict[str, Any]) -> List[Tuple[str, int]]:
+        references = []
+        if data.get("extends"):
+            parent = data["extends"]
+            references.append((parent, layer if parent == name else ANY_LAYER))
+        for include in data.get("include", []):
+            references.append((include, layer if include == name else ANY_LAYER))
+        return references
+    
+    def _is_current(self, signature: List[List[Any]]) -> bool:
+        """Check that every file a compiled template was built from is unchanged."""
+        for kind, source, *stamp in signature:
+            if kind == "file":
+                if list(_stat_key(Path(source))) != stamp:
+                    return False
+            elif self.fallback is None or [_digest(self.fallback(source)), 0] != stamp:
+                return False
+        return True
+    
+    # Resolution
+    
+    def _build(self, name: str, after_layer: int, signature: List[List[Any]],
+               stack: List[Tuple[str, int]], required: bool = True) -> Dict[str, Any]:
+        layer, data = self._load_raw(name, after_layer, signature, required)
+        if (name, layer) in stack:
+            cycle = " -> ".join(n for n, _ in stack + [(name, layer)])
+            raise ValueError(f"Template inheritance cycle: {cycle}")
+        _validate(name, data)
+        
+        resolved: Dict[str, Any] = {}
+        for reference, reference_after in self._references(name, layer, data):
+            _merge(resolved, self._build(reference, reference_after, signature, stack + [(name, layer)]))
+        
+        own = {key: value for key, value in data.items() if key not in COMPOSITION_KEYS}
+        _merge(resolved, own)
+        
+        for removed in data.get("remove", []):
+            _remove(resolved, removed)
+        
+        resolved.setdefault("folders", [])
+        return resolved
+    
+    # Cache
+    
+    def _read_cache(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def _write_cache(self, cache_file: Path, entry: Dict[str, Any]) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(cache_file) as f:
+                json.dump(entry, f)
+        except OSError:
+            pass  # The cache is an optimisation only
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return MISSING
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _digest(data: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _merge(resolved: Dict[str, Any], data: Dict[str, Any]) -> None:
+    """Merge a template's entries into an accumulated template."""
+    for key, value in data.items():
+        current = resolved.get(key)
+        if isinstance(value, list) and (current is None or isinstance(current, list)):
+            resolved[key] = _merge_list(current or [], value)
+        elif isinstance(current, dict) and isinstance(value, dict):
+            resolved[key] = {**current, **value}
+        else:
+            resolved[key] = json.loads(json.dumps(value))
+
+
+def _merge_list(current: List[Any], value: List[Any]) -> List[Any]:
+    """Append a template's list to an inherited one, placing entries that name an anchor next to it.
+    
+    An entry whose anchor isn't there yet (a partial template resolved on
+    its own) keeps its placement, so it lands in the right spot once the
+    partial is merged into a template that has the anchor.
+    """
+    merged = list(current)
+    for item in value:
+        name = _entry_name(item)
+        names = [_entry_name(entry) for entry in merged]
+        if isinstance(item, str):
+            if name not in names:
+                merged.append(item)
+            continue
+        
+        if name in names:
+            del merged[names.index(name)]
+            names.remove(name)
+        anchor = item.get("after", item.get("before"))
+        if anchor in names:
+            anchor_index = names.index(anchor)
+            # Placed next to a pending placement, it stays pending alongside it
+            placed = name if isinstance(merged[anchor_index], str) else dict(item)
+            merged.insert(anchor_index + (1 if "after" in item else 0), placed)
+        else:
+            merged.append(dict(item))
+    return merged
+
+
+def _flatten(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn placements that never found their anchor into plain folders."""
+    for key in LIST_KEYS:
+        if key in template:
+            template[key] = list(dict.fromkeys(_entry_name(item) for item in template[key]))
+    return template
+
+
+def _entry_name(item: Any) -> str:
+    return item if isinstance(item, str) else item["name"]
+
+
+def _entry_paths(item: Any) -> List[str]:
+    """Get the folder and any anchor a list entry names."""
+    if isinstance(item, str):
+        return [item]
+    return [item["name"], item.get("after", item.get("before"))]
+
+
+def _valid_file(entry: Any) -> bool:
+    """Check a files entry: an asset path, or an asset path with an immutable flag."""
+    if isinstance(entry, str):
+        return True
+    return (isinstance(entry, dict) and isinstance(entry.get("source"), str)
+            and isinstance(entry.get("immutable", False), bool) and set(entry) <= {"source", "immutable"})
+
+
+def _valid_entry(item: Any) -> bool:
+    """Check a list entry: a folder, or a folder with exactly one of after/before."""
+    if isinstance(item, str):
+        return True
+    return (isinstance(item, dict) and isinstance(item.get("name"), str)
+            and len(set(item) & {"after", "before"}) == 1 and set(item) <= {"name", "after", "before"}
+            and all(isinstance(value, str) for value in item.values()))
+
+
+def _remove(resolved: Dict[str, Any], removed: str) -> None:
+    """Remove a folder, and everything below it, from a template."""
+    prefix = removed + "/"
+    
+    def keep(path: str) -> bool:
+        return path != removed and not path.startswith(prefix)
+    
+    for key in LIST_KEYS:
+        if key in resolved:
+            resolved[key] = [item for item in resolved[key] if keep(_entry_name(item))]
+    
+    if "files" in resolved:
+        resolved["files"] = {path: source for path, source in resolved["files"].items() if keep(path)}
+    
+    subfolders = {}
+    for parent, children in resolved.get("subfolders", {}).items():
+        if keep(parent):
+            subfolders[parent] = [child for child in children if keep(f"{parent}/{child}")]
+    if "subfolders" in resolved:
+        resolved["subfolders"] = subfolders
+
+
+def _validate(name: str, data: Any) -> None:
+    """Check a template's shape before it is merged."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Template '{name}' must be a JSON object")
+    
+    if "extends" in data and not isinstance(data["extends"], str):
+        raise ValueError(f"Template '{name}': 'extends' must be a template name")
+    
+    for key in LIST_KEYS:
+        value = data.get(key, [])
+        if not isinstance(value, list) or not all(_valid_entry(item) for item in value):
+            raise ValueError(f"Template '{name}': '{key}' must list folders, or "
+                             f"{{\"name\", \"after\"/\"before\"}} placements")
+    
+    for key in ("include", "remove"):
+        value = data.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"Template '{name}': '{key}' must be a list of strings")
+    
+    subfolders = data.get("subfolders", {})
+    if not isinstance(subfolders, dict) or not all(
+            isinstance(children, list) and all(isinstance(child, str) for child in children)
+            for children in subfolders.values()):
+        raise ValueError(f"Template '{name}': 'subfolders' must map folders to lists of names")
+    
+    files = data.get("files", {})
+    if not isinstance(files, dict) or not all(_valid_file(entry) for entry in files.values()):
+        raise ValueError(f"Template '{name}': 'files' must map project paths to paths in the assets folder, "
+                         f"or to {{\"source\", \"immutable\"}}")
+    
+    paths = [p for key in LIST_KEYS for item in data.get(key, []) for p in _entry_paths(item)]
+    paths += data.get("remove", [])
+    paths += list(subfolders) + [child for children in subfolders.values() for child in children]
+    paths += list(files) + [starter_file(entry)[0] for entry in files.values()]
+    for path in paths:
+        parts = PurePosixPath(path).parts
+        if not path.strip() or path.startswith(("/", "\\")) or ".." in parts or "\\" in path:
+            raise ValueError(f"Template '{name}': invalid folder path '{path}'")
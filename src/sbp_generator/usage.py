@@ -0,0 +1,247 @@
+"""
+Disk usage accounting for the SBP Folder Generator CLI.
+
+Walks the PHOTO and VIDEO trees with parallel os.scandir workers and keeps
+per-directory subtotals in a SQLite cache. On later runs a directory whose
+mtime hasn't changed is not listed again, so a refresh only pays for a stat
+per directory plus the directories that actually changed.
+
+Directory mtimes change when entries are added, removed or renamed, not
+when an existing file is rewritten in place; use a full walk to pick those
+up.
+"""
+
+import json
+import os
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS, raise_errors, walk_tree
+from .generators import project_generator
+from .path_matcher import CLIENT, LayoutMatcher
+from .scanner import PROJECT_TYPES, type_roots
+
+
+class UsageIndex:
+    """Per-directory byte counts for an archive, refreshed incrementally."""
+    
+    def __init__(self, base_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS,
+                 db_file: Optional[Path] = None):
+        self.config = config_manager.config
+        self.base_path = base_path
+        self.workers = workers
+        self.db_file = db_file or config_manager.cache_dir / "usage.db"
+        self._dirs: Dict[str, Tuple[int, int, List[str]]] = {}
+        self._totals: Dict[str, int] = {}
+        self.stats = {"directories": 0, "listed": 0}
+    
+    def type_roots(self) -> List[Tuple[str, Path]]:
+        """Get the PHOTO and VIDEO folders of the archive, each on its own volume unless a base path is given."""
+        return type_roots(self.base_path)
+    
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """Walk the archive, re-listing only directories whose mtime changed."""
+        db = self._connect()
+        try:
+            cached = {} if full else self._load_cached(db)
+            self._dirs = {}
+            self._totals = {}
+            self.stats = {"directories": 0, "listed": 0}
+            
+            roots = [str(root) for _, root in self.type_roots() if root.is_dir()]
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = {pool.submit(_measure, root, cached.get(root)) for root in roots}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path, record, listed = future.result()
+                        if record is None:
+                            continue
+                        self._dirs[path] = record
+                        self.stats["directories"] += 1
+                        self.stats["listed"] += listed
+                        for child in record[2]:
+                            child_path = os.path.join(path, child)
+                            pending.add(pool.submit(_measure, child_path, cached.get(child_path)))
+            
+            self._save(db)
+        finally:
+            db.close()
+        
+        return self.stats
+    
+    def load(self) -> None:
+        """Load the last refresh without touching the archive."""
+        db = self._connect()
+        try:
+            roots = [str(root) for _, root in self.type_roots()]
+            prefixes = tuple(os.path.join(root, '') for root in roots)
+            self._dirs = {path: record for path, record in self._load_cached(db).items()
+                          if path in roots or path.startswith(prefixes)}
+            self._totals = {}
+        finally:
+            db.close()
+    
+    def total(self, path: Path) -> int:
+        """Get the total bytes below a directory."""
+        key = os.path.abspath(str(path))
+        if key in self._totals:
+            return self._totals[key]
+        
+        # Iterative post-order walk so deep trees don't hit the recursion limit
+        stack = [(key, False)]
+        while stack:
+            current, expanded = stack.pop()
+            record = self._dirs.get(current)
+            if record is None:
+                self._totals[current] = 0
+                continue
+            children = [os.path.join(current, child) for child in record[2]]
+            if expanded:
+                self._totals[current] = record[0] + sum(self._totals[c] for c in children)
+            elif current not in self._totals:
+                stack.append((current, True))
+                stack.extend((c, False) for c in children if c not in self._totals)
+        
+        return self._totals[key]
+    
+    def children(self, path: Path) -> List[str]:
+        """Get the subdirectory names recorded for a directory."""
+        record = self._dirs.get(os.path.abspath(str(path)))
+        return list(record[2]) if record else []
+    
+    def report(self, by: str = "client", client: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Summarise usage by client, project or project folder category."""
+        rows: Dict[Tuple, Dict[str, Any]] = {}
+        split_folders = self._split_folders()
+        
+        for project in self._iter_projects():
+            if client and project["client"] != client:
+                continue
+            
+            if by == "client":
+                key = (project["client"] or "(personal)",)
+                row = rows.setdefault(key, {"name": key[0], "bytes": 0, "projects": 0})
+                row["bytes"] += self.total(project["path"])
+                row["projects"] += 1
+            elif by == "project":
+                key = (project["client"] or "(personal)", project["type"], project["name"])
+                rows[key] = {"name": project["name"], "client": key[0], "type": project["type"],
+                             "bytes": self.total(project["path"]), "projects": 1}
+            else:
+                for category, size in self._categories(project["path"], split_folders):
+                    row = rows.setdefault((category,), {"name": category, "bytes": 0, "projects": 0})
+                    row["bytes"] += size
+                    row["projects"] += 1
+        
+        return sorted(rows.values(), key=lambda r: r["bytes"], reverse=True)
+    
+    def _iter_projects(self) -> Iterable[Dict[str, Any]]:
+        """Yield projects following the layout get_project_base_path produces."""
+        matcher = LayoutMatcher(self.config)
+        for project_type, type_root in self.type_roots():
+            client_work = type_root / self.config.client_work_subfolder
+            for captured, projects_path in matcher.walk_layout(client_work, self.config.client_layout, self.children):
+                for project_name in self.children(projects_path):
+                    yield {"type": project_type, "client": captured[CLIENT], "name": project_name,
+                           "path": projects_path / project_name}
+            
+            personal_work = type_root / self.config.personal_work_subfolder
+            for _, projects_path in matcher.walk_layout(personal_work, self.config.personal_layout, self.children):
+                for project_name in self.children(projects_path):
+                    yield {"type": project_type, "client": None, "name": project_name,
+                           "path": projects_path / project_name}
+    
+    def _split_folders(self) -> set:
+        """Top-level folders reported by their subfolders (Footage -> Footage/RAW, Footage/Proxies)."""
+        split = set()
+        for template_name in ("photography_client", "photography_personal",
+                              "videography_client", "videography_personal"):
+            template = project_generator.load_template(template_name)
+            split.update(parent.split('/')[0] for parent in template.get("subfolders", {}))
+            split.update(f.split('/')[0] for f in template.get("optional_folders", []) if '/' in f)
+        return split
+    
+    def _categories(self, project_path: Path, split_folders: set) -> Iterable[Tuple[str, int]]:
+        """Yield (folder category, bytes) pairs for one project."""
+        record = self._dirs.get(os.path.abspath(str(project_path)))
+        if record is None:
+            return
+        if record[0]:
+            yield "(project files)", record[0]
+        for folder in record[2]:
+            if folder not in split_folders:
+                yield folder, self.total(project_path / folder)
+                continue
+            folder_record = self._dirs.get(os.path.abspath(str(project_path / folder)))
+            if folder_record is None:
+                continue
+            if folder_record[0]:
+                yield folder, folder_record[0]
+            for child in folder_record[2]:
+                yield f"{folder}/{child}", self.total(project_path / folder / child)
+    
+    # Storage
+    
+    def _connect(self) -> sqlite3.Connection:
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.db_file))
+        db.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER, "
+                   "own_bytes INTEGER, children TEXT)")
+        return db
+    
+    def _load_cached(self, db: sqlite3.Connection) -> Dict[str, Tuple[int, int, List[str]]]:
+        return {path: (own_bytes, mtime_ns, json.loads(children))
+                for path, mtime_ns, own_bytes, children in db.execute("SELECT * FROM dirs")}
+    
+    def _save(self, db: sqlite3.Connection) -> None:
+        """Replace the stored rows below the type folders with this walk's results."""
+        with db:
+            for root in [str(r) for _, r in self.type_roots()]:
+                db.execute("DELETE FROM dirs WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                           (root, _like_prefix(root)))
+            db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                           ((path, mtime_ns, own_bytes, json.dumps(children))
+                            for path, (own_bytes, mtime_ns, children) in self._dirs.items()))
+
+
+def _like_prefix(path: str) -> str:
+    escaped = path.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + os.sep + '%'
+
+
+def _measure(path: str, cached: Optional[Tuple[int, int, List[str]]]) -> Tuple[str, Optional[Tuple[int, int, List[str]]], int]:
+    """Get (own bytes, mtime, subdirectories) for one directory, reusing the cache if unchanged."""
+    try:
+        mtime_ns = os.stat(path, follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return path, None, 0
+    
+    if cached is not None and cached[1] == mtime_ns:
+        return path, cached, 0
+    
+    own_bytes = 0
+    children = []
+    try:
+        for entry, _ in walk_tree(path, max_depth=1, on_error=raise_errors):
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    children.append(entry.name)
+                else:
+                    own_bytes += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    except OSError:
+        return path, None, 0
+    
+    return path, (own_bytes, mtime_ns, sorted(children)), 1
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Symlink views for the SBP Folder Generator CLI.
+
+Keeps a ``_views`` folder next to PHOTO and VIDEO with other ways into the
+archive: ``by-date/2024-03`` for everything from a month, ``by-client`` for
+a client's photo and video projects together and ``by-camera/drone-Drone``
+for every camera folder of one camera. Each entry is a relative symlink, so
+the views work wherever the share is mounted.
+
+Syncing is incremental. The links made for each project are remembered
+with the project folder's mtime, only projects whose mtime changed are
+re-examined, and the difference is applied one view folder at a time
+through an open directory handle.
+"""
+
+import json
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .config import config_manager
+from .fsutil import DEFAULT_WORKERS, atomic_write, walk_tree
+from .models import is_camera_folder
+from .sidecar import read_sidecar
+
+
+VIEWS_FOLDER = "_views"
+STATE_FILE = ".sync.json"
+STATE_VERSION = 1
+
+# Camera folders sit a few levels into a project, e.g. Footage/RAW/main-Lumix
+CAMERA_SEARCH_DEPTH = 3
+
+# Folders holding copies of camera folders rather than the originals
+SKIP_FOLDERS = {"Proxies"}
+
+
+def find_camera_folders(project_path: Path, max_depth: int = CAMERA_SEARCH_DEPTH) -> Dict[str, str]:
+    """Find a project's camera folders, keeping the shallowest folder for each camera."""
+    found: Dict[str, Tuple[Tuple[int, Tuple[str, ...]], str]] = {}
+    
+    def descend(entry: os.DirEntry, relative: str) -> bool:
+        return not is_camera_folder(entry.name) and entry.name not in SKIP_FOLDERS
+    
+    for entry, relative in walk_tree(project_path, max_depth, include_hidden=False, descend=descend):
+        if is_camera_folder(entry.name) and entry.is_dir(follow_symlinks=False):
+            # Shallowest first, then in name order level by level
+            parts = tuple(relative.split("/"))
+            rank = (len(parts), parts)
+            if entry.name not in found or rank < found[entry.name][0]:
+                found[entry.name] = (rank, entry.path)
+    return {name: path for name, (_, path) in found.items()}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ViewSync:
+    """Keeps the symlink views of an archive in step with its projects."""
+    
+    def __init__(self, base_path: Optional[Path] = None, workers: int = DEFAULT_WORKERS):
+        self.base_path = base_path
+        self.root = Path(os.path.abspath(str(base_path or Path.cwd()))) / VIEWS_FOLDER
+        self.state_file = self.root / STATE_FILE
+        self.workers = workers
+    
+    def sync(self, full: bool = False) -> Dict[str, int]:
+        """Bring the views up to date; with full, re-examine every project."""
+        from .scanner import iter_project_folders
+        
+        state = self._load_state()
+        projects = list(iter_project_folders(self.base_path))
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            mtimes = list(pool.map(_mtime_ns, [project[3] for project in projects]))
+            changed = [(project, mtime) for project, mtime in zip(projects, mtimes)
+                       if mtime is not None and (full or state.get(str(project[3]), {}).get("mtime") != mtime)]
+            link_lists = list(pool.map(lambda item: self.project_links(*item[0]), changed))
+        
+        current = {str(project[3]) for project, mtime in zip(projects, mtimes) if mtime is not None}
+        stale: Dict[str, str] = {}
+        wanted: Dict[str, str] = {}
+        for path in [path for path in state if path not in current]:
+            stale.update(state.pop(path)["links"])
+        for ((_, _, _, project_path), mtime), links in zip(changed, link_lists):
+            old = state.get(str(project_path), {}).get("links", {})
+            stale.update((link, target) for link, target in old.items() if links.get(link) != target)
+            wanted.update((link, target) for link, target in links.items() if old.get(link) != target)
+            state[str(project_path)] = {"mtime": mtime, "links": links}
+        
+        # A link dropped by one project may have been taken over by another
+        removed = self._remove_links(link for link in stale if link not in wanted)
+        added = self._add_links(wanted)
+        self._save_state(state)
+        return {"projects": len(current), "changed": len(changed), "added": added, "removed": removed}
+    
+    def project_links(self, project_type: str, client_name: Optional[str], year: Optional[str],
+                      project_path: Path) -> Dict[str, str]:
+        """Get the view links of one project, as {link path inside the views: target}."""
+        from .generators import project_generator
+        
+        label = f"{client_name} - {project_path.name}" if client_name else project_path.name
+        label = f"{label} ({config_manager.config.base_directories[project_type]})"
+        
+        # Personal folder names don't hold a date, but a sidecar does
+        sidecar = read_sidecar(project_path)
+        if sidecar is not None:
+            period = sidecar.project_date.strftime("%Y-%m")
+        elif client_name is not None:
+            date = project_generator.parse_project_folder_name(project_path.name)[0]
+            period = date.strftime("%Y-%m") if date else None
+        else:
+            period = year if year and year.isdigit() else None
+        
+        target = str(project_path)
+        links = {}
+        if period:
+            links[f"by-date/{period}/{label}"] = target
+        if client_name:
+            links[f"by-client/{client_name}/{label}"] = target
+        for camera, folder in find_camera_folders(project_path).items():
+            links[f"by-camera/{camera}/{label}"] = folder
+        return links
+    
+    def _add_links(self, links: Dict[str, str]) -> int:
+        """Make links, opening each view folder once for all of its entries."""
+        added = 0
+        for folder, entries in self._by_folder(links.items()).items():
+            folder_path = self.root / folder
+            folder_path.mkdir(parents=True, exist_ok=True)
+            with _DirectoryHandle(folder_path) as directory:
+                added += sum(directory.symlink(os.path.relpath(target, folder_path), name)
+                             for name, target in entries)
+        return added
+    
+    def _remove_links(self, links: Iterable[str]) -> int:
+        """Remove links, then any view folders left empty."""
+        removed = 0
+        by_folder = self._by_folder((link, None) for link in links)
+        for folder, entries in by_folder.items():
+            try:
+                with _DirectoryHandle(self.root / folder) as directory:
+                    removed += sum(directory.unlink(name) for name, _ in entries)
+            except FileNotFoundError:
+                continue
+        
+        for folder in sorted(by_folder, key=lambda f: f.count("/"), reverse=True):
+            while folder:
+                try:
+                    os.rmdir(self.root / folder)
+                except OSError:
+                    break
+                folder = folder.rpartition("/")[0]
+        return removed
+    
+    @staticmethod
+    def _by_folder(links: Iterable[Tuple[str, Any]]) -> Dict[str, List[Tuple[str, Any]]]:
+        folders = defaultdict(list)
+        for link, target in links:
+            folder, _, name = link.rpartition("/")
+            folders[folder].append((name, target))
+        return folders
+    
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return state.get("projects", {}) if state.get("version") == STATE_VERSION else {}
+    
+    def _save_state(self, projects: Dict[str, Dict[str, Any]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.state_file) as f:
+            json.dump({"version": STATE_VERSION, "projects": projects}, f)
+
+
+class _DirectoryHandle:
+    """An open view folder, so its links are made and removed without resolving its path each time."""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd = None
+    
+    def __enter__(self) -> "_DirectoryHandle":
+        if os.symlink in os.supports_dir_fd and os.unlink in os.supports_dir_fd:
+            self.fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        elif not self.path.is_dir():
+            raise FileNotFoundError(self.path)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+    
+    def _name(self, name: str) -> str:
+        return name if self.fd is not None else str(self.path / name)
+    
+    def symlink(self, target: str, name: str) -> bool:
+        try:
+            os.symlink(target, self._name(name), dir_fd=self.fd)
+        except FileExistsError:
+            # Left from a lost sync state; replace it only if it is a link
+            try:
+                existing = os.stat(self._name(name), dir_fd=self.fd, follow_symlinks=False)
+            except FileNotFoundError:
+                existing = None
+            if existing is not None and (not stat.S_ISLNK(existing.st_mode) or not self.unlink(name)):
+                return False
+            os.symlink(target, self._name(name), dir_fd=self.fd)
+        return True
+    
+    def unlink(self, name: str) -> bool:
+        try:
+            os.unlink(self._name(name), dir_fd=self.fd)
+            return True
+        except (FileNotFoundError, IsADirectoryError, PermissionError):
+            return False
\ No newline at end of file
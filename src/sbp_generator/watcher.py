@@ -0,0 +1,435 @@
+"""
+Client folder watcher for the SBP Folder Generator CLI.
+
+Uses Linux inotify (through ctypes, no extra dependencies) to follow client
+and project folders being created, renamed and deleted under the PHOTO and
+VIDEO "Client Work" folders, keeping the directory index and the client
+database current without rescanning the share.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import config_manager
+from .client_manager import client_manager, ClientManager
+from .directory_index import directory_index, DirectoryIndex
+from .fsutil import list_subdirectories
+from .path_matcher import CLIENT, LayoutMatcher, segment_matches
+from .scanner import type_roots
+
+
+# inotify event masks (see inotify(7))
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Folder roles
+ROLE_BASE = "base"
+ROLE_TYPE = "type"
+ROLE_CLIENT_WORK = "client_work"
+ROLE_CLIENT = "client"
+# A layout level between Client Work and the projects other than the client folder
+ROLE_LEVEL = "level"
+
+
+class Inotify:
+    """Thin ctypes wrapper around the inotify system calls."""
+    
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("Watching requires Linux inotify support")
+        
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+    
+    def add_watch(self, path: Path, mask: int = WATCH_MASK) -> int:
+        """Add (or update) a watch and return its descriptor."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+    
+    def rm_watch(self, wd: int) -> None:
+        """Remove a watch, ignoring watches the kernel already dropped."""
+        self._libc.inotify_rm_watch(self.fd, wd)
+    
+    def read_events(self) -> List[Tuple[int, int, int, str]]:
+        """Read all pending events as (wd, mask, cookie, name) tuples."""
+        events = []
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+            
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, cookie, name))
+        return events
+    
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class ClientFolderWatcher:
+    """Keeps the directory index and client database in sync with Client Work folders."""
+    
+    def __init__(self, base_path: Optional[Path] = None, debounce: float = 0.5, max_delay: float = 5.0,
+                 index: DirectoryIndex = None, clients: ClientManager = None):
+        self.config = config_manager.config
+        self.base_path = Path(os.path.abspath(str(base_path))) if base_path else None
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.index = index or directory_index
+        self.clients = clients or client_manager
+        self._inotify: Optional[Inotify] = None
+        self._watches: Dict[int, Tuple[Path, str]] = {}
+        self._wds: Dict[Path, int] = {}
+        self._matcher = LayoutMatcher(self.config)
+        # Levels from Client Work down to the client folder
+        self._client_depth = self.config.client_layout.index(CLIENT) + 1
+    
+    def type_folders(self) -> List[Path]:
+        """Get the PHOTO/VIDEO folders to watch, each on its own volume unless a base path is given."""
+        return [root for _, root in type_roots(self.base_path)]
+    
+    def start(self) -> None:
+        """Create the inotify instance and index every root."""
+        self._inotify = Inotify()
+        self.rescan()
+        self._sync_clients_database()
+        self.index.set_watcher(os.getpid())
+        self.index.save()
+    
+    def stop(self) -> None:
+        """Release all watches and mark the index as no longer live."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._watches.clear()
+        self._wds.clear()
+        self.index.set_watcher(None)
+        self.index.save()
+    
+    def run(self, on_batch: Optional[Callable[[Dict[str, int]], None]] = None) -> None:
+        """Watch until interrupted, applying events in debounced batches."""
+        self.start()
+        pending = []
+        first_event = last_event = 0.0
+        
+        try:
+            while True:
+                if pending:
+                    now = time.monotonic()
+                    timeout = max(0.0, min(last_event + self.debounce, first_event + self.max_delay) - now)
+                else:
+                    timeout = None
+                
+                readable, _, _ = select.select([self._inotify.fd], [], [], timeout)
+                if readable:
+                    events = self._inotify.read_events()
+                    now = time.monotonic()
+                    if not pending:
+                        first_event = now
+                    last_event = now
+                    pending.extend(events)
+                    if now - first_event < self.max_delay:
+                        continue
+                
+                if pending:
+                    summary = self.apply_events(pending)
+                    pending = []
+                    if on_batch:
+                        on_batch(summary)
+        finally:
+            self.stop()
+    
+    def rescan(self) -> None:
+        """Drop every watch and rebuild the index from a full scan."""
+        for wd in list(self._watches):
+            self._inotify.rm_watch(wd)
+        self._watches.clear()
+        self._wds.clear()
+        
+        # The folders holding PHOTO and VIDEO are watched too, so one created later is picked up
+        for base in dict.fromkeys(type_path.parent for type_path in self.type_folders()):
+            if base.is_dir():
+                self._watch(base, ROLE_BASE)
+        for type_path in self.type_folders():
+            self.index.drop_client_work(type_path / self.config.client_work_subfolder)
+            if type_path.is_dir():
+                self._add_type_folder(type_path)
+    
+    def apply_events(self, events: List[Tuple[int, int, int, str]]) -> Dict[str, int]:
+        """Apply a batch of raw inotify events and persist the result once."""
+        summary = {"events": len(events), "clients_added": 0, "clients_renamed": 0,
+                   "clients_removed": 0, "projects_added": 0, "projects_removed": 0, "rescans": 0}
+        
+        with self.clients.batch():
+            if any(mask & IN_Q_OVERFLOW for _, mask, _, _ in events):
+                # The kernel dropped events, so nothing short of a rescan is reliable
+                self.rescan()
+                self._sync_clients_database()
+                summary["rescans"] = 1
+            else:
+                self.clients.load_clients()
+                # A rename inside one Client Work folder is applied at its IN_MOVED_TO; every other
+                # event, including a move out of the tree that never gets one, applies where it arrives
+                moved_to = {cookie: wd for wd, mask, cookie, name in events
+                            if mask & IN_MOVED_TO and mask & IN_ISDIR and not name.startswith('.')}
+                moved_from = {}
+            
+                for wd, mask, cookie, name in events:
+                    if mask & IN_IGNORED:
+                        self._forget(wd)
+                        continue
+                    if not mask & IN_ISDIR or wd not in self._watches or name.startswith('.'):
+                        continue
+                
+                    path, role = self._watches[wd]
+                    if mask & IN_MOVED_FROM:
+                        moved_from[cookie] = (wd, name)
+                        if moved_to.get(cookie) != wd or not self._holds_clients(path, role):
+                            self._removed((path, role), name, summary)
+                    elif mask & IN_MOVED_TO and cookie in moved_from and moved_from[cookie][0] == wd \
+                            and self._holds_clients(path, role):
+                        self._rename_client(path, moved_from[cookie][1], name)
+                        summary["clients_renamed"] += 1
+                    elif mask & (IN_CREATE | IN_MOVED_TO):
+                        self._added((path, role), name, summary)
+                    elif mask & IN_DELETE:
+                        self._removed((path, role), name, summary)
+        
+        self.index.save()
+        return summary
+    
+    def _watch(self, path: Path, role: str) -> None:
+        try:
+            wd = self._inotify.add_watch(path)
+        except OSError:
+            return  # Folder vanished or is unreadable
+        self._watches[wd] = (path, role)
+        self._wds[path] = wd
+    
+    def _unwatch(self, path: Path) -> None:
+        wd = self._wds.pop(path, None)
+        if wd is not None:
+            self._watches.pop(wd, None)
+            self._inotify.rm_watch(wd)
+        # Watches below a removed folder go with it
+        for child in [p for p in self._wds if path in p.parents]:
+            self._unwatch(child)
+    
+    def _forget(self, wd: int) -> None:
+        entry = self._watches.pop(wd, None)
+        if entry and self._wds.get(entry[0]) == wd:
+            del self._wds[entry[0]]
+    
+    def _add_type_folder(self, type_path: Path) -> Dict[str, List[str]]:
+        self._watch(type_path, ROLE_TYPE)
+        client_work_path = type_path / self.config.client_work_subfolder
+        if client_work_path.is_dir():
+            return self._add_client_work(client_work_path)
+        return {}
+    
+    def _add_client_work(self, client_work_path: Path) -> Dict[str, List[str]]:
+        clients = self._add_below(client_work_path, client_work_path)
+        self.index.set_client_work(client_work_path, clients)
+        return clients
+    
+    def _add_below(self, client_work_path: Path, folder: Path) -> Dict[str, List[str]]:
+        """Watch a folder in a Client Work tree and the layout levels below it.
+        
+        Returns the clients found, each with its projects.
+        """
+        layout = self.config.client_layout
+        clients: Dict[str, List[str]] = {}
+        stack = [folder]
+        while stack:
+            path = stack.pop()
+            depth = _depth(client_work_path, path)
+            role = ROLE_CLIENT_WORK if depth == 0 else ROLE_CLIENT if depth == self._client_depth else ROLE_LEVEL
+            self._watch(path, role)
+            names = [entry.name for entry in list_subdirectories(path)]
+            if depth >= self._client_depth:
+                projects = clients.setdefault(self._client_of(client_work_path, path), [])
+                if depth == len(layout):
+                    projects.extend(names)
+                    continue
+            stack.extend(path / name for name in names if segment_matches(layout[depth], name))
+        
+        for projects in clients.values():
+            projects.sort()
+        return clients
+    
+    def _added(self, watched: Tuple[Path, str], name: str, summary: Dict[str, int]) -> None:
+        path, role = watched
+        if role == ROLE_BASE and path / name in self.type_folders():
+            for client_name in self._add_type_folder(path / name):
+                if self._ensure_client(client_name):
+                    summary["clients_added"] += 1
+        elif role == ROLE_TYPE and name == self.config.client_work_subfolder:
+            for client_name in self._add_client_work(path / name):
+                if self._ensure_client(client_name):
+                    summary["clients_added"] += 1
+        elif role in (ROLE_CLIENT_WORK, ROLE_LEVEL, ROLE_CLIENT) and self._client_work_of(path) is not None:
+            client_work_path = self._client_work_of(path)
+            depth = _depth(client_work_path, path / name)
+            layout = self.config.client_layout
+            if depth > len(layout):
+                client_name = self._client_of(client_work_path, path)
+                self.index.add_project(client_work_path, client_name, name)
+                self.clients.add_project_to_client(client_name, name)
+                summary["projects_added"] += 1
+                return
+            if not segment_matches(layout[depth - 1], name):
+                return
+            
+            found = self._add_below(client_work_path, path / name)
+            for client_name, projects in found.items():
+                if depth > self._client_depth:
+                    # A new level inside a client folder brings only projects
+                    for project_name in projects:
+                        self.index.add_project(client_work_path, client_name, project_name)
+                        self.clients.add_project_to_client(client_name, project_name)
+                    summary["projects_added"] += len(projects)
+                    continue
+                self.index.add_client(client_work_path, client_name, projects)
+                if self._ensure_client(client_name):
+                    summary["clients_added"] += 1
+                for project_name in projects:
+                    self.clients.add_project_to_client(client_name, project_name)
+    
+    def _removed(self, watched: Tuple[Path, str], name: str, summary: Dict[str, int]) -> None:
+        path, role = watched
+        if role == ROLE_BASE and path / name in self.type_folders():
+            self.index.drop_client_work(path / name / self.config.client_work_subfolder)
+            self._unwatch(path / name)
+        elif role == ROLE_TYPE and name == self.config.client_work_subfolder:
+            self.index.drop_client_work(path / name)
+            self._unwatch(path / name)
+        elif role in (ROLE_CLIENT_WORK, ROLE_LEVEL, ROLE_CLIENT) and self._client_work_of(path) is not None:
+            client_work_path = self._client_work_of(path)
+            depth = _depth(client_work_path, path / name)
+            if depth > len(self.config.client_layout):
+                self.index.remove_project(client_work_path, self._client_of(client_work_path, path), name)
+                summary["projects_removed"] += 1
+            elif depth <= self._client_depth:
+                # Client records are kept so project history survives a deleted folder
+                for client_name in self._clients_below(client_work_path, path / name):
+                    self.index.remove_client(client_work_path, client_name)
+                    summary["clients_removed"] += 1
+                self._unwatch(path / name)
+            else:
+                # A level inside a client folder: re-list what is left of the client
+                self._unwatch(path / name)
+                client_name = self._client_of(client_work_path, path)
+                client_path = client_work_path.joinpath(*(path / name).relative_to(client_work_path).parts[
+                    :self._client_depth])
+                self.index.add_client(client_work_path, client_name, self._list_projects(client_path))
+    
+    def _rename_client(self, folder: Path, old_name: str, new_name: str) -> None:
+        # Only called for folders _holds_clients accepted, so the Client Work folder is watched
+        self.index.rename_client(self._client_work_of(folder), old_name, new_name)
+        
+        # Watches on the client folder and any layout levels below it move with it
+        old_path, new_path = folder / old_name, folder / new_name
+        for path in [p for p in self._wds if p == old_path or old_path in p.parents]:
+            wd = self._wds.pop(path)
+            moved = new_path / path.relative_to(old_path)
+            self._wds[moved] = wd
+            self._watches[wd] = (moved, self._watches[wd][1])
+        
+        if not self.clients.rename_client(old_name, new_name):
+            self._ensure_client(new_name)
+    
+    def _client_work_of(self, path: Path) -> Optional[Path]:
+        """Find the watched Client Work folder a folder is in (None once it is gone)."""
+        for folder in [path, *path.parents]:
+            wd = self._wds.get(folder)
+            if wd is not None and self._watches[wd][1] == ROLE_CLIENT_WORK:
+                return folder
+        return None
+    
+    def _client_of(self, client_work_path: Path, path: Path) -> str:
+        """Get the client a folder at or below the client level belongs to."""
+        return path.relative_to(client_work_path).parts[self._client_depth - 1]
+    
+    def _holds_clients(self, path: Path, role: str) -> bool:
+        """Check whether a watched folder's subfolders are client folders."""
+        client_work_path = self._client_work_of(path) if role in (ROLE_CLIENT_WORK, ROLE_LEVEL) else None
+        return client_work_path is not None and _depth(client_work_path, path) == self._client_depth - 1
+    
+    def _clients_below(self, client_work_path: Path, folder: Path) -> List[str]:
+        """Get the indexed clients in a folder at or above the client level."""
+        if _depth(client_work_path, folder) == self._client_depth:
+            return [folder.name]
+        names = {self._client_of(client_work_path, path) for path, role in self._watches.values()
+                 if role == ROLE_CLIENT and folder in path.parents}
+        for client_name in self.index.get_clients(client_work_path) or []:
+            client_path = self._matcher.client_path(client_work_path, client_name)
+            if client_path is not None and folder in client_path.parents:
+                names.add(client_name)
+        return sorted(names)
+    
+    def _list_projects(self, client_path: Path) -> List[str]:
+        """List a client's projects through the layout levels below its folder."""
+        layout = self.config.client_layout
+        return sorted(entry.name for _, projects_path in self._matcher.walk_layout(
+            client_path, layout[self._client_depth:]) for entry in list_subdirectories(projects_path))
+    
+    def _ensure_client(self, client_name: str) -> bool:
+        """Add a client to the database if it isn't there yet."""
+        if self.clients.get_client(client_name) is not None:
+            return False
+        try:
+            self.clients.add_client(client_name)
+        except ValueError:
+            return False
+        return True
+    
+    def _sync_clients_database(self) -> None:
+        self.clients.load_clients()
+        with self.clients.batch():
+            for clients in self.index.data["client_work"].values():
+                for client_name, projects in clients.items():
+                    self._ensure_client(client_name)
+                    for project_name in projects:
+                        self.clients.add_project_to_client(client_name, project_name)
+
+
+def _depth(client_work_path: Path, path: Path) -> int:
+    """Count the levels a folder is below its Client Work folder."""
+    return len(path.relative_to(client_work_path).parts)
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+from sbp_generator import catalog, generators, ledger
+from sbp_generator.config import config_manager
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the catalog, ledger and other caches out of the real ~/.sbp-generator."""
+    cache_dir = tmp_path / "cache"
+    project_catalog = catalog.ProjectCatalog(cache_dir / "catalog.db")
+    generation_ledger = ledger.GenerationLedger(cache_dir / "ledger.db")
+    monkeypatch.setattr(config_manager, "cache_dir", cache_dir)
+    for module in (catalog, generators):
+        monkeypatch.setattr(module, "project_catalog", project_catalog)
+    for module in (ledger, generators):
+        monkeypatch.setattr(module, "generation_ledger", generation_ledger)
+    monkeypatch.setattr(generators.project_generator, "catalog", project_catalog)
+    monkeypatch.setattr(generators.project_generator, "ledger", generation_ledger)
+    yield cache_dir
+    project_catalog.close()
+    generation_ledger.close()
@@ -0,0 +1,87 @@
+"""
+Tests for moving old projects to an archive volume.
+"""
+
+import json
+import os
+from datetime import datetime
+
+from sbp_generator.archiver import ArchiveMover, JOURNAL_NAME, parse_age, select_projects
+from sbp_generator.config import config_manager
+
+
+def test_archive_moves_old_projects_and_resumes(tmp_path):
+    archive = tmp_path / "archive"
+    old = archive / "VIDEO/Client Work/ABC/2024-01-01-Launch"
+    new = archive / "VIDEO/Client Work/ABC/2026-10-01-Teaser"
+    (old / "Footage/RAW").mkdir(parents=True)
+    (old / "Exports").mkdir()
+    (old / "Footage/RAW/a.mov").write_bytes(b"a" * 10000)
+    (old / "Footage/RAW/b.mov").write_bytes(b"b" * 20)
+    new.mkdir(parents=True)
+    (archive / "PHOTO/Personal Work/2023/Walk").mkdir(parents=True)
+
+    projects = select_projects(archive, parse_age("180d"), now=datetime(2026, 10, 19))
+    assert [p["path"].name for p in projects] == ["Walk", "2024-01-01-Launch"]
+
+    destination = tmp_path / "cold"
+    # An earlier, interrupted run already verified one of the files
+    (destination / "VIDEO/Client Work/ABC/2024-01-01-Launch/Footage/RAW").mkdir(parents=True)
+    (destination / "VIDEO/Client Work/ABC/2024-01-01-Launch/Footage/RAW/b.mov").write_bytes(b"b" * 20)
+    stat = (old / "Footage/RAW/b.mov").stat()
+    (destination / JOURNAL_NAME).write_text(json.dumps({
+        "event": "file", "project": "VIDEO/Client Work/ABC/2024-01-01-Launch", "path": "Footage/RAW/b.mov",
+        "size": 20, "mtime_ns": stat.st_mtime_ns, "hash": "x"}) + "\n")
+
+    mover = ArchiveMover(destination, archive, workers=2)
+    results = list(mover.move_projects(projects))
+    assert all(r["success"] for r in results)
+    assert results[1]["copied_bytes"] == 10000
+
+    moved = destination / "VIDEO/Client Work/ABC/2024-01-01-Launch"
+    assert (moved / "Footage/RAW/a.mov").read_bytes() == b"a" * 10000
+    assert (moved / "Exports").is_dir()
+    assert (destination / "PHOTO/Personal Work/2023/Walk").is_dir()
+    assert not old.exists() and new.exists()
+
+
+def test_archive_recreates_symlinks_and_reports_errors(tmp_path):
+    archive = tmp_path / "archive"
+    old = archive / "VIDEO/Client Work/ABC/2024-01-01-Launch"
+    (old / "Exports").mkdir(parents=True)
+    (old / "Exports/final.mp4").write_bytes(b"f" * 10)
+    (old / "latest.mp4").symlink_to("Exports/final.mp4")
+    (old / "exports-link").symlink_to("Exports")
+    projects = select_projects(archive, parse_age("1y"), now=datetime(2026, 10, 19))
+
+    # A file where the destination folder should go fails that project instead of the run
+    blocked = tmp_path / "blocked"
+    (blocked / "VIDEO").mkdir(parents=True)
+    (blocked / "VIDEO/Client Work").write_text("not a folder")
+    [failed] = ArchiveMover(blocked, archive).move_projects(projects)
+    assert not failed["success"] and "Could not create" in failed["message"] and old.exists()
+
+    [result] = ArchiveMover(tmp_path / "cold", archive).move_projects(projects)
+    assert result["success"], result["message"]
+    moved = tmp_path / "cold/VIDEO/Client Work/ABC/2024-01-01-Launch"
+    assert (moved / "latest.mp4").is_symlink() and (moved / "latest.mp4").read_bytes() == b"f" * 10
+    assert os.readlink(moved / "exports-link") == "Exports"
+
+
+def test_archive_follows_per_type_volume_roots(tmp_path, monkeypatch):
+    roots = {"photography": str(tmp_path / "photo-volume"), "videography": str(tmp_path / "video-volume")}
+    monkeypatch.setattr(config_manager, "_config", config_manager.config.copy(update={"volume_roots": roots}))
+    photo = tmp_path / "photo-volume/PHOTO/Client Work/ABC/2024-01-01-Shoot"
+    video = tmp_path / "video-volume/VIDEO/Personal Work/2023/Walk"
+    (photo / "RAW").mkdir(parents=True)
+    (photo / "RAW/a.cr3").write_bytes(b"a" * 10)
+    video.mkdir(parents=True)
+
+    mover = ArchiveMover(tmp_path / "cold")
+    projects = select_projects(mover.base_path, parse_age("180d"), now=datetime(2026, 10, 19))
+    assert [p["path"] for p in projects] == [video, photo]
+
+    results = list(mover.move_projects(projects))
+    assert [r["project"] for r in results] == ["VIDEO/Personal Work/2023/Walk", "PHOTO/Client Work/ABC/2024-01-01-Shoot"]
+    assert all(r["success"] for r in results)
+    assert (tmp_path / "cold/PHOTO/Client Work/ABC/2024-01-01-Shoot/RAW/a.cr3").read_bytes() == b"a" * 10
@@ -0,0 +1,43 @@
+"""
+Tests for the asset library index.
+"""
+
+import shutil
+
+from sbp_generator.assets import AssetLibrary, name_tokens
+
+
+def test_name_tokens_split_words_case_and_digits():
+    assert name_tokens("TealOrange_v2.cube") == "tealorange teal orange v2 v 2 cube"
+    assert name_tokens("Whoosh-Impact 03.WAV") == "whoosh impact 03 wav"
+
+
+def test_index_and_search_are_incremental(tmp_path):
+    assets = tmp_path / "Assets & Resources"
+    files = {"Presets & Templates/LUTs for Video/TealOrange_v2.cube": 10,
+             "Presets & Templates/LUTs for Video/Film Emulation.CUBE": 20,
+             "Music & Sound Effects/Sound Effects/Whoosh Impact.wav": 30,
+             "Music & Sound Effects/Licensed Tracks/Summer Drive/summer_drive_full.wav": 40,
+             "Stock Footage & Images/.DS_Store": 1}
+    for name, size in files.items():
+        (assets / name).parent.mkdir(parents=True, exist_ok=True)
+        (assets / name).write_bytes(b"x" * size)
+
+    library = AssetLibrary(tmp_path, db_file=tmp_path / "assets.db")
+    result = library.refresh()
+    assert result["files"] == 4 and result["listed"] == result["directories"]
+
+    [lut] = library.search("teal")
+    assert lut["name"] == "TealOrange_v2.cube" and lut["size"] == 10
+    assert (lut["category"], lut["subcategory"]) == ("Presets & Templates", "LUTs for Video")
+    assert [a["name"] for a in library.search(extension=".cube")] == ["Film Emulation.CUBE", "TealOrange_v2.cube"]
+    assert [a["name"] for a in library.search("wav", category="licensed tracks")] == ["summer_drive_full.wav"]
+    assert library.search("orange teal v2")[0]["name"] == "TealOrange_v2.cube"
+    assert library.search("teal impact") == []
+
+    (assets / "Music & Sound Effects/Sound Effects/Riser.wav").write_bytes(b"x")
+    shutil.rmtree(assets / "Music & Sound Effects/Licensed Tracks/Summer Drive")
+    again = AssetLibrary(tmp_path, db_file=tmp_path / "assets.db")
+    result = again.refresh()
+    assert result["listed"] == 2 and result["removed"] == 1 and result["files"] == 4
+    assert [a["name"] for a in again.search(extension="wav")] == ["Riser.wav", "Whoosh Impact.wav"]
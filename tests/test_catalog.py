@@ -0,0 +1,69 @@
+"""
+Tests for the project catalog.
+"""
+
+from datetime import datetime
+
+from sbp_generator import generators
+from sbp_generator.catalog import ProjectCatalog
+from sbp_generator.models import Camera, CameraAssignment, CameraPurpose, ProjectConfig, ProjectType, WorkType
+from sbp_generator.sidecar import read_sidecar
+
+
+def test_generated_and_imported_projects_are_found(tmp_path, monkeypatch):
+    catalog = ProjectCatalog(tmp_path / "catalog.db")
+    monkeypatch.setattr(generators.project_generator, "catalog", catalog)
+    archive = tmp_path / "archive"
+
+    config = ProjectConfig(project_type=ProjectType.BOTH, work_type=WorkType.PERSONAL, project_name="Night Walk",
+                           project_date=datetime(2024, 3, 1), base_path=str(archive))
+    assert generators.project_generator.generate_project(config)["success"]
+    (archive / "VIDEO/Client Work/ABC Corp/2023-05-02-Launch Film").mkdir(parents=True)
+    (archive / "PHOTO/Client Work/XYZ/2024-06-01-Lookbook").mkdir(parents=True)
+
+    assert catalog.import_archive(archive) == {"projects": 4, "removed": 0}
+    assert catalog.count() == 4
+
+    walk = catalog.find(name="walk")
+    assert {p["type"] for p in walk} == {"photography", "videography"}
+    assert walk[0]["date"] == datetime(2024, 3, 1)  # Kept the generated date over the year folder's
+
+    launch, = catalog.find(client="abc corp", project_type="videography")
+    assert launch["name"] == "Launch Film" and launch["date"] == datetime(2023, 5, 2)
+    assert [p["name"] for p in catalog.find(since=datetime(2024, 1, 1), until=datetime(2024, 12, 31))] == \
+        ["Lookbook", "Night Walk", "Night Walk"]
+    assert catalog.find(name="50%") == []
+
+    (archive / "PHOTO/Client Work/XYZ/2024-06-01-Lookbook").rmdir()
+    assert catalog.import_archive(archive)["removed"] == 1
+    assert catalog.find(client="XYZ") == []
+    catalog.close()
+
+
+def test_reindex_rebuilds_from_sidecars(tmp_path, monkeypatch):
+    monkeypatch.setattr(generators.project_generator, "catalog", ProjectCatalog(tmp_path / "generated.db"))
+    monkeypatch.setattr(generators.client_manager, "add_project_to_client", lambda *args: True)
+    archive = tmp_path / "archive"
+
+    config = ProjectConfig(project_type=ProjectType.VIDEOGRAPHY, work_type=WorkType.CLIENT, client_name="ABC Corp",
+                           project_name="Launch", project_date=datetime(2024, 3, 1), base_path=str(archive),
+                           use_camera_folders=True, camera_assignments=[
+                               CameraAssignment(camera=Camera(name="Lumix"), purpose=CameraPurpose.MAIN)])
+    result = generators.project_generator.generate_project(config, force=True)
+    project_path, = result["project_paths"]
+    assert read_sidecar(project_path) == ProjectConfig(**{**config.dict(), "project_type": ProjectType.VIDEOGRAPHY})
+
+    (archive / "PHOTO/Client Work/XYZ/2024-06-01-Lookbook").mkdir(parents=True)
+    (archive / "PHOTO/Personal Work/2023/Broken/.sbp").mkdir(parents=True)
+    (archive / "PHOTO/Personal Work/2023/Broken/.sbp/project.json").write_text("{")
+
+    catalog = ProjectCatalog(tmp_path / "catalog.db")
+    assert catalog.import_archive(archive)["projects"] == 3
+    assert catalog.reindex(archive, workers=2) == {"projects": 1, "removed": 0, "unreadable": 1}
+    launch, = catalog.find(name="launch")
+    assert launch["cameras"] == ["main-Lumix"] and launch["date"] == datetime(2024, 3, 1)
+    assert catalog.count() == 3  # Projects without sidecars stay while their folders exist
+
+    (archive / "PHOTO/Client Work/XYZ/2024-06-01-Lookbook").rmdir()
+    assert catalog.reindex(archive)["removed"] == 1
+    catalog.close()
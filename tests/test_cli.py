@@ -34,4 +34,70 @@ def test_clients_list():
     """Test clients list command."""
     runner = CliRunner()
     result = runner.invoke(cli, ['clients', 'list'])
-    assert result.exit_code == 0 
\ No newline at end of file
+    assert result.exit_code == 0 
+
+def test_jsonl_output(tmp_path):
+    """Test JSON-lines output for config and create."""
+    import json
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--output', 'jsonl', 'config'])
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert records[0]["type"] == "config" and "base_directories" in records[0]
+
+    result = runner.invoke(cli, ['--output', 'jsonl', '--quiet', 'create', '--type', 'photo',
+                                 '--work-type', 'personal', '--project', 'Walk', '--base-path', str(tmp_path),
+                                 '--no-smart-path', '--list-folders'])
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert records[-1]["type"] == "result" and records[-1]["success"]
+    assert sum(r["type"] == "folder" for r in records) == records[-1]["folder_count"]
+
+
+def test_jsonl_output_for_reports(tmp_path):
+    """Report commands print records instead of tables in JSON-lines mode."""
+    import json
+    project = tmp_path / "VIDEO" / "Client Work" / "ABC" / "2024-01-01-Launch" / "Exports"
+    project.mkdir(parents=True)
+    (project / "final.mp4").write_bytes(b"x" * 10)
+    runner = CliRunner()
+
+    def records(*args):
+        result = runner.invoke(cli, ['--output', 'jsonl', '--quiet', *args])
+        assert result.exit_code == 0, result.output
+        return [json.loads(line) for line in result.output.splitlines()]
+
+    stats = records('clients', 'stats', '--path', str(tmp_path), '--refresh')
+    assert [(r["type"], r["client"]) for r in stats] == [("client_stats", "ABC")]
+    usage = records('usage', '--path', str(tmp_path), '--by', 'project', '--full')
+    assert usage[-1]["type"] == "usage" and usage[-1]["bytes"] == 10 and usage[-1]["project_type"]
+    assert records('cameras')[0]["type"] == "cameras"
+    assert records('template', 'show', 'photography_personal')[0]["type"] == "template"
+
+
+def test_batch_camera_errors_report_the_line(tmp_path):
+    from sbp_generator.cli import _iter_batch_configs
+    batch = tmp_path / "batch.csv"
+    batch.write_text("type,work_type,project,client,date,cameras\n"
+                     "video,client,Launch,ABC,2024-03-01,main:Lumix\n"
+                     "video,client,Teaser,ABC,2024-03-02,lumix\n")
+    configs = _iter_batch_configs(str(batch), str(tmp_path), False, False)
+    assert next(configs).project_name == "Launch"
+    with pytest.raises(ValueError, match=r"batch.csv, line 3: Invalid camera format"):
+        next(configs)
+
+
+def test_client_folder_check_follows_layout_and_volume_roots(tmp_path, monkeypatch):
+    from sbp_generator.cli import _client_folder_exists
+    from sbp_generator.config import config_manager
+    from sbp_generator.generators import project_generator
+    config = config_manager.config.copy(update={
+        "client_layout": ["{client_initial}", "{client}"],
+        "volume_roots": {"photography": str(tmp_path / "photo-volume"), "videography": str(tmp_path / "video")}})
+    monkeypatch.setattr(config_manager, "_config", config)
+    monkeypatch.setattr(project_generator, "config", config)
+    (tmp_path / "photo-volume/PHOTO/Client Work/A/Acme").mkdir(parents=True)
+
+    assert _client_folder_exists("Acme", "photo")
+    assert _client_folder_exists("Acme", "both")
+    assert not _client_folder_exists("Acme", "video")
+    assert not _client_folder_exists("Zed", "photo")
+
@@ -0,0 +1,110 @@
+"""
+Tests for the client database.
+"""
+
+import io
+import json
+import multiprocessing
+from datetime import datetime
+import pytest
+from sbp_generator.client_manager import ClientManager, read_client_records
+
+
+def _add_projects(clients_file, worker, count):
+    manager = ClientManager(clients_file)
+    for i in range(count):
+        manager.add_project_to_client("Shared Client", f"worker{worker}-project{i}")
+
+
+def test_concurrent_writers_keep_every_project(tmp_path):
+    clients_file = tmp_path / "clients.json"
+    ClientManager(clients_file).add_client("Shared Client")
+
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_add_projects, args=(clients_file, w, 10)) for w in range(8)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+
+    projects = ClientManager(clients_file).get_client("Shared Client").projects
+    assert len(projects) == 80
+
+
+def test_batch_writes_once(tmp_path, monkeypatch):
+    manager = ClientManager(tmp_path / "clients.json")
+    manager.add_client("ABC Corp")
+    writes = []
+    monkeypatch.setattr(manager, "_write_clients_file", writes.append)
+
+    with manager.batch():
+        for i in range(50):
+            manager.add_project_to_client("ABC Corp", f"project{i}")
+
+    assert len(writes) == 1
+    assert len(writes[0]["ABC Corp"].projects) == 50
+
+
+def test_stale_copy_does_not_drop_other_clients(tmp_path):
+    clients_file = tmp_path / "clients.json"
+    first, second = ClientManager(clients_file), ClientManager(clients_file)
+    first.list_clients()
+    second.add_client("Added Elsewhere")
+
+    first.add_client("Added Here")
+    assert sorted(json.loads(clients_file.read_text())) == ["Added Elsewhere", "Added Here"]
+
+
+def test_corrupted_file_is_kept(tmp_path):
+    clients_file = tmp_path / "clients.json"
+    clients_file.write_text("{not json")
+
+    manager = ClientManager(clients_file)
+    assert manager.list_clients() == []
+    assert len(list(tmp_path.glob("clients.json.corrupt-*"))) == 1
+
+    # Saving must not replace the damaged file with only this process's clients
+    with pytest.raises(ValueError):
+        manager.add_client("New Client")
+    assert clients_file.read_text() == "{not json"
+    assert len(list(tmp_path.glob("clients.json.corrupt-*"))) == 1
+
+
+def test_import_dedupes_merges_and_writes_once(tmp_path, monkeypatch):
+    manager = ClientManager(tmp_path / "clients.json")
+    manager.add_client("ABC Corp", notes="Retainer")
+    manager.add_project_to_client("ABC Corp", "2024-01-01-Launch")
+    writes = []
+    monkeypatch.setattr(manager, "_write_clients_file", writes.append)
+
+    csv_file = io.StringIO("Name,Notes,Projects\n"
+                           " abc corp ,Net 30,2024-01-01-Launch;2024-02-01-Recut\n"
+                           "New Client,,\n"
+                           "NEW CLIENT,VIP,\n"
+                           "   ,orphan,\n")
+    result = manager.import_clients(read_client_records(csv_file, "csv"))
+
+    assert (result["added"], result["merged"]) == (1, 1)
+    assert [line for line, _ in result["invalid"]] == [5]
+    assert len(writes) == 1 and sorted(writes[0]) == ["ABC Corp", "New Client"]
+    abc = writes[0]["ABC Corp"]
+    assert abc.projects == ["2024-01-01-Launch", "2024-02-01-Recut"] and abc.notes == "Retainer\nNet 30"
+    assert writes[0]["New Client"].notes == "VIP"
+
+    exported = io.StringIO()
+    assert manager.export_clients(exported, "jsonl") == 2
+    records = list(read_client_records(io.StringIO(exported.getvalue()), "jsonl"))
+    assert [record["name"] for _, record in records] == ["ABC Corp", "New Client"]
+
+
+def test_import_merges_dates_with_and_without_time_zone(tmp_path):
+    manager = ClientManager(tmp_path / "clients.json")
+    csv_file = io.StringIO("name,created_date\n"
+                           "ACME,2024-01-01T00:00:00Z\n"
+                           "acme ,2023-01-01\n"
+                           "Other,not a date\n")
+    result = manager.import_clients(read_client_records(csv_file, "csv"))
+
+    assert result["added"] == 1 and [line for line, _ in result["invalid"]] == [4]
+    assert manager.get_client("ACME").created_date == datetime(2023, 1, 1)
+    assert ClientManager(tmp_path / "clients.json").get_client("ACME").created_date.tzinfo is None
@@ -0,0 +1,92 @@
+"""
+Tests for starter file cloning.
+"""
+
+import errno
+import os
+from datetime import datetime
+
+from sbp_generator import cloning
+from sbp_generator.cloning import COPY, HARDLINK, REFLINK, FileCloner
+from sbp_generator.generators import FILE_EVENT, GenerationSummary, ProjectGenerator
+from sbp_generator.models import ProjectConfig, ProjectType, WorkType
+
+
+def test_falls_back_to_copy_and_remembers_unsupported_volumes(tmp_path, monkeypatch):
+    source = tmp_path / "look.cube"
+    source.write_bytes(b"LUT" * 1000)
+    cloner = FileCloner()
+
+    method, saved = cloner.clone(source, tmp_path / "linked.cube", immutable=True)
+    assert method in (REFLINK, HARDLINK) and saved == 3000
+    assert (tmp_path / "linked.cube").read_bytes() == source.read_bytes()
+
+    attempts = []
+
+    def unsupported(*args):
+        attempts.append(args)
+        raise OSError(errno.EXDEV, "Cross-device link")
+
+    monkeypatch.setattr(cloner, "_reflink", unsupported)
+    monkeypatch.setattr(cloning.os, "link", unsupported)
+    assert cloner.clone(source, tmp_path / "copy1.cube", immutable=True) == (COPY, 0)
+    tried = len(attempts)
+    assert cloner.clone(source, tmp_path / "copy2.cube", immutable=True) == (COPY, 0)
+    assert len(attempts) == tried  # Not retried once a volume pair is known not to support them
+    assert (tmp_path / "copy2.cube").read_bytes() == source.read_bytes()
+
+
+def test_template_files_are_cloned_from_assets(tmp_path):
+    luts = tmp_path / "Assets & Resources/Presets & Templates/LUTs for Video"
+    (luts / "Film").mkdir(parents=True)
+    (luts / "Film/warm.cube").write_bytes(b"warm")
+    (luts / "cool.cube").write_bytes(b"cool")
+    (tmp_path / "Assets & Resources/Presets & Templates/Brief.md").write_text("# Brief\n")
+
+    generator = ProjectGenerator()
+    config = ProjectConfig(project_type=ProjectType.VIDEOGRAPHY, work_type=WorkType.PERSONAL, project_name="Reel",
+                           project_date=datetime(2024, 3, 1), base_path=str(tmp_path))
+    template = {"folders": ["Grade"], "files": {"Grade/LUTs": "Presets & Templates/LUTs for Video",
+                                                "Brief.md": "Presets & Templates/Brief.md"}}
+    project_path = tmp_path / "Reel"
+
+    summary = GenerationSummary()
+    for event in generator.iter_create_folders(project_path, template, config):
+        summary.add(event)
+    assert summary.folders == [project_path / "Grade"]
+    assert summary.file_count == 3 and summary.bytes_saved in (0, 16)
+    assert (project_path / "Grade/LUTs/Film/warm.cube").read_bytes() == b"warm"
+    assert (project_path / "Brief.md").read_text() == "# Brief\n"
+
+    again = [event for event in generator.iter_create_folders(project_path, template, config)
+             if event.kind == FILE_EVENT]
+    assert len(again) == 3 and all(event.existed for event in again)
+
+
+def test_only_immutable_starter_files_are_hard_linked(tmp_path, monkeypatch):
+    assets = tmp_path / "Assets & Resources/Presets & Templates"
+    assets.mkdir(parents=True)
+    (assets / "Edit.prproj").write_bytes(b"blank edit")
+    (assets / "look.cube").write_bytes(b"LUT")
+
+    def unsupported(*args):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks not supported")
+
+    monkeypatch.setattr(cloning.file_cloner, "_reflink", unsupported)
+    generator = ProjectGenerator()
+    config = ProjectConfig(project_type=ProjectType.VIDEOGRAPHY, work_type=WorkType.PERSONAL, project_name="Reel",
+                           project_date=datetime(2024, 3, 1), base_path=str(tmp_path))
+    template = {"folders": [], "files": {
+        "Edit.prproj": "Presets & Templates/Edit.prproj",
+        "look.cube": {"source": "Presets & Templates/look.cube", "immutable": True}}}
+    project_path = tmp_path / "Reel"
+
+    methods = {event.path.name: event.method for event in generator.iter_create_folders(project_path, template, config)
+               if event.kind == FILE_EVENT}
+    assert methods == {"Edit.prproj": COPY, "look.cube": HARDLINK}
+
+    # Editing the project's copy leaves the asset alone
+    (project_path / "Edit.prproj").write_bytes(b"edited cut")
+    assert (assets / "Edit.prproj").read_bytes() == b"blank edit"
+    assert os.path.samefile(project_path / "look.cube", assets / "look.cube")
+
@@ -0,0 +1,21 @@
+"""
+Tests for cached shell completion.
+"""
+
+from sbp_generator.completion import CAMERAS, CLIENTS, PURPOSES, fast_complete, write_candidates
+
+
+def test_completes_from_cache_and_defers_the_rest(tmp_path):
+    cache_dir = str(tmp_path)
+    assert fast_complete(["create", "--client"], "ab", cache_dir) is None  # No cache yet
+
+    write_candidates(CLIENTS, ["ABC Corp", "abbey road", "XYZ", "ABC Corp"], cache_dir)
+    write_candidates(CAMERAS, ["Lumix", "DJI POCKET"], cache_dir)
+    write_candidates(PURPOSES, ["main", "BTS", "backup"], cache_dir)
+
+    assert fast_complete(["create", "--client"], "ab", cache_dir) == ["abbey road", "ABC Corp"]
+    assert fast_complete(["--output", "jsonl", "clients", "remove"], "x", cache_dir) == ["XYZ"]
+    assert fast_complete(["create", "--cameras"], "main:lumix,b", cache_dir) == \
+        ["main:lumix,backup:", "main:lumix,BTS:"]
+    assert fast_complete(["create", "--cameras"], "bts:d", cache_dir) == ["bts:DJI POCKET"]
+    assert fast_complete(["create"], "--cl", cache_dir) is None
@@ -0,0 +1,59 @@
+"""
+Tests for finding duplicate files across projects.
+"""
+
+import os
+
+from sbp_generator.dedupe import DuplicateFinder, EDGE_BLOCK
+
+
+def test_duplicates_grouped_by_project_and_hardlinked(tmp_path):
+    archive = tmp_path / "archive"
+    big = os.urandom(3 * EDGE_BLOCK)
+    # Same size, same first and last blocks, different middle
+    lookalike = big[:EDGE_BLOCK] + os.urandom(EDGE_BLOCK) + big[-EDGE_BLOCK:]
+    files = {"VIDEO/Client Work/ABC/2024-01-01-Launch/Exports/final.mp4": big,
+             "VIDEO/Client Work/ABC/2024-02-01-Recut/Edited/final.mp4": big,
+             "VIDEO/Client Work/XYZ/2024-03-01-Promo/Deliverables/stock.mp4": big,
+             "VIDEO/Client Work/XYZ/2024-03-01-Promo/Exports/other.mp4": lookalike,
+             "PHOTO/Client Work/ABC/2024-01-01-Launch/Exports/small.jpg": b"tiny"}
+    for name, data in files.items():
+        (archive / name).parent.mkdir(parents=True, exist_ok=True)
+        (archive / name).write_bytes(data)
+
+    finder = DuplicateFinder(archive, db_file=tmp_path / "dedupe.db", min_size=1, workers=2)
+    stats = finder.scan()
+    assert stats["files"] == 5 and stats["full_hashed"] == 4
+
+    groups = list(finder.iter_groups())
+    assert len(groups) == 1 and groups[0]["copies"] == 3
+    assert {loc["category"] for loc in groups[0]["locations"]} == {"Exports", "Edited", "Deliverables"}
+    assert sum(r["wasted"] for r in finder.summary_by_project()) == 2 * len(big)
+
+    assert finder.hardlink()["saved_bytes"] == 2 * len(big)
+    finder.close()
+
+    rescanned = DuplicateFinder(archive, db_file=tmp_path / "dedupe.db", min_size=1, workers=2)
+    # The links keep the hashes already known for their inode
+    assert rescanned.scan()["full_hashed"] == 0
+    assert list(rescanned.iter_groups()) == []
+    rescanned.close()
+
+
+def test_hardlink_skips_group_when_kept_file_changed(tmp_path):
+    archive = tmp_path / "archive"
+    data = os.urandom(1000)
+    paths = [archive / "VIDEO/Client Work/ABC/2024-01-01-Launch/Exports/a.mp4",
+             archive / "VIDEO/Client Work/ABC/2024-02-01-Recut/Exports/a.mp4"]
+    for mtime, path in enumerate(paths, start=1):
+        path.parent.mkdir(parents=True)
+        path.write_bytes(data)
+        os.utime(path, ns=(mtime * 10**9, mtime * 10**9))
+
+    finder = DuplicateFinder(archive, db_file=tmp_path / "dedupe.db", min_size=1, workers=2)
+    finder.scan()
+    # The oldest copy is the one kept; edit it after hashing
+    paths[0].write_bytes(os.urandom(1000))
+    assert finder.hardlink() == {"linked": 0, "skipped": 1, "saved_bytes": 0}
+    assert paths[1].read_bytes() == data
+    finder.close()
@@ -0,0 +1,55 @@
+"""
+Tests for streaming project skeletons into archives.
+"""
+
+import io
+import tarfile
+import zipfile
+from datetime import datetime
+from sbp_generator.emitters import ArchiveEmitter
+from sbp_generator.generators import project_generator
+from sbp_generator.models import ProjectConfig, ProjectType, WorkType
+
+
+def _config(tmp_path):
+    return ProjectConfig(project_type=ProjectType.BOTH, work_type=WorkType.CLIENT,
+                         project_name="Launch", client_name="ABC Corp",
+                         project_date=datetime(2024, 3, 1), base_path=str(tmp_path),
+                         include_proxies=True)
+
+
+def test_tar_matches_generated_tree(tmp_path):
+    buffer = io.BytesIO()
+    with ArchiveEmitter(buffer, "tar", root=tmp_path) as emitter:
+        emitter.add_project(_config(tmp_path))
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer) as tar:
+        names = {m.name for m in tar.getmembers()}
+    assert not list(tmp_path.iterdir())
+
+    for type_config, project_path, template in project_generator.plan_project(_config(tmp_path)):
+        for folder in project_generator.iter_folders(project_path, template, type_config):
+            assert folder.relative_to(tmp_path).as_posix() in names
+    assert "VIDEO/Client Work/ABC Corp/2024-03-01-Launch/Footage/Proxies" in names
+
+
+def test_zip_streams_to_unseekable_output(tmp_path):
+    class Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data.extend(b)
+            return len(b)
+
+    out = Unseekable()
+    with ArchiveEmitter(out, "zip", root=tmp_path) as emitter:
+        emitter.add_project(_config(tmp_path))
+
+    names = zipfile.ZipFile(io.BytesIO(bytes(out.data))).namelist()
+    assert "PHOTO/Client Work/ABC Corp/2024-03-01-Launch/RAW/" in names
+    assert len(names) == len(set(names)) == emitter.folder_count
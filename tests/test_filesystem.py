@@ -0,0 +1,74 @@
+"""
+Tests for the filesystem backends.
+"""
+
+import threading
+from datetime import datetime
+
+from sbp_generator import generators
+from sbp_generator.filesystem import MemoryFileSystem, ObjectStoreFileSystem
+from sbp_generator.generators import ProjectGenerator
+from sbp_generator.models import ProjectConfig, ProjectType, WorkType
+
+
+class FakeObjectStore:
+    """Just enough of an S3 client: put_object and delimited listings."""
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+        self.puts = 0
+        self.lists = 0
+        self.lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body):
+        with self.lock:
+            self.keys.add(Key)
+            self.puts += 1
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix, Delimiter):
+        self.lists += 1
+        children = {Prefix + key[len(Prefix):].split(Delimiter)[0] + Delimiter
+                    for key in self.keys if key.startswith(Prefix) and len(key) > len(Prefix)}
+        return [{"CommonPrefixes": [{"Prefix": child} for child in sorted(children)]}]
+
+
+def _config(work_type=WorkType.CLIENT):
+    return ProjectConfig(project_type=ProjectType.BOTH, work_type=work_type, client_name="ABC Corp",
+                         project_name="Launch", project_date=datetime(2024, 3, 1), base_path="/",
+                         include_proxies=True)
+
+
+def test_memory_filesystem_generates_and_discovers(tmp_path, monkeypatch):
+    monkeypatch.setattr(generators.client_manager, "add_project_to_client", lambda *args: True)
+    fs = MemoryFileSystem()
+    generator = ProjectGenerator(fs)
+
+    result = generator.generate_project(_config())
+    assert result["success"] and result["existing_count"] == 0
+    assert "/PHOTO/Client Work/ABC Corp/2024-03-01-Launch/RAW" in fs.folders()
+    assert generator.analyze_current_directory(generators.Path("/VIDEO"))["discovered_clients"] == ["ABC Corp"]
+
+    again = generator.generate_project(_config())
+    assert again["existing_count"] == again["folder_count"]
+
+
+def test_object_store_batches_markers_and_lists_sparingly(tmp_path, monkeypatch):
+    monkeypatch.setattr(generators.client_manager, "add_project_to_client", lambda *args: True)
+    store = FakeObjectStore({"studio/PHOTO/", "studio/PHOTO/Client Work/"})
+    fs = ObjectStoreFileSystem("bucket", "studio", client=store, workers=4, batch_size=8)
+    generator = ProjectGenerator(fs)
+
+    result = generator.generate_project(_config())
+    assert result["success"]
+    assert "studio/PHOTO/Client Work/ABC Corp/2024-03-01-Launch/RAW/" in store.keys
+    assert "studio/VIDEO/" in store.keys and "studio/PHOTO/" in store.keys
+    # One marker per new folder, and far fewer listings than folders
+    assert store.puts == len(store.keys) - 2
+    assert store.lists * 4 < result["folder_count"]
+    # Object store keys aren't local paths, so they stay out of the catalog
+    assert generator.catalog.count() == 0
+    assert fs.list_dirs(generators.Path("/PHOTO/Client Work")) == ["ABC Corp"]
+    assert "studio/PHOTO/Client Work/ABC Corp/2024-03-01-Launch/.sbp/project.json" in store.keys
@@ -0,0 +1,32 @@
+"""
+Tests for synthetic archive fixtures.
+"""
+
+import os
+
+from sbp_generator.fixtures import build_fixture
+
+
+def _tree(root):
+    return sorted(os.path.relpath(os.path.join(path, name), root)
+                  for path, dirs, files in os.walk(root) for name in dirs + files)
+
+
+def test_same_seed_builds_same_archive(tmp_path):
+    first = build_fixture(tmp_path / "a", clients=5, projects=40, seed=7, media_files=2, media_size=4096,
+                          sidecars=True, workers=1)
+    second = build_fixture(tmp_path / "b", clients=5, projects=40, seed=7, media_files=2, media_size=4096,
+                           sidecars=True, workers=1)
+    assert first["projects"] == 40 and first["folders"] == second["folders"] > 40
+    assert _tree(tmp_path / "a") == _tree(tmp_path / "b")
+
+    clients = set()
+    for type_folder in ("PHOTO", "VIDEO"):
+        client_work = tmp_path / "a" / type_folder / "Client Work"
+        clients.update(os.listdir(client_work) if client_work.exists() else [])
+    assert len(clients) == 5
+
+    media = [path for path in _tree(tmp_path / "a") if path.endswith((".CR3", ".MP4"))]
+    assert len(media) == first["files"] > 0
+    assert os.path.getsize(tmp_path / "a" / media[0]) == 4096
+    assert any(path.endswith(os.path.join(".sbp", "project.json")) for path in _tree(tmp_path / "a"))
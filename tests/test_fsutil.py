@@ -0,0 +1,39 @@
+"""
+Tests for the shared filesystem helpers.
+"""
+
+import os
+import pytest
+from sbp_generator.fsutil import atomic_write, raise_errors, walk_tree
+
+
+def test_walk_tree_yields_relative_paths_without_following_links(tmp_path):
+    (tmp_path / "Footage/RAW/drone-Drone").mkdir(parents=True)
+    (tmp_path / "Footage/RAW/drone-Drone/clip.mov").write_bytes(b"x")
+    (tmp_path / ".sbp").mkdir()
+    (tmp_path / "Linked").symlink_to(tmp_path / "Footage")
+
+    assert sorted(relative for _, relative in walk_tree(tmp_path)) == [
+        ".sbp", "Footage", "Footage/RAW", "Footage/RAW/drone-Drone", "Footage/RAW/drone-Drone/clip.mov", "Linked"]
+    assert sorted(relative for _, relative in walk_tree(tmp_path, max_depth=2, include_hidden=False)) == [
+        "Footage", "Footage/RAW", "Linked"]
+    skip_raw = walk_tree(tmp_path, include_hidden=False, descend=lambda entry, relative: entry.name != "RAW")
+    assert sorted(relative for _, relative in skip_raw) == ["Footage", "Footage/RAW", "Linked"]
+
+    assert list(walk_tree(tmp_path / "missing")) == []
+    with pytest.raises(FileNotFoundError):
+        list(walk_tree(tmp_path / "missing", on_error=raise_errors))
+
+
+def test_atomic_write_replaces_whole_files_only(tmp_path):
+    path = tmp_path / "state.json"
+    with atomic_write(path) as f:
+        f.write("first")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+
+    assert path.read_text() == "first"
+    assert os.listdir(tmp_path) == ["state.json"]
@@ -0,0 +1,67 @@
+"""
+Tests for streaming project generation.
+"""
+
+from datetime import datetime
+from sbp_generator.generators import project_generator, FOLDER_EVENT, PROJECT_EVENT
+from sbp_generator.models import ProjectConfig, ProjectType, WorkType
+
+
+def _config(tmp_path):
+    return ProjectConfig(project_type=ProjectType.BOTH, work_type=WorkType.PERSONAL,
+                         project_name="Walk", project_date=datetime(2024, 3, 1),
+                         base_path=str(tmp_path), include_proxies=True)
+
+
+def test_events_stream_and_counts_without_folder_list(tmp_path):
+    events = list(project_generator.iter_generate_project(_config(tmp_path)))
+    assert [e.kind for e in events].count(PROJECT_EVENT) == 2
+    folders = [e.path for e in events if e.kind == FOLDER_EVENT]
+    assert all(path.is_dir() for path in folders)
+
+    seen = []
+    result = project_generator.generate_project(_config(tmp_path), on_event=seen.append, keep_folders=False)
+    assert result["success"] and result["created_folders"] == []
+    assert result["folder_count"] == result["existing_count"] == len(folders)
+    assert len(result["project_paths"]) == 2 and len(seen) == len(events)
+
+
+def test_both_projects_use_volume_roots_concurrently(tmp_path, monkeypatch):
+    from sbp_generator.config import config_manager
+    from sbp_generator.generators import PROJECT_DONE_EVENT
+    roots = {"photography": str(tmp_path / "photo-ssd"), "videography": str(tmp_path / "video-raid")}
+    monkeypatch.setattr(config_manager, "_config", config_manager.config.copy(update={"volume_roots": roots}))
+    
+    config = _config(tmp_path).copy(update={"base_path": None})
+    result = project_generator.generate_project(config)
+    assert result["success"]
+    photo, video = sorted(result["project_paths"], key=str)
+    assert photo.is_relative_to(tmp_path / "photo-ssd" / "PHOTO")
+    assert video.is_relative_to(tmp_path / "video-raid" / "VIDEO")
+    assert set(result["timings"]) == {str(photo), str(video)}
+    
+    events = list(project_generator.iter_generate_project(_config(tmp_path)))
+    assert [e.kind for e in events].count(PROJECT_DONE_EVENT) == 2
+    assert len([e for e in events if e.kind == FOLDER_EVENT]) == result["folder_count"]
+
+
+def test_ledger_skips_repeated_plans_unless_forced(tmp_path, monkeypatch):
+    import shutil
+
+    first = project_generator.generate_project(_config(tmp_path))
+    assert not first["skipped"] and first["existing_count"] == 0
+
+    seen = []
+    again = project_generator.generate_project(_config(tmp_path), on_event=seen.append)
+    assert again["skipped"] and seen == [] and again["folder_count"] == first["folder_count"]
+    assert again["project_paths"] == first["project_paths"]
+
+    forced = project_generator.generate_project(_config(tmp_path), force=True)
+    assert not forced["skipped"] and forced["existing_count"] == forced["folder_count"]
+
+    shutil.rmtree(first["project_paths"][0])
+    rebuilt = project_generator.generate_project(_config(tmp_path))
+    assert not rebuilt["skipped"] and first["project_paths"][0].is_dir()
+
+    changed = _config(tmp_path).copy(update={"include_proxies": False})
+    assert not project_generator.generate_project(changed)["skipped"]
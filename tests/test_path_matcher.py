@@ -0,0 +1,48 @@
+"""
+Tests for matching paths against the archive layout.
+"""
+
+from datetime import datetime
+from sbp_generator.generators import ProjectGenerator
+from sbp_generator.models import AppConfig, ProjectConfig, ProjectType, WorkType
+from sbp_generator.path_matcher import LayoutMatcher
+
+
+def _client_config():
+    return ProjectConfig(project_type=ProjectType.PHOTOGRAPHY, work_type=WorkType.CLIENT,
+                         client_name="Acme", project_name="Launch", project_date=datetime(2024, 3, 1))
+
+
+def test_smart_path_inside_client_work(tmp_path):
+    (tmp_path / "PHOTO/Client Work/Zed").mkdir(parents=True)
+    (tmp_path / "VIDEO/Client Work/Acme").mkdir(parents=True)
+    generator = ProjectGenerator()
+
+    analysis = generator.analyze_current_directory(tmp_path / "PHOTO/Client Work")
+    analysis["use_smart_detection"] = True
+    assert analysis["detected_work_type"] == "client" and analysis["discovered_clients"] == ["Zed"]
+    assert generator.get_project_base_path(_client_config(), analysis) == tmp_path / "PHOTO/Client Work/Acme"
+
+    analysis = generator.analyze_current_directory(tmp_path / "PHOTO")
+    assert sorted(analysis["discovered_clients"]) == ["Acme", "Zed"]
+
+    analysis = generator.analyze_current_directory(tmp_path / "Photography/Personal Work/2023/Walk/RAW")
+    assert analysis["detected_year"] == 2023
+    assert analysis["suggested_base"] == tmp_path / "Photography/Personal Work/2023"
+
+
+def test_sharded_layout_and_archive_roots(tmp_path):
+    config = AppConfig(client_layout=["{client_initial}", "{client}"], archive_roots=[str(tmp_path / "archive")])
+    matcher = LayoutMatcher(config)
+    assert matcher.match(tmp_path / "elsewhere/PHOTO/Client Work") is None
+
+    match = matcher.match(tmp_path / "archive/VIDEO/Client Work/A/Acme/2024-03-01-Launch")
+    assert match["detected_client"] == "Acme"
+    assert match["skip_folders"] == ["videography", "client_work", "client_shard", "client_folder"]
+
+    generator = ProjectGenerator()
+    generator.config = config
+    analysis = generator.analyze_current_directory(tmp_path / "archive/PHOTO/Client Work")
+    analysis["use_smart_detection"] = True
+    assert generator.get_project_base_path(_client_config(), analysis) == \
+        tmp_path / "archive/PHOTO/Client Work/A/Acme"
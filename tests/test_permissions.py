@@ -0,0 +1,50 @@
+"""
+Tests for folder permissions.
+"""
+
+import os
+import stat
+import struct
+from datetime import datetime
+
+from sbp_generator import generators
+from sbp_generator.generators import ProjectGenerator
+from sbp_generator.models import ProjectConfig, ProjectType, WorkType
+from sbp_generator.permissions import (ACL_GROUP, ACL_GROUP_OBJ, ACL_MASK, ACL_OTHER, ACL_UNDEFINED_ID, ACL_USER_OBJ,
+                                       PermissionTemplate, encode_acl, repair_permissions)
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_encode_acl_adds_mask_and_sorts_entries():
+    encoded = encode_acl("d:o::---,u::rwx,g::r-x,g:0:rwx")
+    entries = [struct.unpack_from("<HHI", encoded, offset) for offset in range(4, len(encoded), 8)]
+    assert struct.unpack_from("<I", encoded)[0] == 2
+    assert entries == [(ACL_USER_OBJ, 7, ACL_UNDEFINED_ID), (ACL_GROUP_OBJ, 5, ACL_UNDEFINED_ID), (ACL_GROUP, 7, 0),
+                       (ACL_MASK, 7, ACL_UNDEFINED_ID), (ACL_OTHER, 0, ACL_UNDEFINED_ID)]
+
+
+def test_rules_apply_at_creation_and_repair_only_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(generators.client_manager, "add_project_to_client", lambda *args: True)
+    generator = ProjectGenerator()
+    generator.config = generator.config.copy(update={"folder_permissions": [
+        {"folder": "*", "mode": "0750", "group": str(os.getgid())},
+        {"folder": "Contracts & Briefs", "mode": "0550"},
+    ]})
+
+    config = ProjectConfig(project_type=ProjectType.PHOTOGRAPHY, work_type=WorkType.CLIENT, client_name="ABC Corp",
+                           project_name="Launch", project_date=datetime(2024, 3, 1), base_path=str(tmp_path))
+    result = generator.generate_project(config)
+    assert result["success"]
+    project_path, = result["project_paths"]
+    assert _mode(project_path / "Contracts & Briefs") == 0o550
+    assert _mode(project_path / "RAW") == 0o750
+
+    os.chmod(project_path / "RAW", 0o777)
+    template = PermissionTemplate.from_config(generator.config)
+    first = repair_permissions(template, [project_path], workers=2)
+    assert first["changed"] == 1 and first["folders"] == result["folder_count"] and first["errors"] == []
+    assert _mode(project_path / "RAW") == 0o750
+    assert repair_permissions(template, [project_path])["changed"] == 0
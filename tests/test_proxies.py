@@ -0,0 +1,33 @@
+"""
+Tests for pruning proxy media.
+"""
+
+from datetime import datetime, timedelta
+
+from sbp_generator.proxies import ProxyPruner
+
+
+def test_prune_plan_then_commit(tmp_path):
+    archive = tmp_path / "archive"
+    delivered = archive / "VIDEO/Client Work/ABC/2024-01-01-Launch"
+    pending = archive / "VIDEO/Client Work/ABC/2024-02-01-Teaser"
+    recent = archive / "VIDEO/Client Work/XYZ/2026-10-01-Promo"
+    for project in (delivered, pending, recent):
+        (project / "Footage/Proxies/Main-A7S").mkdir(parents=True)
+        (project / "Footage/Proxies/Main-A7S/clip.mov").write_bytes(b"p" * 100)
+        (project / "Deliverables").mkdir()
+    (delivered / "Deliverables/final.mp4").write_bytes(b"f")
+    (recent / "Deliverables/final.mp4").write_bytes(b"f")
+
+    pruner = ProxyPruner(archive, plan_file=tmp_path / "plan.json")
+    plan = pruner.plan(older_than=timedelta(days=180), delivered=True, now=datetime(2026, 10, 19))
+    assert [entry["project"] for entry in plan] == ["2024-01-01-Launch"]
+    assert plan[0]["bytes"] == 100
+
+    result = pruner.commit()
+    assert result["reclaimed_bytes"] == 100 and not result["skipped"]
+    # The per-camera folders stay, only the files go
+    assert (delivered / "Footage/Proxies/Main-A7S").is_dir()
+    assert not any((delivered / "Footage/Proxies/Main-A7S").iterdir())
+    assert (pending / "Footage/Proxies/Main-A7S/clip.mov").exists()
+    assert (recent / "Footage/Proxies/Main-A7S/clip.mov").exists()
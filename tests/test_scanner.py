@@ -0,0 +1,66 @@
+"""
+Tests for scanning client folders on disk.
+"""
+
+import os
+from sbp_generator.config import config_manager
+from sbp_generator.scanner import ClientStatsScanner, iter_project_folders, sort_client_stats
+
+
+def test_client_stats_and_cache(tmp_path):
+    for folder in ["PHOTO/Client Work/ABC/2024-01-01-Launch",
+                   "VIDEO/Client Work/ABC/2024-01-01-Launch",
+                   "VIDEO/Client Work/ABC/2025-03-01-Teaser",
+                   "VIDEO/Client Work/XYZ/Misc"]:
+        (tmp_path / "archive" / folder).mkdir(parents=True)
+
+    scanner = ClientStatsScanner(tmp_path / "archive", cache_file=tmp_path / "cache.json")
+    stats = {r["client"]: r for r in scanner.scan()}
+    assert stats["ABC"]["project_count"] == 2
+    assert (stats["ABC"]["photo_projects"], stats["ABC"]["video_projects"]) == (1, 2)
+    assert stats["ABC"]["first_date"].year == 2024 and stats["ABC"]["last_date"].year == 2025
+    assert stats["XYZ"]["first_date"] is None
+
+    cached = ClientStatsScanner(tmp_path / "archive", cache_file=tmp_path / "cache.json")
+    (tmp_path / "archive/VIDEO/Client Work/XYZ/2026-01-01-New").mkdir()
+    stats = {r["client"]: r for r in cached.scan()}
+    assert stats["XYZ"]["project_count"] == 2
+    assert [r["client"] for r in sort_client_stats(list(stats.values()), "last")] == ["ABC", "XYZ"]
+
+
+def test_last_modified_project_follows_changes_inside_projects(tmp_path):
+    client = tmp_path / "archive" / "PHOTO" / "Client Work" / "ABC"
+    for name, mtime in [("2024-01-01-Launch", 1_000_000), ("2024-02-01-Event", 2_000_000)]:
+        (client / name).mkdir(parents=True)
+        os.utime(client / name, (mtime, mtime))
+
+    scanner = ClientStatsScanner(tmp_path / "archive", cache_file=tmp_path / "cache.json")
+    [record] = scanner.scan()
+    assert record["last_modified_project"] == "2024-02-01-Event"
+
+    client_mtime = client.stat().st_mtime_ns
+    (client / "2024-01-01-Launch" / "Edited").mkdir()
+    os.utime(client, ns=(client_mtime, client_mtime))
+    [record] = ClientStatsScanner(tmp_path / "archive", cache_file=tmp_path / "cache.json").scan()
+    assert record["last_modified_project"] == "2024-01-01-Launch"
+
+
+def test_projects_are_found_through_the_configured_layouts(tmp_path, monkeypatch):
+    config = config_manager.config.copy(update={"client_layout": ["{client_initial}", "{client}", "Jobs"],
+                                                "personal_layout": ["Archive", "{year}"]})
+    monkeypatch.setattr(config_manager, "_config", config)
+    archive = tmp_path / "archive"
+    for folder in ["PHOTO/Client Work/A/Acme/Jobs/2024-01-01-Launch",
+                   "PHOTO/Client Work/A/Acme/Notes",
+                   "VIDEO/Client Work/Z/Zed/Jobs/2025-02-01-Teaser",
+                   "VIDEO/Personal Work/Archive/2023/Walk",
+                   "VIDEO/Personal Work/Archive/Drafts/Sketch"]:
+        (archive / folder).mkdir(parents=True)
+
+    projects = {(client, year, path.name) for _, client, year, path in iter_project_folders(archive)}
+    assert projects == {("Acme", None, "2024-01-01-Launch"), ("Zed", None, "2025-02-01-Teaser"),
+                        (None, "2023", "Walk")}
+
+    stats = {r["client"]: r for r in ClientStatsScanner(archive, cache_file=tmp_path / "cache.json").scan()}
+    assert (stats["Acme"]["photo_projects"], stats["Zed"]["video_projects"]) == (1, 1)
+
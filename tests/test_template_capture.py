@@ -0,0 +1,49 @@
+"""
+Tests for capturing templates from existing projects.
+"""
+
+import json
+from datetime import datetime
+from sbp_generator.generators import project_generator
+from sbp_generator.models import (Camera, CameraAssignment, CameraPurpose, ProjectConfig,
+                                  ProjectType, WorkType)
+from sbp_generator.template_capture import capture_template, save_template
+
+
+def test_captured_template_recreates_project(tmp_path):
+    cameras = [CameraAssignment(camera=Camera(name="Lumix"), purpose=CameraPurpose.MAIN),
+               CameraAssignment(camera=Camera(name="DJI POCKET"), purpose=CameraPurpose.BTS)]
+    config = ProjectConfig(project_type=ProjectType.VIDEOGRAPHY, work_type=WorkType.CLIENT,
+                           project_name="Launch", client_name="ABC Corp",
+                           project_date=datetime(2024, 3, 1), include_proxies=True,
+                           camera_assignments=cameras, use_camera_folders=True)
+    template = project_generator.load_template("videography_client")
+    original = project_generator.create_folders(tmp_path / "original", template, config)
+    (tmp_path / "original" / "Footage" / "RAW" / "main-Lumix" / "A001").mkdir()
+    (tmp_path / "original" / "Edited" / "cut.prproj").write_text("")
+    (tmp_path / "original" / ".DS_Store").mkdir()
+
+    captured = capture_template(tmp_path / "original")
+    assert captured["camera_folders"] == ["Footage/Proxies", "Footage/RAW"]
+
+    recreated = project_generator.create_folders(tmp_path / "copy", captured, config)
+    assert ({p.relative_to(tmp_path / "original") for p in original}
+            == {p.relative_to(tmp_path / "copy") for p in recreated})
+
+
+def test_camera_folders_at_the_project_root_are_captured(tmp_path):
+    cameras = [CameraAssignment(camera=Camera(name="Lumix"), purpose=CameraPurpose.MAIN)]
+    config = ProjectConfig(project_type=ProjectType.PHOTOGRAPHY, work_type=WorkType.PERSONAL,
+                           project_name="Walk", project_date=datetime(2024, 3, 1),
+                           camera_assignments=cameras, use_camera_folders=True)
+    for folder in ("main-Lumix/100CANON", "Edited"):
+        (tmp_path / "original" / folder).mkdir(parents=True)
+
+    captured = capture_template(tmp_path / "original")
+    assert captured == {"folders": ["Edited"], "camera_folders": ["."]}
+    recreated = project_generator.create_folders(tmp_path / "copy", captured, config)
+    assert {p.relative_to(tmp_path / "copy").as_posix() for p in recreated} == {"Edited", "main-Lumix"}
+
+    path = save_template(captured, "walk", templates_dir=tmp_path / "templates")
+    assert json.loads(path.read_text()) == captured
+    assert [p.name for p in (tmp_path / "templates").iterdir()] == ["walk.json"]
@@ -0,0 +1,115 @@
+"""
+Tests for template inheritance.
+"""
+
+import json
+from pathlib import Path
+import pytest
+from sbp_generator import template_resolver
+from sbp_generator.template_resolver import TemplateResolver
+
+
+def _write(directory, name, data):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{name}.json").write_text(json.dumps(data))
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    user, bundled = tmp_path / "user", tmp_path / "bundled"
+    _write(bundled, "_paperwork", {"folders": ["Contracts & Briefs"]})
+    _write(bundled, "video", {"folders": ["Footage", "Edited", "Audio"],
+                              "subfolders": {"Footage": ["RAW"]}})
+    return user, bundled
+
+
+def _resolver(tmp_path, dirs):
+    return TemplateResolver(list(dirs), cache_dir=tmp_path / "cache")
+
+
+def test_extends_include_and_remove(tmp_path, dirs):
+    user, _ = dirs
+    _write(user, "studio", {"extends": "video", "include": ["_paperwork"],
+                            "folders": ["Grade"], "remove": ["Footage"]})
+
+    resolved = _resolver(tmp_path, dirs).resolve("studio")
+    assert resolved == {"folders": ["Edited", "Audio", "Contracts & Briefs", "Grade"], "subfolders": {}}
+
+
+def test_user_template_can_extend_the_bundled_one_of_the_same_name(tmp_path, dirs):
+    user, _ = dirs
+    _write(user, "video", {"extends": "video", "subfolders": {"Footage": ["RAW", "Stills"]}})
+
+    resolved = _resolver(tmp_path, dirs).resolve("video")
+    assert resolved["subfolders"] == {"Footage": ["RAW", "Stills"]}
+    assert resolved["folders"] == ["Footage", "Edited", "Audio"]
+
+
+def test_cycles_and_missing_parents_are_errors(tmp_path, dirs):
+    user, _ = dirs
+    _write(user, "a", {"extends": "b"})
+    _write(user, "b", {"extends": "a"})
+    _write(user, "typo", {"extends": "vidoe"})
+
+    resolver = _resolver(tmp_path, dirs)
+    with pytest.raises(ValueError, match="cycle"):
+        resolver.resolve("a")
+    with pytest.raises(ValueError, match="not found"):
+        resolver.resolve("typo")
+
+
+def test_compiled_templates_are_cached_until_a_file_in_the_chain_changes(tmp_path, dirs, monkeypatch):
+    user, _ = dirs
+    _write(user, "studio", {"extends": "video"})
+    _resolver(tmp_path, dirs).resolve("studio")
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    # A fresh resolver uses the disk cache without parsing any template
+    fresh = _resolver(tmp_path, dirs)
+    monkeypatch.setattr(fresh, "_load_raw", lambda *args, **kwargs: pytest.fail("parsed"))
+    assert fresh.resolve("studio")["folders"] == ["Footage", "Edited", "Audio"]
+    monkeypatch.undo()
+
+    _write(user, "studio", {"extends": "video", "folders": ["Grade"]})
+    assert fresh.resolve("studio")["folders"][-1] == "Grade"
+
+    # A new user template shadowing the bundled parent counts as a change
+    _write(user, "video", {"folders": ["Rushes"]})
+    assert _resolver(tmp_path, dirs).resolve("studio")["folders"] == ["Rushes", "Grade"]
+
+
+def test_entries_can_be_placed_next_to_inherited_ones(tmp_path, dirs):
+    user, _ = dirs
+    _write(user, "studio", {"extends": "video", "include": ["_paperwork"],
+                            "folders": [{"name": "Grade", "after": "Edited"},
+                                        {"name": "Contracts & Briefs", "before": "Footage"}, "Delivery"]})
+
+    resolved = _resolver(tmp_path, dirs).resolve("studio")
+    assert resolved["folders"] == ["Contracts & Briefs", "Footage", "Edited", "Grade", "Audio", "Delivery"]
+
+    _write(user, "broken", {"folders": [{"name": "Grade", "after": "Edited", "before": "Audio"}]})
+    with pytest.raises(ValueError, match="placements"):
+        _resolver(tmp_path, dirs).resolve("broken")
+
+
+# The flat bundled templates as they were before they were rebuilt on _base and _client_paperwork
+BASELINE = {
+    "photography_client": {"folders": ["RAW", "Edited", "Deliverables", "Contracts & Briefs",
+                                       "Exports for Social-Print"],
+                           "optional_folders": ["Capture One"]},
+    "photography_personal": {"folders": ["RAW", "Edited", "Exports for Social-Print"]},
+    "videography_client": {"folders": ["Footage", "Edited", "Deliverables", "Contracts & Briefs", "Exports",
+                                       "Thumbnail & Graphics", "Audio"],
+                           "subfolders": {"Footage": ["RAW"]},
+                           "optional_folders": ["Footage/Proxies"]},
+    "videography_personal": {"folders": ["Footage", "Edited", "Exports", "Audio"],
+                             "subfolders": {"Footage": ["RAW"]},
+                             "optional_folders": ["Footage/Proxies"]},
+}
+
+
+@pytest.mark.parametrize("name", sorted(BASELINE))
+def test_bundled_templates_resolve_as_before(tmp_path, name):
+    bundled = Path(template_resolver.__file__).parent / "templates"
+    resolver = TemplateResolver([bundled], cache_dir=tmp_path / "cache")
+    assert resolver.resolve(name) == BASELINE[name]
@@ -0,0 +1,52 @@
+"""
+Tests for incremental disk usage accounting.
+"""
+
+from sbp_generator.config import config_manager
+from sbp_generator.usage import UsageIndex
+
+
+def test_usage_by_client_and_folder_is_incremental(tmp_path):
+    archive = tmp_path / "archive"
+    files = {"VIDEO/Client Work/ABC/2024-01-01-Launch/Footage/RAW/a.mov": 1000,
+             "VIDEO/Client Work/ABC/2024-01-01-Launch/Exports/final.mp4": 300,
+             "PHOTO/Client Work/ABC/2024-01-01-Launch/RAW/a.cr3": 50,
+             "PHOTO/Personal Work/2024/2024-05-01-Walk/RAW/b.cr3": 20}
+    for name, size in files.items():
+        (archive / name).parent.mkdir(parents=True, exist_ok=True)
+        (archive / name).write_bytes(b"x" * size)
+
+    index = UsageIndex(archive, db_file=tmp_path / "usage.db")
+    index.refresh()
+    by_client = {row["name"]: row for row in index.report("client")}
+    assert by_client["ABC"]["bytes"] == 1350 and by_client["ABC"]["projects"] == 2
+    assert by_client["(personal)"]["bytes"] == 20
+    by_folder = {row["name"]: row["bytes"] for row in index.report("folder", client="ABC")}
+    assert by_folder == {"Footage/RAW": 1000, "Exports": 300, "RAW": 50}
+
+    (archive / "VIDEO/Client Work/ABC/2024-01-01-Launch/Exports/cut.mp4").write_bytes(b"x" * 5)
+    again = UsageIndex(archive, db_file=tmp_path / "usage.db")
+    walk = again.refresh()
+    assert walk["listed"] == 1
+    assert {row["name"]: row["bytes"] for row in again.report("client")}["ABC"] == 1355
+
+    cached = UsageIndex(archive, db_file=tmp_path / "usage.db")
+    cached.load()
+    assert cached.report("project")[0]["bytes"] == 1305
+
+
+def test_usage_follows_per_type_volume_roots(tmp_path, monkeypatch):
+    roots = {"photography": str(tmp_path / "photo-volume"), "videography": str(tmp_path / "video-volume")}
+    monkeypatch.setattr(config_manager, "_config", config_manager.config.copy(update={"volume_roots": roots}))
+    for name, size in {"photo-volume/PHOTO/Client Work/ABC/2024-01-01-Launch/RAW/a.cr3": 50,
+                       "video-volume/VIDEO/Client Work/ABC/2024-01-01-Launch/Exports/final.mp4": 300}.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(b"x" * size)
+
+    index = UsageIndex(db_file=tmp_path / "usage.db")
+    index.refresh()
+    assert [(row["name"], row["bytes"]) for row in index.report("client")] == [("ABC", 350)]
+
+    cached = UsageIndex(db_file=tmp_path / "usage.db")
+    cached.load()
+    assert [row["bytes"] for row in cached.report("project")] == [300, 50]
@@ -0,0 +1,56 @@
+"""
+Tests for symlink views.
+"""
+
+import os
+
+from sbp_generator.models import Camera, CameraAssignment, CameraPurpose, is_camera_folder
+from sbp_generator.views import ViewSync, _DirectoryHandle
+
+
+def test_sync_links_projects_and_only_revisits_changes(tmp_path):
+    project = tmp_path / "VIDEO/Client Work/ABC Corp/2024-03-01-Launch"
+    (project / "Footage/RAW/drone-Drone").mkdir(parents=True)
+    (project / "Footage/Proxies/drone-Drone").mkdir(parents=True)
+    (tmp_path / "PHOTO/Personal Work/2023/Night Walk").mkdir(parents=True)
+
+    views = ViewSync(tmp_path, workers=2)
+    assert views.sync() == {"projects": 2, "changed": 2, "added": 4, "removed": 0}
+    label = "ABC Corp - 2024-03-01-Launch (VIDEO)"
+    root = tmp_path / "_views"
+    assert os.path.samefile(root / "by-date/2024-03" / label, project)
+    assert os.path.samefile(root / "by-client/ABC Corp" / label, project)
+    assert os.path.samefile(root / "by-camera/drone-Drone" / label, project / "Footage/RAW/drone-Drone")
+    assert os.path.samefile(root / "by-date/2023/Night Walk (PHOTO)", tmp_path / "PHOTO/Personal Work/2023/Night Walk")
+    assert not os.path.isabs(os.readlink(root / "by-date/2024-03" / label))
+
+    assert views.sync()["changed"] == 0
+
+    (project / "Footage/RAW/drone-Drone").rename(project / "Footage/RAW/main-Lumix")
+    assert views.sync(full=True)["changed"] == 2
+    assert (root / "by-camera/main-Lumix" / label).is_symlink()
+    assert not (root / "by-camera/drone-Drone").exists()
+
+    (project.parent / "2024-03-01-Launch").rename(project.parent / "2024-04-02-Launch")
+    assert views.sync() == {"projects": 2, "changed": 1, "added": 3, "removed": 3}
+    assert not (root / "by-date/2024-03").exists()
+    assert (root / "by-date/2024-04/ABC Corp - 2024-04-02-Launch (VIDEO)").is_symlink()
+
+
+def test_directory_handle_only_replaces_links(tmp_path):
+    (tmp_path / "stale").symlink_to("old-target")
+    (tmp_path / "notes.txt").write_text("keep me")
+
+    with _DirectoryHandle(tmp_path) as handle:
+        assert handle.symlink("new-target", "stale")
+        assert not handle.symlink("new-target", "notes.txt")
+    assert os.readlink(tmp_path / "stale") == "new-target"
+    assert (tmp_path / "notes.txt").read_text() == "keep me"
+
+
+def test_camera_folders_follow_the_assignment_folder_names():
+    assignment = CameraAssignment(camera=Camera(name="DJI Mini_3"), purpose=CameraPurpose.BTS)
+    assert is_camera_folder(assignment.get_folder_name())
+    assert is_camera_folder("Main-Lumix")
+    assert not is_camera_folder("main-")
+    assert not is_camera_folder("Footage")
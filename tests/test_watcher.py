@@ -0,0 +1,130 @@
+"""
+Tests for the client folder watcher.
+"""
+
+import sys
+import time
+import pytest
+from sbp_generator.client_manager import ClientManager
+from sbp_generator.config import config_manager
+from sbp_generator.directory_index import DirectoryIndex
+from sbp_generator.watcher import ClientFolderWatcher
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    client_work = tmp_path / "archive" / "PHOTO" / "Client Work"
+    (client_work / "Existing Client").mkdir(parents=True)
+    watcher = ClientFolderWatcher(tmp_path / "archive",
+                                  index=DirectoryIndex(tmp_path / "index.json"),
+                                  clients=ClientManager(tmp_path / "clients.json"))
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+
+def _apply(watcher):
+    time.sleep(0.05)
+    return watcher.apply_events(watcher._inotify.read_events())
+
+
+def test_start_indexes_existing_clients(watcher):
+    client_work = watcher.base_path / "PHOTO" / "Client Work"
+    assert watcher.index.get_clients(client_work) == ["Existing Client"]
+    assert watcher.clients.get_client("Existing Client") is not None
+
+
+def test_create_rename_and_delete_events(watcher):
+    client_work = watcher.base_path / "PHOTO" / "Client Work"
+    (client_work / "New Client").mkdir()
+    (client_work / "Existing Client" / "2024-05-01-Shoot").mkdir()
+    summary = _apply(watcher)
+    assert summary["clients_added"] == 1
+    assert summary["projects_added"] == 1
+    assert watcher.clients.get_client("Existing Client").projects == ["2024-05-01-Shoot"]
+
+    (client_work / "New Client").rename(client_work / "Renamed Client")
+    _apply(watcher)
+    assert watcher.index.get_clients(client_work) == ["Existing Client", "Renamed Client"]
+    assert watcher.clients.get_client("Renamed Client") is not None
+    assert watcher.clients.get_client("New Client") is None
+
+    (client_work / "Renamed Client").rmdir()
+    _apply(watcher)
+    assert watcher.index.get_clients(client_work) == ["Existing Client"]
+
+
+def test_move_out_then_recreate_keeps_new_folder(watcher, tmp_path):
+    client_work = watcher.base_path / "PHOTO" / "Client Work"
+    (client_work / "Existing Client").rename(tmp_path / "Moved Away")
+    (client_work / "Existing Client").mkdir()
+    (client_work / "Existing Client" / "2024-06-01-Shoot").mkdir()
+    summary = _apply(watcher)
+    assert summary["clients_removed"] == 1
+    assert watcher.index.get_clients(client_work) == ["Existing Client"]
+    assert watcher.clients.get_client("Existing Client").projects == ["2024-06-01-Shoot"]
+
+
+def test_type_folder_created_after_start_is_watched(watcher):
+    client_work = watcher.base_path / "VIDEO" / "Client Work"
+    client_work.mkdir(parents=True)
+    _apply(watcher)
+    (client_work / "Video Client").mkdir()
+    summary = _apply(watcher)
+    assert summary["clients_added"] == 1
+    assert watcher.index.get_clients(client_work) == ["Video Client"]
+
+
+def test_watches_each_type_folder_on_its_own_volume(tmp_path, monkeypatch):
+    roots = {"photography": str(tmp_path / "photo-volume"), "videography": str(tmp_path / "video-volume")}
+    monkeypatch.setattr(config_manager, "_config", config_manager.config.copy(update={"volume_roots": roots}))
+    (tmp_path / "photo-volume/PHOTO/Client Work/Photo Client").mkdir(parents=True)
+    (tmp_path / "video-volume").mkdir()
+    watcher = ClientFolderWatcher(index=DirectoryIndex(tmp_path / "index.json"),
+                                  clients=ClientManager(tmp_path / "clients.json"))
+    watcher.start()
+    try:
+        assert watcher.index.get_clients(tmp_path / "photo-volume/PHOTO/Client Work") == ["Photo Client"]
+
+        client_work = tmp_path / "video-volume/VIDEO/Client Work"
+        client_work.mkdir(parents=True)
+        _apply(watcher)
+        (client_work / "Video Client").mkdir()
+        assert _apply(watcher)["clients_added"] == 1
+        assert watcher.index.get_clients(client_work) == ["Video Client"]
+    finally:
+        watcher.stop()
+
+
+def test_sharded_client_layout_is_followed(tmp_path, monkeypatch):
+    config = config_manager.config.copy(update={"client_layout": ["{client_initial}", "{client}"]})
+    monkeypatch.setattr(config_manager, "_config", config)
+    client_work = tmp_path / "archive/PHOTO/Client Work"
+    (client_work / "A/Acme/2024-01-01-Launch").mkdir(parents=True)
+    watcher = ClientFolderWatcher(tmp_path / "archive", index=DirectoryIndex(tmp_path / "index.json"),
+                                  clients=ClientManager(tmp_path / "clients.json"))
+    watcher.start()
+    try:
+        assert watcher.index.get_clients(client_work) == ["Acme"]
+        assert watcher.clients.get_client("Acme").projects == ["2024-01-01-Launch"]
+
+        (client_work / "Z/Zed").mkdir(parents=True)
+        (client_work / "A/Acme/2024-02-01-Event").mkdir()
+        summary = _apply(watcher)
+        assert (summary["clients_added"], summary["projects_added"]) == (1, 1)
+        assert watcher.index.get_clients(client_work) == ["Acme", "Zed"]
+
+        (client_work / "A/Acme").rename(client_work / "A/Acme Studio")
+        assert _apply(watcher)["clients_renamed"] == 1
+        assert watcher.index.get_clients(client_work) == ["Acme Studio", "Zed"]
+        assert watcher.clients.get_client("Acme Studio") is not None
+
+        (client_work / "Z/Zed").rmdir()
+        (client_work / "Z").rmdir()
+        assert _apply(watcher)["clients_removed"] == 1
+        assert watcher.index.get_clients(client_work) == ["Acme Studio"]
+    finally:
+        watcher.stop()
+